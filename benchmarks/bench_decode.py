@@ -0,0 +1,119 @@
+"""Compare model deserialization with the raw-JSON fast path used by the list tools.
+
+Builds a synthetic PodList of realistic pods and measures how long it takes to get
+the pod names out of it:
+
+- ``model``: what the kubernetes client does by default (``V1PodList`` object graph)
+- ``json``: raw bytes decoded with the standard library
+- ``fast``: raw bytes decoded with ``openshift_mcp_server.fastjson`` (orjson if installed)
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_decode.py [--sizes 100,1000,5000] [--repeat 3]
+"""
+import argparse
+import json
+import time
+from types import SimpleNamespace
+
+from kubernetes.client import ApiClient
+
+from openshift_mcp_server.fastjson import loads
+
+
+def make_pod(i: int) -> dict:
+    name = f"checkout-7d9f8c6b5-{i:05d}"
+    return {
+        "metadata": {
+            "name": name,
+            "namespace": "bench",
+            "uid": f"00000000-0000-0000-0000-{i:012d}",
+            "resourceVersion": str(100000 + i),
+            "creationTimestamp": "2024-01-01T00:00:00Z",
+            "labels": {"app": "checkout", "pod-template-hash": "7d9f8c6b5", "tier": "backend"},
+            "annotations": {"openshift.io/scc": "restricted-v2"},
+            "ownerReferences": [{
+                "apiVersion": "apps/v1", "kind": "ReplicaSet", "name": "checkout-7d9f8c6b5",
+                "uid": "11111111-1111-1111-1111-111111111111", "controller": True, "blockOwnerDeletion": True,
+            }],
+        },
+        "spec": {
+            "nodeName": f"worker-{i % 20}",
+            "serviceAccountName": "default",
+            "containers": [{
+                "name": "app",
+                "image": "quay.io/example/checkout:1.2.3",
+                "ports": [{"containerPort": 8080, "protocol": "TCP"}],
+                "env": [{"name": f"VAR_{j}", "value": f"value-{j}"} for j in range(8)],
+                "resources": {"limits": {"cpu": "500m", "memory": "512Mi"},
+                              "requests": {"cpu": "100m", "memory": "128Mi"}},
+                "volumeMounts": [{"name": "kube-api-access", "mountPath": "/var/run/secrets", "readOnly": True}],
+                "securityContext": {"allowPrivilegeEscalation": False, "runAsNonRoot": True,
+                                    "capabilities": {"drop": ["ALL"]}},
+            }],
+            "volumes": [{"name": "kube-api-access", "projected": {"sources": [
+                {"serviceAccountToken": {"expirationSeconds": 3607, "path": "token"}}]}}],
+        },
+        "status": {
+            "phase": "Running",
+            "podIP": f"10.128.{i // 250}.{i % 250}",
+            "startTime": "2024-01-01T00:00:05Z",
+            "conditions": [{"type": t, "status": "True", "lastTransitionTime": "2024-01-01T00:00:10Z"}
+                           for t in ("Initialized", "Ready", "ContainersReady", "PodScheduled")],
+            "containerStatuses": [{
+                "name": "app", "ready": True, "restartCount": 0, "started": True,
+                "image": "quay.io/example/checkout:1.2.3", "imageID": "quay.io/example/checkout@sha256:abc",
+                "containerID": f"cri-o://{i:064d}",
+                "state": {"running": {"startedAt": "2024-01-01T00:00:08Z"}},
+            }],
+        },
+    }
+
+
+def make_pod_list(size: int) -> bytes:
+    body = {"kind": "PodList", "apiVersion": "v1", "metadata": {"resourceVersion": "1"},
+            "items": [make_pod(i) for i in range(size)]}
+    return json.dumps(body).encode()
+
+
+def decode_model(api_client: ApiClient, data: bytes):
+    pods = api_client.deserialize(SimpleNamespace(data=data), "V1PodList")
+    return [pod.metadata.name for pod in pods.items]
+
+
+def decode_json(data: bytes):
+    return [pod["metadata"]["name"] for pod in json.loads(data)["items"]]
+
+
+def decode_fast(data: bytes):
+    return [pod["metadata"]["name"] for pod in loads(data)["items"]]
+
+
+def best_of(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="100,1000,5000", help="comma-separated list sizes")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement (best is reported)")
+    args = parser.parse_args()
+
+    api_client = ApiClient()
+    print(f"{'pods':>8} {'MB':>7} {'model ms':>10} {'json ms':>10} {'fast ms':>10} {'speedup':>8}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        data = make_pod_list(size)
+        assert decode_model(api_client, data) == decode_fast(data)
+        model = best_of(lambda: decode_model(api_client, data), args.repeat)
+        std = best_of(lambda: decode_json(data), args.repeat)
+        fast = best_of(lambda: decode_fast(data), args.repeat)
+        print(f"{size:>8} {len(data) / 1e6:>7.1f} {model * 1e3:>10.1f} {std * 1e3:>10.1f} "
+              f"{fast * 1e3:>10.1f} {model / fast:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Measure how quickly the server starts and answers its first request.
+
+Reports, over several fresh processes:
+
+- ``import``: time to import ``openshift_mcp_server.server`` (and whether that pulled in ``kubernetes``)
+- ``first tools/list``: time from spawning the server over stdio to the first ``tools/list`` response
+
+Pass ``--max-import`` / ``--max-first-list`` (seconds) to exit non-zero when the median
+exceeds a budget, e.g. in CI.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_startup.py [--runs 5]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+IMPORT_SNIPPET = (
+    "import sys, time; start = time.perf_counter(); import openshift_mcp_server.server; "
+    "print(time.perf_counter() - start, 'kubernetes' in sys.modules)"
+)
+SERVE_SNIPPET = "from openshift_mcp_server.server import mcp; mcp.run()"
+
+
+def measure_import() -> tuple:
+    out = subprocess.run([sys.executable, "-c", IMPORT_SNIPPET], check=True, capture_output=True,
+                         text=True, env=os.environ.copy()).stdout.split()
+    return float(out[0]), out[1] == "True"
+
+
+async def measure_first_list() -> tuple:
+    params = StdioServerParameters(command=sys.executable, args=["-c", SERVE_SNIPPET], env=os.environ.copy())
+    start = time.perf_counter()
+    async with stdio_client(params) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            tools = await session.list_tools()
+            return time.perf_counter() - start, len(tools.tools)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-import", type=float, help="fail if the median import time exceeds this")
+    parser.add_argument("--max-first-list", type=float, help="fail if the median time to tools/list exceeds this")
+    args = parser.parse_args()
+
+    imports = [measure_import() for _ in range(args.runs)]
+    first_lists = [asyncio.run(measure_first_list()) for _ in range(args.runs)]
+    import_median = statistics.median(t for t, _ in imports)
+    list_median = statistics.median(t for t, _ in first_lists)
+    print(f"import:           median {import_median * 1e3:7.1f} ms  min {min(t for t, _ in imports) * 1e3:7.1f} ms"
+          f"  (kubernetes imported: {any(k for _, k in imports)})")
+    print(f"first tools/list: median {list_median * 1e3:7.1f} ms  min {min(t for t, _ in first_lists) * 1e3:7.1f} ms"
+          f"  ({first_lists[0][1]} tools)")
+
+    failed = False
+    if args.max_import is not None and import_median > args.max_import:
+        print(f"FAIL: import median exceeds {args.max_import}s")
+        failed = True
+    if args.max_first_list is not None and list_median > args.max_first_list:
+        print(f"FAIL: first tools/list median exceeds {args.max_first_list}s")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
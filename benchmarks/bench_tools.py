@@ -0,0 +1,267 @@
+"""Drive every tool against a local fake apiserver and report latency, throughput and memory.
+
+Starts ``fake_apiserver.py`` in a child process (so its work does not compete for
+this process's GIL), connects a real ``AppContext`` to it through
+``create_api_client`` exactly as the server does, and then:
+
+- calls each tool ``--iterations`` times and reports p50/p90/p99/max latency,
+  the response size and the traced peak of Python allocations during one call
+- runs a mix of the read-only tools on ``--concurrency`` threads for
+  ``--duration`` seconds and reports throughput and latency percentiles
+- reports the peak RSS of the process
+
+Nothing leaves 127.0.0.1. Scale the synthetic cluster with the same flags as
+``fake_apiserver.py`` (e.g. ``--namespaces 50 --pods 1000`` for 50k pods).
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_tools.py [--iterations 20] [--concurrency 8] [--only list_pods,get_pod_logs]
+"""
+import argparse
+import functools
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+from kubernetes import client
+
+from openshift_mcp_server import tools
+from openshift_mcp_server.clusters import ClusterPool
+from openshift_mcp_server.connection import create_api_client
+from openshift_mcp_server.delta import encode_cursor
+from openshift_mcp_server.fastjson import dumped_size
+from openshift_mcp_server.server import build_app_context
+
+from fake_apiserver import add_scale_arguments
+
+NAMESPACE = "bench-000"
+# Named clusters of the pool used by list_clusters and query_clusters, each its own connection to the fake apiserver.
+CLUSTERS = ("bench-east", "bench-west", "bench-north", "bench-south")
+DEPLOYMENT = {
+    "apiVersion": "apps/v1", "kind": "Deployment",
+    "metadata": {"name": "bench-created", "labels": {"app": "bench"}},
+    "spec": {
+        "replicas": 1,
+        "selector": {"matchLabels": {"app": "bench"}},
+        "template": {
+            "metadata": {"labels": {"app": "bench"}},
+            "spec": {"serviceAccountName": "bench", "containers": [{
+                "name": "app", "image": "quay.io/example/bench:1",
+                "resources": {"limits": {"cpu": "100m", "memory": "64Mi"}, "requests": {"cpu": "50m", "memory": "32Mi"}},
+                "securityContext": {"runAsNonRoot": True, "allowPrivilegeEscalation": False},
+            }]},
+        },
+    },
+}
+
+# A 100-document render of the deployment above (JSON documents are valid YAML).
+RENDER = "\n---\n".join(
+    json.dumps({**DEPLOYMENT, "metadata": {**DEPLOYMENT["metadata"], "name": f"bench-{i:03d}"}}) for i in range(100))
+
+# (name, tool, kwargs, read_only)
+SCENARIOS = [
+    ("list_namespaces", tools.list_namespaces, {}, True),
+    ("list_projects", tools.list_projects, {}, True),
+    ("list_pods", tools.list_pods, {"namespace": NAMESPACE}, True),
+    ("list_pods (page)", tools.list_pods, {"namespace": NAMESPACE, "page_size": 50}, True),
+    ("list_pods (wide)", tools.list_pods, {"namespace": NAMESPACE, "wide": True}, True),
+    ("get_pods_summary", tools.get_pods_summary, {"namespace": NAMESPACE}, True),
+    ("get_pod_logs", tools.get_pod_logs, {"namespace": NAMESPACE, "pod_name": "checkout-7d9f8c6b5-00000"}, True),
+    ("get_pod_logs (tail)", tools.get_pod_logs,
+     {"namespace": NAMESPACE, "pod_name": "checkout-7d9f8c6b5-00000", "tail_lines": 100}, True),
+    ("get_pod_logs (stream)", tools.get_pod_logs,
+     {"namespace": NAMESPACE, "pod_name": "checkout-7d9f8c6b5-00000", "stream": True}, True),
+    ("search_pod_logs", tools.search_pod_logs,
+     {"namespace": NAMESPACE, "pattern": "ERROR", "deployment": "payments", "max_matches": 1000}, True),
+    ("list_deployments", tools.list_deployments, {"namespace": NAMESPACE}, True),
+    ("get_deployments_summary", tools.get_deployments_summary, {"namespace": NAMESPACE}, True),
+    ("list_routes", tools.list_routes, {"namespace": NAMESPACE}, True),
+    ("get_route", tools.get_route, {"namespace": NAMESPACE, "route_name": "checkout-00000"}, True),
+    ("list_services", tools.list_services, {"namespace": NAMESPACE}, True),
+    ("get_service", tools.get_service, {"namespace": NAMESPACE, "service_name": "checkout-00000"}, True),
+    ("get_all_services", tools.get_all_services, {"namespace": ""}, True),
+    ("get_cluster_info", tools.get_cluster_info, {}, True),
+    ("get_cluster_info (namespace)", tools.get_cluster_info, {"namespace": NAMESPACE}, True),
+    ("list_configmaps", tools.list_configmaps, {"namespace": NAMESPACE}, True),
+    ("list_secrets", tools.list_secrets, {"namespace": NAMESPACE}, True),
+    ("list_jobs", tools.list_jobs, {"namespace": NAMESPACE}, True),
+    ("list_pvcs", tools.list_pvcs, {"namespace": NAMESPACE}, True),
+    ("list_ingresses", tools.list_ingresses, {"namespace": NAMESPACE}, True),
+    ("list_rolebindings", tools.list_rolebindings, {"namespace": NAMESPACE}, True),
+    ("list_serviceaccounts", tools.list_serviceaccounts, {"namespace": NAMESPACE}, True),
+    ("list_resourcequotas", tools.list_resourcequotas, {"namespace": NAMESPACE}, True),
+    ("list_events", tools.list_events, {"namespace": NAMESPACE}, True),
+    ("get_events_summary", tools.get_events_summary, {"namespace": NAMESPACE}, True),
+    ("aggregate_events", tools.aggregate_events, {"namespace": NAMESPACE}, True),
+    ("aggregate_events (Warning)", tools.aggregate_events, {"namespace": NAMESPACE, "event_type": "Warning"}, True),
+    ("get_changes (list)", tools.get_changes, {"kind": "pods", "namespace": NAMESPACE}, True),
+    ("get_changes (since)", tools.get_changes,
+     {"kind": "pods", "namespace": NAMESPACE, "cursor": encode_cursor("pods", NAMESPACE, "1000000")}, True),
+    ("get_owner_chain", tools.get_owner_chain,
+     {"namespace": NAMESPACE, "kind": "Pod", "name": "checkout-7d9f8c6b5-00000"}, True),
+    ("get_backing_pods (route)", tools.get_backing_pods,
+     {"namespace": NAMESPACE, "kind": "Route", "name": "checkout-00000"}, True),
+    ("get_backing_pods (deployment)", tools.get_backing_pods,
+     {"namespace": NAMESPACE, "kind": "Deployment", "name": "checkout"}, True),
+    ("get_cluster_snapshot", tools.get_cluster_snapshot, {}, True),
+    ("list_clusters", tools.list_clusters, {}, True),
+    ("query_clusters (list_pods)", tools.query_clusters,
+     {"tool": "list_pods", "arguments": {"namespace": NAMESPACE}}, True),
+    ("query_clusters (summary)", tools.query_clusters,
+     {"tool": "get_pods_summary", "arguments": {"namespace": NAMESPACE}}, True),
+    ("get_cache_status", tools.get_cache_status, {}, True),
+    ("get_connection_pool_stats", tools.get_connection_pool_stats, {}, True),
+    ("get_metrics", tools.get_metrics, {}, True),
+    ("validate_openshift_manifest", tools.validate_openshift_manifest, {"manifest": DEPLOYMENT}, True),
+    ("validate_manifests (100 docs)", tools.validate_manifests, {"yaml_text": RENDER, "summary_only": True}, True),
+    # The fake deployments are fully rolled out, so this measures reading, listing and starting the two watches.
+    ("wait_for_rollout", tools.wait_for_rollout, {"namespace": NAMESPACE, "name": "checkout"}, True),
+    ("create_deployment", tools.create_deployment, {"namespace": NAMESPACE, "deployment_manifest": DEPLOYMENT}, False),
+    ("apply_manifests (100 docs)", tools.apply_manifests, {"yaml_text": RENDER, "namespace": NAMESPACE}, False),
+    ("apply_manifests (100 docs unthrottled)", tools.apply_manifests,
+     {"yaml_text": RENDER, "namespace": NAMESPACE, "qps": 1000}, False),
+    ("apply_manifests (100 docs serial)", tools.apply_manifests,
+     {"yaml_text": RENDER, "namespace": NAMESPACE, "qps": 1000, "concurrency": 1}, False),
+]
+
+
+def start_fake_apiserver(args: argparse.Namespace) -> tuple:
+    """Spawn fake_apiserver.py on a free port and return (process, url)."""
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fake_apiserver.py")
+    command = [sys.executable, script, "--port", "0", "--namespaces", str(args.namespaces), "--pods", str(args.pods),
+               "--objects", str(args.objects), "--events", str(args.events), "--log-mb", str(args.log_mb),
+               "--write-latency-ms", str(args.write_latency_ms)]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    line = process.stdout.readline()
+    if not line:
+        process.kill()
+        raise RuntimeError("fake apiserver failed to start")
+    print(line.strip())
+    return process, line.split()[-1]
+
+
+def connect(url: str):
+    configuration = client.Configuration()
+    configuration.host = url
+    # No client-side rate limit, so the throughput run measures the server rather than OPENSHIFT_MCP_RATE_LIMITS.
+    return build_app_context(create_api_client(configuration, rate_limits=""))
+
+
+def make_context(url: str) -> SimpleNamespace:
+    app_context = connect(url)
+    app_context.clusters = ClusterPool({name: functools.partial(connect, url) for name in CLUSTERS})
+    return SimpleNamespace(request_context=SimpleNamespace(lifespan_context=app_context))
+
+
+def percentile(values: list, q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q / 100 * (len(values) - 1))))]
+
+
+class ToolFailed(Exception):
+    pass
+
+
+def call(tool, ctx, kwargs) -> tuple:
+    start = time.perf_counter()
+    result = tool(ctx=ctx, **kwargs)
+    elapsed = time.perf_counter() - start
+    if isinstance(result, dict) and "error" in result:
+        raise ToolFailed(result.get("details") or result["error"])
+    return elapsed, result
+
+
+def bench_latency(ctx, scenarios: list, iterations: int) -> list:
+    """Time each scenario and return the names of those whose tool failed."""
+    failed = []
+    print(f"\n{'tool':<30} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9} {'KB':>9} {'alloc MB':>9}")
+    for name, tool, kwargs, _ in scenarios:
+        try:
+            _, result = call(tool, ctx, kwargs)  # warm up the connection and code paths
+        except ToolFailed as e:
+            print(f"{name:<30} FAILED: {e}")
+            failed.append(name)
+            continue
+        tracemalloc.start()
+        call(tool, ctx, kwargs)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        timings = [call(tool, ctx, kwargs)[0] for _ in range(iterations)]
+        print(f"{name:<30} {percentile(timings, 50) * 1e3:>9.2f} {percentile(timings, 90) * 1e3:>9.2f} "
+              f"{percentile(timings, 99) * 1e3:>9.2f} {max(timings) * 1e3:>9.2f} "
+              f"{dumped_size(result) / 1024:>9.1f} {peak / 1e6:>9.1f}")
+    return failed
+
+
+def bench_throughput(ctx, scenarios: list, concurrency: int, duration: float) -> None:
+    read_only = []
+    for scenario in scenarios:
+        try:
+            if scenario[3]:
+                call(scenario[1], ctx, scenario[2])
+                read_only.append(scenario)
+        except ToolFailed:
+            pass
+    deadline = time.perf_counter() + duration
+    timings = []
+    lock = threading.Lock()
+
+    def worker(seed: int) -> None:
+        rng = random.Random(seed)
+        local = []
+        while time.perf_counter() < deadline:
+            _, tool, kwargs, _ = rng.choice(read_only)
+            local.append(call(tool, ctx, kwargs)[0])
+        with lock:
+            timings.extend(local)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for future in [pool.submit(worker, seed) for seed in range(concurrency)]:
+            future.result()
+    elapsed = time.perf_counter() - start
+    print(f"\nmixed read-only tools on {concurrency} threads for {elapsed:.1f}s: {len(timings)} calls, "
+          f"{len(timings) / elapsed:.1f} calls/s, p50 {percentile(timings, 50) * 1e3:.2f} ms, "
+          f"p99 {percentile(timings, 99) * 1e3:.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_scale_arguments(parser)
+    parser.add_argument("--iterations", type=int, default=20, help="sequential calls per tool")
+    parser.add_argument("--concurrency", type=int, default=8, help="threads for the throughput run (0 skips it)")
+    parser.add_argument("--duration", type=float, default=5, help="seconds for the throughput run")
+    parser.add_argument("--only", help="comma-separated scenario names to run")
+    args = parser.parse_args()
+
+    scenarios = SCENARIOS
+    if args.only:
+        wanted = set(args.only.split(","))
+        scenarios = [s for s in SCENARIOS if s[0] in wanted]
+
+    process, url = start_fake_apiserver(args)
+    try:
+        ctx = make_context(url)
+        failed = bench_latency(ctx, scenarios, args.iterations)
+        if args.concurrency:
+            bench_throughput(ctx, scenarios, args.concurrency, args.duration)
+    finally:
+        process.terminate()
+        process.wait()
+    # ru_maxrss is in KiB on Linux and bytes on macOS.
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+    print(f"\npeak RSS {rss:.1f} MiB")
+    if failed:
+        # A tool that fails against the fake cluster is a bug, not a benchmark result.
+        sys.exit(f"\n{len(failed)} tool(s) failed: {', '.join(failed)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,363 @@
+"""A local, in-memory stand-in for the Kubernetes/OpenShift API server.
+
+Serves synthetic namespaces, pods, deployments, services, routes, events and the
+other kinds the tools read, over plain HTTP on 127.0.0.1, so the benchmarks can
+exercise the real client, HTTP and JSON costs without a cluster or network.
+
+Supported: GET of collections (namespaced and across all namespaces) with
+``limit``/``continue`` and equality ``labelSelector``s, also as
+PartialObjectMetadataList or Table when the Accept header asks for it, GET of
+single objects, pod logs (``tailLines``, ``limitBytes``), watches (answered with
+one bookmark, as the fake cluster never changes), ``/api``, discovery of the
+served group/versions, and POST and apply PATCH (echoed back, after
+``--write-latency-ms`` to stand in for admission and the etcd write).
+
+Every object is serialized once up front, so list responses cost the server
+little more than a join and the measured time is dominated by the client.
+
+Usage (standalone, prints the URL and serves until interrupted):
+    PYTHONPATH=src python benchmarks/fake_apiserver.py --namespaces 10 --pods 1000 --log-mb 4
+"""
+import argparse
+import json
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from bench_decode import make_pod
+
+# plural -> kind
+KINDS = {
+    "pods": "Pod",
+    "services": "Service",
+    "configmaps": "ConfigMap",
+    "secrets": "Secret",
+    "persistentvolumeclaims": "PersistentVolumeClaim",
+    "serviceaccounts": "ServiceAccount",
+    "resourcequotas": "ResourceQuota",
+    "events": "Event",
+    "deployments": "Deployment",
+    "replicasets": "ReplicaSet",
+    "jobs": "Job",
+    "ingresses": "Ingress",
+    "rolebindings": "RoleBinding",
+    "routes": "Route",
+}
+# Discovery: group/version path -> plurals served there (all namespaced except namespaces).
+GROUP_VERSIONS = {
+    "/api/v1": ("namespaces", "pods", "services", "configmaps", "secrets", "persistentvolumeclaims",
+                "serviceaccounts", "resourcequotas", "events"),
+    "/apis/apps/v1": ("deployments", "replicasets"),
+    "/apis/batch/v1": ("jobs",),
+    "/apis/networking.k8s.io/v1": ("ingresses",),
+    "/apis/rbac.authorization.k8s.io/v1": ("rolebindings",),
+    "/apis/route.openshift.io/v1": ("routes",),
+}
+APPS = ("checkout", "cart", "catalog", "payments", "search")
+REASONS = (("Normal", "Scheduled"), ("Normal", "Pulled"), ("Normal", "Started"),
+           ("Warning", "BackOff"), ("Warning", "Unhealthy"), ("Warning", "FailedMount"))
+
+_PATH = re.compile(
+    r"^(?P<prefix>/api/v1|/apis/[^/]+/[^/]+)"
+    r"(?:/namespaces/(?P<namespace>[^/]+))?"
+    r"/(?P<plural>[^/]+)(?:/(?P<name>[^/]+))?(?:/(?P<sub>log))?$"
+)
+
+
+def _meta(name: str, namespace: Optional[str], i: int, **extra) -> dict:
+    meta = {"name": name, "uid": f"00000000-0000-0000-0000-{i:012d}",
+            "resourceVersion": str(1000 + i), "creationTimestamp": "2024-01-01T00:00:00Z"}
+    if namespace is not None:
+        meta["namespace"] = namespace
+    meta.update(extra)
+    return meta
+
+
+def make_object(plural: str, namespace: str, i: int) -> dict:
+    """A small but realistic object of the given kind."""
+    app = APPS[i % len(APPS)]
+    name = f"{app}-{i:05d}"
+    labels = {"app": app}
+    if plural == "pods":
+        pod = make_pod(i)
+        pod["metadata"].update(namespace=namespace, labels={**pod["metadata"]["labels"], "app": app},
+                               name=f"{app}-7d9f8c6b5-{i:05d}")
+        pod["metadata"]["ownerReferences"] = [{**pod["metadata"]["ownerReferences"][0], "name": f"{app}-7d9f8c6b5"}]
+        return pod
+    if plural == "replicasets":
+        owner = app if i < len(APPS) else name
+        return {"metadata": _meta(f"{owner}-7d9f8c6b5", namespace, i, labels=labels, ownerReferences=[
+                    {"apiVersion": "apps/v1", "kind": "Deployment", "name": owner, "controller": True}]),
+                "spec": {"replicas": 3, "selector": {"matchLabels": labels}},
+                "status": {"replicas": 3, "readyReplicas": 3}}
+    if plural == "deployments":
+        return {"metadata": _meta(app if i < len(APPS) else name, namespace, i, labels=labels),
+                "spec": {"replicas": 3, "selector": {"matchLabels": labels},
+                         "template": {"metadata": {"labels": labels},
+                                      "spec": {"containers": [{"name": "app", "image": f"quay.io/example/{app}:1"}]}}},
+                "status": {"replicas": 3, "readyReplicas": 3, "availableReplicas": 3, "updatedReplicas": 3}}
+    if plural == "services":
+        return {"metadata": _meta(name, namespace, i, labels=labels),
+                "spec": {"selector": labels, "clusterIP": f"172.30.{i // 250}.{i % 250}",
+                         "ports": [{"port": 8080, "targetPort": 8080, "protocol": "TCP"}]}}
+    if plural == "routes":
+        return {"metadata": _meta(name, namespace, i, labels=labels),
+                "spec": {"host": f"{name}-{namespace}.apps.example.com", "to": {"kind": "Service", "name": name},
+                         "port": {"targetPort": 8080}, "tls": {"termination": "edge"}}}
+    if plural == "events":
+        event_type, reason = REASONS[i % len(REASONS)]
+        return {"metadata": _meta(f"{name}.{i:x}", namespace, i),
+                "involvedObject": {"kind": "Pod", "namespace": namespace, "name": f"{app}-7d9f8c6b5-{i % 50:05d}"},
+                "reason": reason, "type": event_type, "message": f"{reason} for container app", "count": 1 + i % 7,
+                "firstTimestamp": "2024-01-01T00:00:00Z", "lastTimestamp": f"2024-01-01T00:{i % 60:02d}:00Z",
+                "source": {"component": "kubelet"}}
+    if plural == "secrets":
+        return {"metadata": _meta(name, namespace, i), "type": "Opaque", "data": {"password": "c2VjcmV0"}}
+    if plural == "configmaps":
+        return {"metadata": _meta(name, namespace, i), "data": {"config.yaml": "key: value\n" * 20}}
+    if plural == "jobs":
+        return {"metadata": _meta(name, namespace, i, labels=labels),
+                "spec": {"template": {"spec": {"containers": [{"name": "job", "image": "busybox"}]}}},
+                "status": {"succeeded": 1}}
+    if plural == "rolebindings":
+        return {"metadata": _meta(name, namespace, i),
+                "roleRef": {"apiGroup": "rbac.authorization.k8s.io", "kind": "ClusterRole", "name": "view"},
+                "subjects": [{"kind": "ServiceAccount", "name": "default", "namespace": namespace}]}
+    return {"metadata": _meta(name, namespace, i, labels=labels), "spec": {}}
+
+
+class FakeCluster:
+    """Pre-serialized synthetic objects, indexed by plural and namespace."""
+
+    def __init__(self, namespaces: int = 5, pods: int = 100, objects: int = 20, events: int = 200,
+                 log_bytes: int = 1024 * 1024, write_latency: float = 0):
+        self.write_latency = write_latency
+        self.namespaces = [f"bench-{n:03d}" for n in range(namespaces)]
+        # plural -> namespace -> [(name, labels, serialized object, object)]
+        self.store: Dict[str, Dict[str, List[Tuple[str, dict, bytes, dict]]]] = {}
+        self._partial: Dict[int, bytes] = {}
+        counts = {"pods": pods, "events": events}
+        for plural in KINDS:
+            for namespace in self.namespaces:
+                items = []
+                for i in range(counts.get(plural, objects)):
+                    obj = make_object(plural, namespace, i)
+                    items.append((obj["metadata"]["name"], obj["metadata"].get("labels", {}), json.dumps(obj).encode(), obj))
+                self.store.setdefault(plural, {})[namespace] = items
+        namespace_objects = [{"metadata": _meta(ns, None, i), "status": {"phase": "Active"}}
+                             for i, ns in enumerate(self.namespaces)]
+        self.store["namespaces"] = {"": [(obj["metadata"]["name"], {}, json.dumps(obj).encode(), obj)
+                                         for obj in namespace_objects]}
+        line = b"2024-01-01T00:00:00Z INFO handled request path=/api/checkout status=200 duration_ms=12\n"
+        error = b"2024-01-01T00:00:00Z ERROR upstream timeout path=/api/payments status=504 duration_ms=30000\n"
+        lines = [error if i % 97 == 0 else line for i in range(max(1, log_bytes // len(line)))]
+        self.log = b"".join(lines)
+
+    def collection(self, plural: str, namespace: Optional[str]) -> List[Tuple[str, dict, bytes, dict]]:
+        by_namespace = self.store.get(plural, {})
+        if plural == "namespaces":
+            return by_namespace[""]
+        if namespace is not None:
+            return by_namespace.get(namespace, [])
+        return [item for ns in self.namespaces for item in by_namespace.get(ns, [])]
+
+    def partial(self, item: Tuple[str, dict, bytes, dict]) -> bytes:
+        """The PartialObjectMetadata form of a stored item, serialized once and then reused."""
+        key = id(item[3])
+        if key not in self._partial:
+            self._partial[key] = json.dumps({"kind": "PartialObjectMetadata", "apiVersion": "meta.k8s.io/v1",
+                                             "metadata": item[3]["metadata"]}).encode()
+        return self._partial[key]
+
+    def total(self) -> int:
+        return sum(len(items) for by_namespace in self.store.values() for items in by_namespace.values())
+
+
+def table_row(plural: str, obj: dict) -> List[Tuple[str, object]]:
+    """The (column, cell) pairs kubectl would print for obj, roughly as the real apiserver renders them."""
+    meta = obj["metadata"]
+    status = obj.get("status") or {}
+    if plural == "pods":
+        statuses = status.get("containerStatuses") or []
+        return [("Name", meta["name"]), ("Ready", f"{sum(c['ready'] for c in statuses)}/{len(statuses)}"),
+                ("Status", status.get("phase")), ("Restarts", sum(c["restartCount"] for c in statuses)),
+                ("Age", "5d"), ("IP", status.get("podIP")), ("Node", obj["spec"].get("nodeName")),
+                ("Nominated Node", "<none>"), ("Readiness Gates", "<none>")]
+    if plural == "deployments":
+        return [("Name", meta["name"]), ("Ready", f"{status.get('readyReplicas', 0)}/{obj['spec']['replicas']}"),
+                ("Up-to-date", status.get("updatedReplicas", 0)), ("Available", status.get("availableReplicas", 0)),
+                ("Age", "5d")]
+    if plural == "events":
+        involved = obj["involvedObject"]
+        return [("Last Seen", "2m"), ("Type", obj["type"]), ("Reason", obj["reason"]),
+                ("Object", f"{involved['kind'].lower()}/{involved['name']}"), ("Message", obj["message"])]
+    if plural == "secrets":
+        return [("Name", meta["name"]), ("Type", obj["type"]), ("Data", len(obj.get("data") or {})), ("Age", "5d")]
+    return [("Name", meta["name"]), ("Age", "5d")]
+
+
+def _matches(labels: dict, selector: str) -> bool:
+    for term in filter(None, selector.split(",")):
+        key, _, value = term.partition("=")
+        if labels.get(key.strip()) != value.strip().lstrip("="):
+            return False
+    return True
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this, delayed ACKs add ~40ms per request.
+    disable_nagle_algorithm = True
+    cluster: FakeCluster = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body: bytes, content_type: str = "application/json") -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _status(self, code: int, reason: str, message: str) -> None:
+        self._send(code, json.dumps({"kind": "Status", "apiVersion": "v1", "status": "Failure",
+                                     "reason": reason, "message": message, "code": code}).encode())
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        if url.path in ("/api", "/api/"):
+            return self._send(200, json.dumps({"kind": "APIVersions", "versions": ["v1"], "serverAddressByClientCIDRs": [
+                {"clientCIDR": "0.0.0.0/0", "serverAddress": "127.0.0.1:6443"}]}).encode())
+        if url.path in GROUP_VERSIONS:
+            return self._send(200, json.dumps({"kind": "APIResourceList", "groupVersion": url.path.split("/", 2)[2],
+                                               "resources": [{"name": plural, "kind": KINDS.get(plural, "Namespace"),
+                                                              "namespaced": plural != "namespaces", "verbs": []}
+                                                             for plural in GROUP_VERSIONS[url.path]]}).encode())
+        match = _PATH.match(url.path)
+        if match is None:
+            return self._status(404, "NotFound", f"no route for {url.path}")
+        namespace, plural, name, sub = match.group("namespace", "plural", "name", "sub")
+        if plural not in self.cluster.store:
+            return self._status(404, "NotFound", f"unknown resource {plural}")
+        items = self.cluster.collection(plural, namespace)
+        if name is not None:
+            found = [item for item in items if item[0] == name]
+            if not found:
+                return self._status(404, "NotFound", f'{plural} "{name}" not found')
+            return self._log(query) if sub == "log" else self._send(200, found[0][2])
+        if query.get("watch") == "true":
+            return self._watch(query)
+        if "labelSelector" in query:
+            items = [item for item in items if _matches(item[1], query["labelSelector"])]
+        start = int(query.get("continue") or 0)
+        limit = int(query.get("limit") or 0)
+        page = items[start:start + limit] if limit else items[start:]
+        more = bool(limit) and start + limit < len(items)
+        meta = {"resourceVersion": "1000000", "continue": str(start + limit) if more else ""}
+        accept = self.headers.get("Accept", "")
+        if "as=Table" in accept:
+            rows = [table_row(plural, item[3]) for item in page]
+            columns = [{"name": column, "type": "string", "format": "", "description": "", "priority": 0}
+                       for column, _ in (rows[0] if rows else [("Name", None)])]
+            return self._send(200, json.dumps({
+                "kind": "Table", "apiVersion": "meta.k8s.io/v1", "metadata": meta, "columnDefinitions": columns,
+                "rows": [{"cells": [cell for _, cell in row], "object": {
+                    "kind": "PartialObjectMetadata", "apiVersion": "meta.k8s.io/v1", "metadata": item[3]["metadata"]}}
+                    for row, item in zip(rows, page)],
+            }).encode())
+        if "as=PartialObjectMetadataList" in accept:
+            body = b'{"kind":"PartialObjectMetadataList","apiVersion":"meta.k8s.io/v1","metadata":%s,"items":[%s]}' % (
+                json.dumps(meta).encode(), b",".join(self.cluster.partial(item) for item in page))
+            return self._send(200, body)
+        kind = KINDS.get(plural, "Namespace")
+        body = b'{"kind":"%sList","apiVersion":"v1","metadata":%s,"items":[%s]}' % (
+            kind.encode(), json.dumps(meta).encode(), b",".join(item[2] for item in page))
+        self._send(200, body)
+
+    def _watch(self, query: dict) -> None:
+        # The fake cluster never changes: answer with a single bookmark instead of holding the watch open.
+        bookmark = {"type": "BOOKMARK", "object": {"kind": "Status", "metadata": {
+            "resourceVersion": query.get("resourceVersion") or "1000000"}}}
+        self._send(200, json.dumps(bookmark).encode() + b"\n")
+
+    def _log(self, query: dict) -> None:
+        log = self.cluster.log
+        if query.get("tailLines"):
+            lines = log.splitlines(keepends=True)
+            log = b"".join(lines[-int(query["tailLines"]):])
+        if query.get("limitBytes"):
+            log = log[:int(query["limitBytes"])]
+        self._send(200, log, "text/plain")
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+        time.sleep(self.cluster.write_latency)
+        body.setdefault("metadata", {}).update(uid="00000000-0000-0000-0000-ffffffffffff", resourceVersion="1")
+        self._send(201, json.dumps(body).encode())
+
+    def do_PATCH(self):
+        # Server-side apply: created (201) unless the object is one of the synthetic ones.
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+        time.sleep(self.cluster.write_latency)
+        match = _PATH.match(urlsplit(self.path).path)
+        if match is None or match.group("name") is None:
+            return self._status(404, "NotFound", f"no route for {self.path}")
+        namespace, plural, name = match.group("namespace", "plural", "name")
+        exists = any(item[0] == name for item in self.cluster.collection(plural, namespace))
+        body.setdefault("metadata", {}).update(uid="00000000-0000-0000-0000-ffffffffffff", resourceVersion="1")
+        self._send(200 if exists else 201, json.dumps(body).encode())
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Clients routinely hang up mid-response (capped log reads, cancelled calls).
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+def serve(cluster: FakeCluster, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+    """Serve cluster from a daemon thread; the bound port is server.server_address[1]."""
+    handler = type("Handler", (_Handler,), {"cluster": cluster})
+    server = _Server((host, port), handler)
+    threading.Thread(target=server.serve_forever, name="fake-apiserver", daemon=True).start()
+    return server
+
+
+def add_scale_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--namespaces", type=int, default=5, help="number of namespaces")
+    parser.add_argument("--pods", type=int, default=100, help="pods per namespace")
+    parser.add_argument("--objects", type=int, default=20, help="objects of every other kind per namespace")
+    parser.add_argument("--events", type=int, default=200, help="events per namespace")
+    parser.add_argument("--log-mb", type=float, default=1, help="size of each pod log in MiB")
+    parser.add_argument("--write-latency-ms", type=float, default=20, help="time taken by each create or apply")
+
+
+def cluster_from_args(args: argparse.Namespace) -> FakeCluster:
+    return FakeCluster(args.namespaces, args.pods, args.objects, args.events, int(args.log_mb * 1024 * 1024),
+                       args.write_latency_ms / 1000)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_scale_arguments(parser)
+    parser.add_argument("--port", type=int, default=8001)
+    args = parser.parse_args()
+    cluster = cluster_from_args(args)
+    server = serve(cluster, port=args.port)
+    print(f"Serving {cluster.total()} objects on http://127.0.0.1:{server.server_address[1]}", flush=True)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Server-side apply of many manifests of any kind.
+
+Each manifest is sent as an apply patch (PATCH with application/apply-patch+yaml)
+to its own object URL, which creates or updates it in one request and lets the
+apiserver merge fields by owner instead of failing with AlreadyExists. The URL
+needs the resource name and scope of the kind, which come from API discovery of
+the manifest's group/version, fetched once per ApiClient.
+
+Namespaces and CustomResourceDefinitions are applied first, the remaining
+manifests concurrently on a bounded pool, each request taking a token from a
+shared TokenBucket so a large release does not flood the apiserver.
+"""
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from openshift_mcp_server.errors import ToolCancelled, error_response
+from openshift_mcp_server.executor import check_cancelled
+from openshift_mcp_server.fastjson import loads
+from openshift_mcp_server.logging_utils import logger
+from openshift_mcp_server.ratelimit import TokenBucket
+from openshift_mcp_server.validation import document_key
+
+# Kinds other manifests may depend on, applied before the rest.
+FIRST_KINDS = ("Namespace", "CustomResourceDefinition")
+
+APPLY_PATCH = "application/apply-patch+yaml"
+
+
+def get_json(api_client, path: str, method: str = "GET", **kwargs) -> Tuple[int, dict]:
+    """Make a raw request through api_client and return (status, decoded body)."""
+    response = api_client.call_api(
+        path, method,
+        header_params={"Accept": "application/json", **kwargs.pop("header_params", {})},
+        auth_settings=["BearerToken"], _return_http_data_only=True, _preload_content=False, **kwargs
+    )
+    return response.status, loads(response.data)
+
+
+class Discovery:
+    """Resource name and scope of each kind, from the discovery document of its group/version."""
+
+    def __init__(self, api_client):
+        self._api_client = api_client
+        self._versions: Dict[str, Dict[str, Tuple[str, bool]]] = {}
+        self._lock = threading.Lock()
+
+    def _fetch(self, api_version: str) -> Dict[str, Tuple[str, bool]]:
+        path = "/api/v1" if api_version == "v1" else f"/apis/{api_version}"
+        _, body = get_json(self._api_client, path)
+        return {resource["kind"]: (resource["name"], resource["namespaced"])
+                for resource in body.get("resources") or [] if "/" not in resource["name"]}
+
+    def resource(self, api_version: str, kind: str) -> Tuple[str, bool]:
+        """(plural, namespaced) of a kind; the group/version is fetched again once for kinds it did not have."""
+        resources = self._versions.get(api_version)
+        if resources is None or kind not in resources:
+            # Refetch for unknown kinds: a CRD may have been applied since.
+            resources = self._fetch(api_version)
+            with self._lock:
+                self._versions[api_version] = resources
+        if kind not in resources:
+            raise ValueError(f"The server does not serve kind {kind} in {api_version}")
+        return resources[kind]
+
+
+def object_path(api_version: str, plural: str, name: str, namespace: Optional[str]) -> str:
+    prefix = "/api/v1" if api_version == "v1" else f"/apis/{api_version}"
+    if namespace:
+        prefix = f"{prefix}/namespaces/{namespace}"
+    return f"{prefix}/{plural}/{name}"
+
+
+def apply_errors(manifest: dict) -> List[str]:
+    """Errors that only matter for apply, on top of validate_document (which must pass first)."""
+    if not (manifest.get("metadata") or {}).get("name"):
+        # An apply patch goes to the object's URL, and the apiserver does not generate names for it.
+        return ["metadata.name is required to apply; generateName is not supported by server-side apply."]
+    return []
+
+
+def apply_one(api_client, discovery: Discovery, manifest: dict, namespace: Optional[str], field_manager: str,
+              dry_run: bool, force: bool) -> dict:
+    """Server-side apply one manifest and return {"result": "created|configured", "resource_version"}."""
+    api_version, kind = manifest["apiVersion"], manifest["kind"]
+    plural, namespaced = discovery.resource(api_version, kind)
+    metadata = manifest["metadata"]
+    if namespaced:
+        namespace = metadata.get("namespace") or namespace
+        if not namespace:
+            raise ValueError(f"{kind} is namespaced; set metadata.namespace or pass namespace")
+        manifest = {**manifest, "metadata": {**metadata, "namespace": namespace}}
+    query = [("fieldManager", field_manager)]
+    if dry_run:
+        query.append(("dryRun", "All"))
+    if force:
+        query.append(("force", "true"))
+    path = object_path(api_version, plural, metadata["name"], namespace if namespaced else None)
+    status, body = get_json(api_client, path, "PATCH", query_params=query, header_params={"Content-Type": APPLY_PATCH},
+                            body=manifest)
+    return {"result": "created" if status == 201 else "configured",
+            "resource_version": (body.get("metadata") or {}).get("resourceVersion")}
+
+
+def apply_all(api_client, discovery: Discovery, manifests: List[dict], namespace: Optional[str],
+              field_manager: str, dry_run: bool, force: bool, concurrency: int, bucket: TokenBucket) -> dict:
+    """Apply manifests (dependencies first, then concurrently) and return per-object results keyed like validation."""
+    keys: List[str] = []
+    seen = set()
+    for index, manifest in enumerate(manifests):
+        key = document_key(manifest, index)
+        keys.append(f"{key}#{index}" if key in seen else key)
+        seen.add(key)
+    results: Dict[str, Any] = {}
+
+    def apply(index: int) -> None:
+        manifest = manifests[index]
+        try:
+            check_cancelled()
+            bucket.acquire()
+            results[keys[index]] = apply_one(api_client, discovery, manifest, namespace, field_manager, dry_run, force)
+        except ToolCancelled:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to apply {keys[index]}: {e}")
+            results[keys[index]] = error_response(f"Failed to apply {keys[index]}", str(e))
+
+    first = [index for index, manifest in enumerate(manifests) if manifest.get("kind") in FIRST_KINDS]
+    rest = [index for index, manifest in enumerate(manifests) if manifest.get("kind") not in FIRST_KINDS]
+    context = contextvars.copy_context()
+    with ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="apply") as pool:
+        for wave in (first, rest):
+            # Each worker runs in a copy of the caller's context so cancellation reaches it.
+            list(pool.map(lambda index: context.copy().run(apply, index), wave))
+    failed = sum(1 for result in results.values() if "error" in result)
+    return {"dry_run": dry_run, "applied": len(results) - failed, "failed": failed,
+            "results": {key: results[key] for key in keys if key in results}}
@@ -0,0 +1,121 @@
+"""OpenShift OAuth token management for username/password logins."""
+import json
+import os
+import stat
+import threading
+import time
+from typing import Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+from openshift_mcp_server.errors import AuthenticationError
+from openshift_mcp_server.logging_utils import logger
+
+HTTP_UNAUTHORIZED = 401
+# Assumed lifetime when the OAuth server does not say (OpenShift's default is 24h).
+DEFAULT_TOKEN_LIFETIME = 24 * 60 * 60
+
+
+class TokenManager:
+    """Obtains an OAuth bearer token and keeps it fresh.
+
+    The token is cached in memory with its expiry and, if cache_path is set, in a
+    file only the current user can read. It is refreshed refresh_margin seconds
+    before it expires, or immediately after invalidate().
+    """
+
+    def __init__(self, server_url: str, username: str, password: str, cache_path: Optional[str] = None,
+                 refresh_margin: int = 300, session: Optional[requests.Session] = None):
+        self.server_url = server_url
+        self.username = username
+        self._password = password
+        self.cache_path = cache_path
+        self.refresh_margin = refresh_margin
+        self._session = session or requests.Session()
+        self._token: Optional[str] = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    def get_token(self) -> str:
+        with self._lock:
+            if not self._is_fresh():
+                if not self._load_cache():
+                    self._token, self._expires_at = self._fetch()
+                    self._save_cache()
+            return self._token
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._token = None
+            self._expires_at = 0.0
+
+    def refresh_api_key(self, configuration) -> None:
+        """refresh_api_key_hook for client.Configuration; runs before every request."""
+        configuration.api_key["authorization"] = f"Bearer {self.get_token()}"
+
+    def install(self, configuration) -> None:
+        self.refresh_api_key(configuration)
+        configuration.refresh_api_key_hook = self.refresh_api_key
+
+    def _is_fresh(self) -> bool:
+        return self._token is not None and time.time() < self._expires_at - self.refresh_margin
+
+    def _fetch(self) -> Tuple[str, float]:
+        oauth_url = f"{self.server_url}/oauth/authorize?response_type=token&client_id=openshift-challenging-client"
+        auth = requests.auth.HTTPBasicAuth(self.username, self._password)
+        response = self._session.post(oauth_url, auth=auth, allow_redirects=False, verify=False)
+        params = parse_qs(urlparse(response.headers.get("Location", "")).fragment)
+        if "access_token" not in params:
+            raise AuthenticationError("Failed to obtain OpenShift token via OAuth")
+        lifetime = int(params.get("expires_in", [DEFAULT_TOKEN_LIFETIME])[0])
+        logger.info(f"Obtained OpenShift OAuth token for {self.username}, valid for {lifetime}s")
+        return params["access_token"][0], time.time() + lifetime
+
+    def _load_cache(self) -> bool:
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return False
+        try:
+            if os.stat(self.cache_path).st_mode & (stat.S_IRWXG | stat.S_IRWXO):
+                logger.warning(f"Ignoring token cache {self.cache_path}: it is readable by other users")
+                return False
+            with open(self.cache_path) as f:
+                cached = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable token cache {self.cache_path}: {e}")
+            return False
+        if cached.get("server") != self.server_url or cached.get("username") != self.username:
+            return False
+        self._token, self._expires_at = cached.get("access_token"), float(cached.get("expires_at", 0))
+        return self._is_fresh()
+
+    def _save_cache(self) -> None:
+        if not self.cache_path:
+            return
+        tmp_path = f"{self.cache_path}.tmp"
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump({"server": self.server_url, "username": self.username,
+                           "access_token": self._token, "expires_at": self._expires_at}, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write token cache {self.cache_path}: {e}")
+
+
+def retry_on_unauthorized(api_client, token_manager: TokenManager) -> None:
+    """Make api_client retry a request once with a new token when it gets a 401."""
+    call_api = api_client.call_api
+
+    def call_api_with_fresh_token(*args, **kwargs):
+        try:
+            return call_api(*args, **kwargs)
+        except Exception as e:
+            if getattr(e, 'status', None) != HTTP_UNAUTHORIZED:
+                raise
+            logger.info("Request was rejected with 401, retrying with a new OAuth token")
+            token_manager.invalidate()
+            token_manager.refresh_api_key(api_client.configuration)
+            return call_api(*args, **kwargs)
+
+    api_client.call_api = call_api_with_fresh_token
@@ -0,0 +1,227 @@
+"""Serving several clusters from one server.
+
+Besides the default cluster, the server can hold a pool of named clusters: all or
+some contexts of the kubeconfig (OPENSHIFT_MCP_CLUSTERS) and the entries of a
+cluster file (OPENSHIFT_MCP_CLUSTERS_FILE). Each gets its own AppContext, created
+the first time a tool asks for it, and thereby its own ApiClient and connection
+pool. Tools take an optional cluster parameter (see with_cluster), and fan_out()
+runs one call against many clusters concurrently.
+
+The cluster file is YAML (or JSON):
+
+    clusters:
+      prod-east:                    # a context of a kubeconfig file
+        kubeconfig: /etc/mcp/prod-east.kubeconfig
+        context: admin@prod-east
+      lab:                          # username/password login, password from the environment
+        server: https://api.lab.example.com:6443
+        username: admin
+        password_env: LAB_PASSWORD
+        rate_limits: "*=10:20"      # optional, instead of OPENSHIFT_MCP_RATE_LIMITS
+"""
+import contextvars
+import functools
+import inspect
+import math
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from openshift_mcp_server.errors import error_response
+from openshift_mcp_server.executor import call_with_cancel_event, check_cancelled
+from openshift_mcp_server.logging_utils import logger
+
+# How often fan_out() checks whether its own call was cancelled while clusters answer.
+_WAIT_INTERVAL = 0.1
+
+
+def kubeconfig_contexts(config_file: Optional[str] = None) -> List[str]:
+    """Names of the contexts in a kubeconfig file (the default one if none is given)."""
+    from kubernetes import config
+
+    contexts, _ = config.list_kube_config_contexts(config_file)
+    return [context["name"] for context in contexts or []]
+
+
+def load_cluster_file(path: str) -> Dict[str, dict]:
+    """Read the cluster specs of a cluster file, keyed by cluster name."""
+    import yaml
+
+    with open(path) as f:
+        clusters = (yaml.safe_load(f) or {}).get("clusters") or {}
+    for name, spec in clusters.items():
+        if not isinstance(spec, dict):
+            raise ValueError(f"Cluster '{name}' in {path} must be a mapping")
+        if spec.get("server") and not (spec.get("username") and spec.get("password_env")):
+            raise ValueError(f"Cluster '{name}' in {path} needs username and password_env with server")
+    return clusters
+
+
+def cluster_specs(clusters: str, clusters_file: Optional[str]) -> Dict[str, dict]:
+    """Cluster specs from OPENSHIFT_MCP_CLUSTERS ("kubeconfig" for every context, or context names) and the file."""
+    names = [name.strip() for name in clusters.split(",") if name.strip()]
+    if names == ["kubeconfig"]:
+        names = kubeconfig_contexts()
+    specs = {name: {"context": name} for name in names}
+    if clusters_file:
+        specs.update(load_cluster_file(clusters_file))
+    return specs
+
+
+class ClusterPool:
+    """Named AppContexts, each built by its factory on first use."""
+
+    def __init__(self, factories: Dict[str, Callable[[], Any]]):
+        self._factories = dict(factories)
+        self._contexts: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def names(self) -> List[str]:
+        return sorted(self._factories)
+
+    def get(self, name: str) -> Any:
+        """The AppContext of a cluster, raising ValueError for unknown names."""
+        context = self._contexts.get(name)
+        if context is not None:
+            return context
+        if name not in self._factories:
+            raise ValueError(f"Unknown cluster '{name}'. Known clusters: {', '.join(self.names()) or 'none'}")
+        with self._lock:
+            if name not in self._contexts:
+                self._contexts[name] = self._factories[name]()
+            return self._contexts[name]
+
+    def status(self) -> Dict[str, dict]:
+        return {name: {"connected": name in self._contexts} for name in self.names()}
+
+    def close(self) -> None:
+        with self._lock:
+            contexts, self._contexts = self._contexts, {}
+        for context in contexts.values():
+            context.close()
+
+
+class _Proxy:
+    """Delegates to target, except for the attributes given as overrides."""
+
+    def __init__(self, target: Any, **overrides):
+        self._target = target
+        self.__dict__.update(overrides)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._target, name)
+
+
+def cluster_context(ctx: Any, cluster: Optional[str]) -> Any:
+    """ctx with its lifespan_context replaced by the named cluster's AppContext (ctx itself if cluster is None)."""
+    if not cluster:
+        return ctx
+    clusters = ctx.request_context.lifespan_context.clusters
+    if clusters is None:
+        raise ValueError(f"Unknown cluster '{cluster}'. No clusters are configured")
+    app_context = clusters.get(cluster)
+    return _Proxy(ctx, request_context=_Proxy(ctx.request_context, lifespan_context=app_context))
+
+
+def with_cluster(func: Callable) -> Callable:
+    """Add an optional cluster parameter to a tool that runs it against that cluster instead of the default."""
+    sig = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, cluster: Optional[str] = None, **kwargs):
+        if cluster:
+            bound = sig.bind_partial(*args, **kwargs)
+            try:
+                bound.arguments["ctx"] = cluster_context(bound.arguments["ctx"], cluster)
+            except ValueError as e:
+                return error_response(str(e))
+            args, kwargs = bound.args, bound.kwargs
+        return func(*args, **kwargs)
+
+    parameter = inspect.Parameter("cluster", inspect.Parameter.KEYWORD_ONLY, default=None, annotation=Optional[str])
+    wrapper.__signature__ = sig.replace(parameters=[*sig.parameters.values(), parameter])
+    return wrapper
+
+
+def _timed(started: Dict[str, float], name: str, func: Callable, *args) -> Any:
+    """Pool task body: note when the call for one cluster begins, then run it."""
+    started[name] = time.monotonic()
+    return func(*args)
+
+
+def fan_out(ctx: Any, clusters: Iterable[str], call: Callable[[Any], Any], timeout: float,
+            workers: int) -> dict:
+    """Run call(cluster_ctx) for every cluster concurrently, each with its own timeout.
+
+    Returns {"results": {cluster: result}, "errors": {cluster: error}}. A cluster that
+    raises, returns an error dict or does not answer within timeout seconds of its
+    call starting is reported under "errors" without affecting the others; a cluster
+    that timed out is cancelled at its next check_cancelled(). With more clusters
+    than workers the rest queue for a free worker, and their timeout only starts
+    then. A cluster still queued once every batch could have used its full timeout
+    (because timed-out calls did not stop) is reported as not started.
+    """
+    clusters = list(dict.fromkeys(clusters))
+    results: Dict[str, Any] = {}
+    errors: Dict[str, Any] = {}
+    context = contextvars.copy_context()
+    max_workers = max(1, min(workers, len(clusters)))
+    pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fan-out")
+    futures = {}
+    events = {}
+    started: Dict[str, float] = {}
+    try:
+        for name in clusters:
+            try:
+                target = cluster_context(ctx, name)
+            except ValueError as e:
+                errors[name] = error_response(str(e))
+                continue
+            events[name] = threading.Event()
+            futures[pool.submit(context.copy().run, call_with_cancel_event, events[name], _timed, started, name,
+                                call, target)] = name
+        queue_budget = timeout * math.ceil(len(futures) / max_workers)
+        queue_deadline = time.monotonic() + queue_budget
+        pending = set(futures)
+        while pending:
+            now = time.monotonic()
+            for future in list(pending):
+                name = futures[future]
+                if name in started and now >= started[name] + timeout:
+                    logger.error(f"Fan-out call to cluster {name} timed out after {timeout}s")
+                    errors[name] = error_response(f"Timed out after {timeout}s")
+                elif name not in started and now >= queue_deadline:
+                    logger.error(f"Fan-out call to cluster {name} did not start: all workers are busy")
+                    errors[name] = error_response(f"Not started within {queue_budget:g}s",
+                                                  "All fan-out workers were busy with calls that did not stop")
+                else:
+                    continue
+                pending.discard(future)
+                del futures[future]
+                events[name].set()
+            if not pending:
+                break
+            check_cancelled()
+            deadlines = [started[futures[future]] + timeout for future in pending if futures[future] in started]
+            next_deadline = min(deadlines + [queue_deadline])
+            _, pending = wait(pending, timeout=min(_WAIT_INTERVAL, max(0, next_deadline - now)),
+                              return_when=FIRST_COMPLETED)
+        for future, name in futures.items():
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.error(f"Fan-out call to cluster {name} failed: {e}")
+                errors[name] = error_response(f"Failed to query cluster {name}", str(e))
+                continue
+            if isinstance(result, dict) and "error" in result:
+                errors[name] = result
+            else:
+                results[name] = result
+    finally:
+        # Stop whatever is still running, e.g. when this call itself was cancelled.
+        for event in events.values():
+            event.set()
+        pool.shutdown(wait=False, cancel_futures=True)
+    return {"results": {name: results[name] for name in clusters if name in results},
+            "errors": {name: errors[name] for name in clusters if name in errors}}
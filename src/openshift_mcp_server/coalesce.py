@@ -0,0 +1,137 @@
+"""Deduplication of identical apiserver reads.
+
+Concurrent reads with the same key (the list function, which identifies the
+API client, verb and kind, plus its arguments and the requested
+representation) share one upstream request: the first caller makes it and
+the others wait for its result. Results can also be kept for a short TTL in
+an LRU cache of bounded size, so closely spaced repeats are answered locally.
+
+Shared results are decoded JSON that several callers read at once, so they
+must be treated as read-only.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from openshift_mcp_server.config import (
+    OPENSHIFT_MCP_COALESCE, OPENSHIFT_MCP_READ_CACHE_TTL, OPENSHIFT_MCP_READ_CACHE_SIZE
+)
+from openshift_mcp_server.errors import ToolCancelled
+from openshift_mcp_server.executor import check_cancelled
+from openshift_mcp_server.metrics import REGISTRY
+
+CACHE_HITS = REGISTRY.counter("mcp_read_cache_hits_total", "Apiserver reads answered from the TTL cache.")
+CACHE_MISSES = REGISTRY.counter("mcp_read_cache_misses_total", "Apiserver reads not found in the TTL cache.")
+COALESCED = REGISTRY.counter("mcp_read_coalesced_total", "Apiserver reads that joined an identical in-flight request.")
+
+# How often a waiting caller checks whether its own call was cancelled.
+_WAIT_INTERVAL = 0.1
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+class TTLCache:
+    """A size-capped LRU mapping whose entries expire ttl seconds after they are stored."""
+
+    def __init__(self, ttl: float, maxsize: int):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Return (True, value) for a live entry, else (False, None)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, entry[1]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if self.ttl <= 0 or self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class Coalescer:
+    """Singleflight in front of a TTL cache."""
+
+    def __init__(self, ttl: float = 0, maxsize: int = 256, enabled: bool = True):
+        self.enabled = enabled
+        self.cache = TTLCache(ttl, maxsize)
+        self._inflight: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Return fn()'s result, sharing it with identical concurrent and recent calls."""
+        if not self.enabled:
+            return fn()
+        if self.cache.ttl > 0:
+            hit, value = self.cache.get(key)
+            if hit:
+                CACHE_HITS.inc()
+                return value
+            CACHE_MISSES.inc()
+        while True:
+            with self._lock:
+                call = self._inflight.get(key)
+                leader = call is None
+                if leader:
+                    call = self._inflight[key] = _Call()
+            if leader:
+                break
+            COALESCED.inc()
+            while not call.done.wait(_WAIT_INTERVAL):
+                check_cancelled()
+            if isinstance(call.error, ToolCancelled):
+                # The leader's tool call was abandoned, not this one: make the read again, or join whoever does.
+                continue
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+            self.cache.put(key, call.result)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+            call.done.set()
+
+
+_coalescer = Coalescer(OPENSHIFT_MCP_READ_CACHE_TTL, OPENSHIFT_MCP_READ_CACHE_SIZE, OPENSHIFT_MCP_COALESCE)
+
+
+def get_coalescer() -> Coalescer:
+    return _coalescer
+
+
+def read_key(func: Callable, args: tuple, kwargs: dict, representation: Optional[str]) -> Hashable:
+    """Identity of a read: the (bound) API function, its arguments and the requested representation."""
+    return func, args, tuple(sorted(kwargs.items())), representation
@@ -6,3 +6,97 @@ def get_env_variable(name: str, default=None):
 OPENSHIFT_SERVER = get_env_variable('OPENSHIFT_SERVER')
 OPENSHIFT_USERNAME = get_env_variable('OPENSHIFT_USERNAME')
 OPENSHIFT_PASSWORD = get_env_variable('OPENSHIFT_PASSWORD')
+
+# More clusters the tools can address by name: "kubeconfig" for every kubeconfig context,
+# or comma-separated context names, plus the clusters of an optional YAML cluster file.
+OPENSHIFT_MCP_CLUSTERS = get_env_variable('OPENSHIFT_MCP_CLUSTERS', '')
+OPENSHIFT_MCP_CLUSTERS_FILE = get_env_variable('OPENSHIFT_MCP_CLUSTERS_FILE')
+# Per-cluster timeout in seconds and concurrency of query_clusters.
+OPENSHIFT_MCP_FANOUT_TIMEOUT = float(get_env_variable('OPENSHIFT_MCP_FANOUT_TIMEOUT', '30'))
+OPENSHIFT_MCP_FANOUT_WORKERS = int(get_env_variable('OPENSHIFT_MCP_FANOUT_WORKERS', '16'))
+
+# Comma-separated resource kinds (e.g. "pods,deployments,events") to serve from a
+# watch-backed in-memory cache instead of issuing a LIST per call. Empty disables it.
+OPENSHIFT_MCP_INFORMERS = get_env_variable('OPENSHIFT_MCP_INFORMERS', '')
+# Cached data older than this many seconds is not served; tools fall back to a live LIST.
+OPENSHIFT_MCP_INFORMER_MAX_STALENESS = float(get_env_variable('OPENSHIFT_MCP_INFORMER_MAX_STALENESS', '300'))
+# Server-side timeout of each WATCH request before the informer re-establishes it.
+OPENSHIFT_MCP_INFORMER_WATCH_TIMEOUT = int(get_env_variable('OPENSHIFT_MCP_INFORMER_WATCH_TIMEOUT', '300'))
+# Page size (apiserver `limit`) used when list tools walk a collection with `continue` tokens.
+OPENSHIFT_MCP_LIST_PAGE_SIZE = int(get_env_variable('OPENSHIFT_MCP_LIST_PAGE_SIZE', '500'))
+# How long get_changes watches for changes since its cursor before returning them.
+OPENSHIFT_MCP_CHANGES_WATCH_SECONDS = int(get_env_variable('OPENSHIFT_MCP_CHANGES_WATCH_SECONDS', '2'))
+
+# Run the blocking tools on a bounded thread pool so they do not stall the event loop.
+OPENSHIFT_MCP_ASYNC_TOOLS = get_env_variable('OPENSHIFT_MCP_ASYNC_TOOLS', 'true').lower() in ('1', 'true', 'yes')
+OPENSHIFT_MCP_TOOL_WORKERS = int(get_env_variable('OPENSHIFT_MCP_TOOL_WORKERS', '16'))
+# Default per-call timeout in seconds, and per-tool overrides as "get_pod_logs=120,list_events=30".
+OPENSHIFT_MCP_TOOL_TIMEOUT = float(get_env_variable('OPENSHIFT_MCP_TOOL_TIMEOUT', '60'))
+OPENSHIFT_MCP_TOOL_TIMEOUTS = {
+    name.strip(): float(value)
+    for name, _, value in (
+        item.partition('=') for item in get_env_variable('OPENSHIFT_MCP_TOOL_TIMEOUTS', '').split(',') if item.strip()
+    )
+}
+
+# Upper bound on the bytes of log returned by one get_pod_logs call, whatever limit_bytes asks for.
+OPENSHIFT_MCP_LOG_MAX_BYTES = int(get_env_variable('OPENSHIFT_MCP_LOG_MAX_BYTES', str(1024 * 1024)))
+OPENSHIFT_MCP_LOG_CHUNK_SIZE = int(get_env_variable('OPENSHIFT_MCP_LOG_CHUNK_SIZE', str(64 * 1024)))
+# How long a follow-mode log stream stays open before returning what it has.
+OPENSHIFT_MCP_LOG_FOLLOW_SECONDS = float(get_env_variable('OPENSHIFT_MCP_LOG_FOLLOW_SECONDS', '30'))
+# Concurrent log streams and total bytes read by one search_pod_logs call.
+OPENSHIFT_MCP_LOG_SEARCH_WORKERS = int(get_env_variable('OPENSHIFT_MCP_LOG_SEARCH_WORKERS', '8'))
+OPENSHIFT_MCP_LOG_SEARCH_MAX_BYTES = int(get_env_variable('OPENSHIFT_MCP_LOG_SEARCH_MAX_BYTES', str(64 * 1024 * 1024)))
+
+# Optional file to persist the OAuth token in (created with 0600 permissions) for fast restarts.
+OPENSHIFT_TOKEN_CACHE = get_env_variable('OPENSHIFT_TOKEN_CACHE')
+# Refresh the OAuth token this many seconds before it expires.
+OPENSHIFT_TOKEN_REFRESH_MARGIN = int(get_env_variable('OPENSHIFT_TOKEN_REFRESH_MARGIN', '300'))
+
+# HTTP connection pool of the shared ApiClient.
+OPENSHIFT_MCP_POOL_MAXSIZE = int(get_env_variable('OPENSHIFT_MCP_POOL_MAXSIZE', '32'))
+OPENSHIFT_MCP_TCP_KEEPALIVE = get_env_variable('OPENSHIFT_MCP_TCP_KEEPALIVE', 'true').lower() in ('1', 'true', 'yes')
+OPENSHIFT_MCP_TCP_KEEPALIVE_IDLE = int(get_env_variable('OPENSHIFT_MCP_TCP_KEEPALIVE_IDLE', '60'))
+# Default per-request timeouts in seconds, used when a call does not set its own.
+OPENSHIFT_MCP_CONNECT_TIMEOUT = float(get_env_variable('OPENSHIFT_MCP_CONNECT_TIMEOUT', '10'))
+OPENSHIFT_MCP_READ_TIMEOUT = float(get_env_variable('OPENSHIFT_MCP_READ_TIMEOUT', '60'))
+# Ask the apiserver for gzip-compressed responses.
+OPENSHIFT_MCP_HTTP_COMPRESSION = get_env_variable('OPENSHIFT_MCP_HTTP_COMPRESSION', 'false').lower() in ('1', 'true', 'yes')
+# Client-side rate limits of each cluster's requests as "METHOD=qps:burst" pairs, "*" for every other
+# method (empty disables). A cluster file entry can set its own with rate_limits.
+OPENSHIFT_MCP_RATE_LIMITS = get_env_variable('OPENSHIFT_MCP_RATE_LIMITS', '*=100:200')
+# Retries of GET requests rejected with 429/502/503/504 or failing to connect. Backoff is jittered and
+# exponential from RETRY_BASE, and Retry-After is honoured up to RETRY_MAX_WAIT seconds.
+OPENSHIFT_MCP_RETRIES = int(get_env_variable('OPENSHIFT_MCP_RETRIES', '3'))
+OPENSHIFT_MCP_RETRY_BASE = float(get_env_variable('OPENSHIFT_MCP_RETRY_BASE', '0.2'))
+OPENSHIFT_MCP_RETRY_MAX_WAIT = float(get_env_variable('OPENSHIFT_MCP_RETRY_MAX_WAIT', '10'))
+# Fail fast for BREAKER_COOLDOWN seconds after BREAKER_THRESHOLD consecutive failed requests (5xx or
+# connection errors) to one apiserver, then let one request through to probe it (0 disables).
+OPENSHIFT_MCP_BREAKER_THRESHOLD = int(get_env_variable('OPENSHIFT_MCP_BREAKER_THRESHOLD', '5'))
+OPENSHIFT_MCP_BREAKER_COOLDOWN = float(get_env_variable('OPENSHIFT_MCP_BREAKER_COOLDOWN', '30'))
+
+# Serve the Prometheus metrics over plain HTTP on this port as well (unset disables it), bound to this
+# address: loopback by default, since the metrics name the apiservers and the tools called.
+OPENSHIFT_MCP_METRICS_PORT = int(get_env_variable('OPENSHIFT_MCP_METRICS_PORT', '0')) or None
+OPENSHIFT_MCP_METRICS_HOST = get_env_variable('OPENSHIFT_MCP_METRICS_HOST', '127.0.0.1')
+# Share of structured tool responses serialized to measure their size (text responses are always measured).
+OPENSHIFT_MCP_METRICS_SIZE_SAMPLE = float(get_env_variable('OPENSHIFT_MCP_METRICS_SIZE_SAMPLE', '0.05'))
+
+# Share one apiserver request between identical concurrent reads.
+OPENSHIFT_MCP_COALESCE = get_env_variable('OPENSHIFT_MCP_COALESCE', 'true').lower() in ('1', 'true', 'yes')
+# Also keep read results for this many seconds (0 disables the cache), at most this many entries.
+OPENSHIFT_MCP_READ_CACHE_TTL = float(get_env_variable('OPENSHIFT_MCP_READ_CACHE_TTL', '0'))
+OPENSHIFT_MCP_READ_CACHE_SIZE = int(get_env_variable('OPENSHIFT_MCP_READ_CACHE_SIZE', '256'))
+
+# Security verdicts remembered per manifest content hash (0 disables the memo).
+OPENSHIFT_MCP_SECURITY_CACHE_SIZE = int(get_env_variable('OPENSHIFT_MCP_SECURITY_CACHE_SIZE', '4096'))
+# validate_manifests parses and checks YAML streams of at least this size on a pool of worker processes.
+OPENSHIFT_MCP_VALIDATE_PARALLEL_BYTES = int(get_env_variable('OPENSHIFT_MCP_VALIDATE_PARALLEL_BYTES', str(512 * 1024)))
+OPENSHIFT_MCP_VALIDATE_WORKERS = int(get_env_variable('OPENSHIFT_MCP_VALIDATE_WORKERS', str(min(4, os.cpu_count() or 1))))
+# Concurrent requests and requests per second of one apply_manifests call, and the field manager it applies as.
+OPENSHIFT_MCP_APPLY_CONCURRENCY = int(get_env_variable('OPENSHIFT_MCP_APPLY_CONCURRENCY', '8'))
+OPENSHIFT_MCP_APPLY_QPS = float(get_env_variable('OPENSHIFT_MCP_APPLY_QPS', '50'))
+OPENSHIFT_MCP_FIELD_MANAGER = get_env_variable('OPENSHIFT_MCP_FIELD_MANAGER', 'openshift-mcp-server')
+# Longest wait_for_rollout waits when the call does not pass timeout_seconds. Keep it below the tool's
+# timeout (OPENSHIFT_MCP_TOOL_TIMEOUTS) so the call returns the rollout's status instead of a timeout error.
+OPENSHIFT_MCP_ROLLOUT_TIMEOUT = float(get_env_variable('OPENSHIFT_MCP_ROLLOUT_TIMEOUT', '50'))
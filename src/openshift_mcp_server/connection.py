@@ -0,0 +1,94 @@
+"""Construction and tuning of the HTTP connection pool behind the shared ApiClient."""
+import socket
+from typing import List, Optional, Tuple
+
+from openshift_mcp_server.config import (
+    OPENSHIFT_MCP_POOL_MAXSIZE, OPENSHIFT_MCP_TCP_KEEPALIVE, OPENSHIFT_MCP_TCP_KEEPALIVE_IDLE,
+    OPENSHIFT_MCP_CONNECT_TIMEOUT, OPENSHIFT_MCP_READ_TIMEOUT, OPENSHIFT_MCP_HTTP_COMPRESSION,
+    OPENSHIFT_MCP_RATE_LIMITS, OPENSHIFT_MCP_RETRIES, OPENSHIFT_MCP_RETRY_BASE, OPENSHIFT_MCP_RETRY_MAX_WAIT,
+    OPENSHIFT_MCP_BREAKER_THRESHOLD, OPENSHIFT_MCP_BREAKER_COOLDOWN
+)
+from openshift_mcp_server.metrics import instrument_api_client
+from openshift_mcp_server.ratelimit import RateLimiter, parse_rate_limits
+from openshift_mcp_server.representation import apply_accept_override
+from openshift_mcp_server.resilience import CircuitBreaker, apply_resilience
+
+
+def keepalive_socket_options(idle: int) -> List[Tuple[int, int, int]]:
+    """TCP keep-alive options so idle pooled connections are not silently dropped by middleboxes."""
+    from urllib3.connection import HTTPConnection
+
+    options = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        options += [
+            (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, idle),
+            (socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, max(1, idle // 4)),
+            (socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 4),
+        ]
+    return options
+
+
+def apply_default_timeout(api_client, timeout: Tuple[float, float]) -> None:
+    """Give every request made through api_client a (connect, read) timeout unless it sets one."""
+    call_api = api_client.call_api
+
+    def call_api_with_timeout(*args, **kwargs):
+        if kwargs.get("_request_timeout") is None:
+            kwargs["_request_timeout"] = timeout
+        return call_api(*args, **kwargs)
+
+    api_client.call_api = call_api_with_timeout
+
+
+def create_api_client(configuration, rate_limits: Optional[str] = None):
+    """Build an ApiClient whose pool size, keep-alive, timeouts and compression follow the config.
+
+    Every request it makes is also recorded in the process metrics, and goes through
+    the client's own rate limiter (rate_limits, default OPENSHIFT_MCP_RATE_LIMITS),
+    retries and circuit breaker.
+    """
+    from kubernetes import client
+
+    configuration.connection_pool_maxsize = OPENSHIFT_MCP_POOL_MAXSIZE
+    # urllib3 would otherwise retry each request up to 3 times on its own, timed out reads and writes
+    # included; apply_resilience decides what is retried.
+    configuration.retries = False
+    api_client = client.ApiClient(configuration)
+    if OPENSHIFT_MCP_TCP_KEEPALIVE:
+        pool_kw = api_client.rest_client.pool_manager.connection_pool_kw
+        pool_kw["socket_options"] = keepalive_socket_options(OPENSHIFT_MCP_TCP_KEEPALIVE_IDLE)
+    if OPENSHIFT_MCP_HTTP_COMPRESSION:
+        api_client.set_default_header("Accept-Encoding", "gzip")
+    apply_default_timeout(api_client, (OPENSHIFT_MCP_CONNECT_TIMEOUT, OPENSHIFT_MCP_READ_TIMEOUT))
+    apply_accept_override(api_client)
+    instrument_api_client(api_client)
+    breaker = None
+    if OPENSHIFT_MCP_BREAKER_THRESHOLD > 0:
+        breaker = CircuitBreaker(configuration.host, OPENSHIFT_MCP_BREAKER_THRESHOLD, OPENSHIFT_MCP_BREAKER_COOLDOWN)
+    limiter = RateLimiter(parse_rate_limits(OPENSHIFT_MCP_RATE_LIMITS if rate_limits is None else rate_limits))
+    apply_resilience(api_client, limiter, breaker, OPENSHIFT_MCP_RETRIES, OPENSHIFT_MCP_RETRY_BASE,
+                     OPENSHIFT_MCP_RETRY_MAX_WAIT)
+    return api_client
+
+
+def pool_stats(api_client) -> dict:
+    """Utilization of each per-host connection pool of api_client."""
+    pool_manager = api_client.rest_client.pool_manager
+    pools = []
+    for key in pool_manager.pools.keys():
+        pool = pool_manager.pools.get(key)
+        if pool is None:
+            continue
+        # The queue is pre-filled with None placeholders; real idle connections are the rest.
+        queued = list(pool.pool.queue) if pool.pool is not None else []
+        maxsize = pool.pool.maxsize if pool.pool is not None else 0
+        pools.append({
+            "host": pool.host,
+            "port": pool.port,
+            "maxsize": maxsize,
+            "in_use": maxsize - len(queued),
+            "idle": sum(1 for conn in queued if conn is not None),
+            "connections_opened": pool.num_connections,
+            "requests": pool.num_requests,
+        })
+    return {"pools": pools}
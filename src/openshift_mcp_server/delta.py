@@ -0,0 +1,149 @@
+"""Incremental reads of a collection driven by resourceVersion.
+
+A first call lists the collection and returns an opaque cursor recording the
+kind, namespace, selectors and the resourceVersion of that list. A later call
+with the cursor opens a short WATCH from that resourceVersion and returns only
+what was ADDED, MODIFIED or DELETED since, with a new cursor. When the
+apiserver no longer has the history (410 Gone) the collection is listed again.
+"""
+import base64
+import json
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from openshift_mcp_server.config import OPENSHIFT_MCP_CONNECT_TIMEOUT
+from openshift_mcp_server.executor import check_cancelled
+from openshift_mcp_server.fastjson import loads
+from openshift_mcp_server.informer import HTTP_GONE
+from openshift_mcp_server.kinds import ResourceKind
+from openshift_mcp_server.pagination import continue_token, page_items, read_json
+
+
+class ResourceVersionExpired(Exception):
+    """The cursor's resourceVersion is older than the history the apiserver keeps."""
+
+
+def encode_cursor(kind: str, namespace: Optional[str], resource_version: str,
+                  label_selector: Optional[str] = None, field_selector: Optional[str] = None) -> str:
+    state = {"k": kind, "n": namespace, "rv": resource_version, "l": label_selector, "f": field_selector}
+    return base64.urlsafe_b64encode(json.dumps(state, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """Return {"kind", "namespace", "resource_version", "label_selector", "field_selector"} of a cursor."""
+    try:
+        state = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return {
+            "kind": state["k"], "namespace": state["n"], "resource_version": state["rv"],
+            "label_selector": state["l"], "field_selector": state["f"],
+        }
+    except (ValueError, KeyError, TypeError):
+        raise ValueError("Invalid changes cursor; call again without a cursor to start over")
+
+
+def collection(app_context: Any, kind: ResourceKind, namespace: Optional[str]) -> Tuple[Callable, dict]:
+    """The list function (and its keyword args) for a kind in a namespace, or across all namespaces."""
+    api = getattr(app_context, kind.api)
+    if namespace and kind.namespaced:
+        return getattr(api, kind.list_namespaced), {"namespace": namespace, **kind.list_kwargs}
+    return getattr(api, kind.list_all), dict(kind.list_kwargs)
+
+
+def list_collection(list_func: Callable, *args, page_size: int, **kwargs) -> Tuple[List[dict], str]:
+    """Every item of a collection plus the resourceVersion the list is consistent with."""
+    items: List[dict] = []
+    resource_version = None
+    cursor = None
+    while True:
+        check_cancelled()
+        body = read_json(list_func, *args, limit=page_size, _continue=cursor, **kwargs)
+        # All pages of a chunked list are served from the first page's snapshot.
+        if resource_version is None:
+            resource_version = body.get("metadata", {}).get("resourceVersion")
+        items.extend(page_items(body))
+        cursor = continue_token(body)
+        if not cursor:
+            return items, resource_version
+
+
+def _key(obj: dict) -> Tuple[str, str]:
+    metadata = obj.get("metadata") or {}
+    return metadata.get("namespace", ""), metadata.get("name")
+
+
+class Watch:
+    """One WATCH request from a resourceVersion, iterated as (type, object) events.
+
+    Bookmarks are consumed silently, but like every event they advance
+    resource_version, from which a new watch can resume. Raises
+    ResourceVersionExpired on 410 Gone. close() may be called from another thread
+    to end a watch that is blocked waiting for events.
+    """
+
+    def __init__(self, list_func: Callable, *args, resource_version: str, timeout_seconds: int, **kwargs):
+        from kubernetes.client.rest import ApiException
+
+        self.resource_version = resource_version
+        try:
+            self._response = list_func(
+                *args,
+                watch=True,
+                resource_version=resource_version,
+                allow_watch_bookmarks=True,
+                timeout_seconds=timeout_seconds,
+                _preload_content=False,
+                _request_timeout=(OPENSHIFT_MCP_CONNECT_TIMEOUT, timeout_seconds + 10),
+                **kwargs
+            )
+        except ApiException as e:
+            if e.status == HTTP_GONE:
+                raise ResourceVersionExpired(str(e))
+            raise
+
+    def __iter__(self) -> Iterator[Tuple[str, dict]]:
+        from kubernetes.client.rest import ApiException
+        from kubernetes.watch.watch import iter_resp_lines
+
+        try:
+            for line in iter_resp_lines(self._response):
+                check_cancelled()
+                if not line or line.isspace():
+                    continue
+                event = loads(line)
+                event_type, obj = event["type"], event["object"]
+                if event_type == "ERROR":
+                    if obj.get("code") == HTTP_GONE:
+                        raise ResourceVersionExpired(obj.get("message"))
+                    raise ApiException(status=obj.get("code"), reason=f"{obj.get('reason')}: {obj.get('message')}")
+                self.resource_version = (obj.get("metadata") or {}).get("resourceVersion", self.resource_version)
+                if event_type != "BOOKMARK":
+                    yield event_type, obj
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        self._response.close()
+
+
+def watch_changes(list_func: Callable, *args, resource_version: str, timeout_seconds: int,
+                  **kwargs) -> Tuple[List[Tuple[str, dict]], str]:
+    """Watch from resource_version for timeout_seconds and return ([(type, object), ...], new resourceVersion).
+
+    Several events for one object are folded into one: the last state is kept, an
+    object added and deleted within the window is dropped, and one added then
+    modified is reported as ADDED, and one deleted and recreated as MODIFIED.
+    Raises ResourceVersionExpired on 410 Gone.
+    """
+    watch = Watch(list_func, *args, resource_version=resource_version, timeout_seconds=timeout_seconds, **kwargs)
+    changes: Dict[Tuple[str, str], Tuple[str, dict]] = {}
+    for event_type, obj in watch:
+        key = _key(obj)
+        previous = changes.get(key, (None, None))[0]
+        if previous == "ADDED" and event_type == "DELETED":
+            del changes[key]
+        elif previous == "ADDED":
+            changes[key] = ("ADDED", obj)
+        elif previous == "DELETED" and event_type == "ADDED":
+            changes[key] = ("MODIFIED", obj)
+        else:
+            changes[key] = (event_type, obj)
+    return list(changes.values()), watch.resource_version
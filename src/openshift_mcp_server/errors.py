@@ -7,3 +7,15 @@ def error_response(message: str, details: str = None) -> dict:
 class MCPError(Exception):
     """Base class for MCP server errors."""
     pass
+
+class ToolCancelled(MCPError):
+    """Raised inside a tool when its caller has gone away or its timeout expired."""
+    pass
+
+class AuthenticationError(MCPError):
+    """Raised when an OpenShift OAuth token cannot be obtained."""
+    pass
+
+class CircuitOpenError(MCPError):
+    """Raised instead of sending a request to an apiserver that keeps failing, until its cooldown ends."""
+    pass
@@ -0,0 +1,110 @@
+"""Aggregation of Kubernetes events into one record per (involved object, reason, type).
+
+Events are fed in one at a time (e.g. straight from a paged LIST), and each group
+keeps only its counters, its first/last timestamps and its latest message. Memory
+therefore grows with the number of distinct groups, not the number of events.
+"""
+import heapq
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+GroupKey = Tuple[str, str, str, str]
+
+
+def parse_time(value: Optional[str]) -> Optional[datetime]:
+    """Parse an RFC 3339 timestamp as the apiserver writes it (with or without fractional seconds)."""
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def event_times(event: dict) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """(first seen, last seen) of an event, from the core/v1 fields or the events.k8s.io series fields."""
+    series = event.get("series") or {}
+    first = parse_time(event.get("firstTimestamp") or event.get("eventTime")
+                       or (event.get("metadata") or {}).get("creationTimestamp"))
+    last = parse_time(series.get("lastObservedTime") or event.get("lastTimestamp") or event.get("eventTime"))
+    return first or last, last or first
+
+
+def event_count(event: dict) -> int:
+    return event.get("count") or (event.get("series") or {}).get("count") or 1
+
+
+class EventGroup:
+    """Running totals of the events that share an involved object, reason and type."""
+    __slots__ = ("events", "count", "first_seen", "last_seen", "message")
+
+    def __init__(self):
+        self.events = 0
+        self.count = 0
+        self.first_seen: Optional[datetime] = None
+        self.last_seen: Optional[datetime] = None
+        self.message: Optional[str] = None
+
+    def add(self, event: dict, first: Optional[datetime], last: Optional[datetime]) -> None:
+        self.events += 1
+        self.count += event_count(event)
+        if first is not None and (self.first_seen is None or first < self.first_seen):
+            self.first_seen = first
+        if last is not None and (self.last_seen is None or last >= self.last_seen):
+            self.last_seen = last
+            self.message = event.get("message")
+        elif self.message is None:
+            self.message = event.get("message")
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ") if value is not None else None
+
+
+class EventAggregator:
+    """Group events by involved object, reason and type, optionally within a time window."""
+
+    def __init__(self, since: Optional[datetime] = None, event_type: Optional[str] = None):
+        self.since = since
+        self.event_type = event_type
+        self.groups: Dict[GroupKey, EventGroup] = {}
+        self.seen = 0
+        self.matched = 0
+
+    def add(self, event: dict) -> None:
+        self.seen += 1
+        if self.event_type and event.get("type") != self.event_type:
+            return
+        first, last = event_times(event)
+        if self.since is not None and (last is None or last < self.since):
+            return
+        self.matched += 1
+        obj = event.get("involvedObject") or event.get("regarding") or {}
+        key = (obj.get("kind") or "", obj.get("name") or "", event.get("reason") or "", event.get("type") or "")
+        group = self.groups.get(key)
+        if group is None:
+            group = self.groups[key] = EventGroup()
+        group.add(event, first, last)
+
+    def extend(self, events: Iterable[dict]) -> "EventAggregator":
+        for event in events:
+            self.add(event)
+        return self
+
+    def top(self, n: int) -> List[dict]:
+        """The n groups with the most occurrences (most recent first on ties), as compact records."""
+        def rank(item):
+            group = item[1]
+            return group.count, group.last_seen or datetime.min.replace(tzinfo=timezone.utc)
+
+        records = []
+        for (kind, name, reason, event_type), group in heapq.nlargest(n, self.groups.items(), key=rank):
+            records.append({
+                "object": f"{kind}/{name}",
+                "reason": reason,
+                "type": event_type,
+                "count": group.count,
+                "events": group.events,
+                "first_seen": _isoformat(group.first_seen),
+                "last_seen": _isoformat(group.last_seen),
+                "message": group.message,
+            })
+        return records
@@ -0,0 +1,119 @@
+"""Runs the blocking tools on a bounded thread pool instead of the event loop.
+
+Each wrapped call gets its own cancellation event. When the awaiting task is
+cancelled (the client disconnected or cancelled the request) or the per-tool
+timeout expires, the event is set and long-running loops inside the tool stop
+at their next check_cancelled() call.
+"""
+import asyncio
+import contextvars
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from openshift_mcp_server.config import (
+    OPENSHIFT_MCP_TOOL_WORKERS, OPENSHIFT_MCP_TOOL_TIMEOUT, OPENSHIFT_MCP_TOOL_TIMEOUTS
+)
+from openshift_mcp_server.errors import ToolCancelled, error_response
+from openshift_mcp_server.logging_utils import logger
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+_cancel_event: contextvars.ContextVar[Optional[threading.Event]] = contextvars.ContextVar(
+    "cancel_event", default=None
+)
+_event_loop: contextvars.ContextVar[Optional[asyncio.AbstractEventLoop]] = contextvars.ContextVar(
+    "event_loop", default=None
+)
+
+
+def get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=OPENSHIFT_MCP_TOOL_WORKERS, thread_name_prefix="mcp-tool")
+        return _executor
+
+
+def tool_timeout(name: str) -> float:
+    return OPENSHIFT_MCP_TOOL_TIMEOUTS.get(name, OPENSHIFT_MCP_TOOL_TIMEOUT)
+
+
+def check_cancelled() -> None:
+    """Raise ToolCancelled if the tool call running in this thread has been abandoned."""
+    event = _cancel_event.get()
+    if event is not None and event.is_set():
+        raise ToolCancelled("Tool call was cancelled")
+
+
+def sleep(seconds: float) -> None:
+    """time.sleep() that ends early with ToolCancelled when the tool call running in this thread is abandoned."""
+    event = _cancel_event.get()
+    if event is None:
+        time.sleep(seconds)
+    elif event.wait(seconds):
+        raise ToolCancelled("Tool call was cancelled")
+
+
+def call_with_cancel_event(event: threading.Event, func: Callable, *args, **kwargs):
+    """Run func with its own cancellation event, e.g. to time out one branch of a fan-out.
+
+    Call it inside a copied context so the event does not leak to the caller.
+    """
+    _cancel_event.set(event)
+    return func(*args, **kwargs)
+
+
+def emit(coro_func: Callable, *args, **kwargs) -> bool:
+    """Fire-and-forget an async notification (e.g. ctx.info) from inside a blocking tool.
+
+    Works both on a pool thread and when the tool runs inline on the event loop.
+    Returns False when there is no event loop to deliver it on.
+    """
+    loop = _event_loop.get()
+    if loop is not None:
+        asyncio.run_coroutine_threadsafe(coro_func(*args, **kwargs), loop)
+        return True
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    loop.create_task(coro_func(*args, **kwargs))
+    return True
+
+
+def report_partial(ctx, message: str) -> bool:
+    """Send part of a tool's output to the client early, as an MCP log notification."""
+    send = getattr(ctx, "info", None)
+    if send is None:
+        return False
+    return emit(send, message)
+
+
+def run_in_executor(func: Callable, timeout: Optional[float] = None) -> Callable:
+    """Wrap a blocking tool in a coroutine that runs it on the shared thread pool.
+
+    The wrapper keeps func's name, docstring and signature so FastMCP derives the
+    same tool schema from it.
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        loop = asyncio.get_running_loop()
+        cancelled = threading.Event()
+        context = contextvars.copy_context()
+        context.run(_cancel_event.set, cancelled)
+        context.run(_event_loop.set, loop)
+        call = functools.partial(context.run, func, *args, **kwargs)
+        try:
+            return await asyncio.wait_for(loop.run_in_executor(get_executor(), call), timeout)
+        except asyncio.TimeoutError:
+            cancelled.set()
+            logger.error(f"{func.__name__} timed out after {timeout}s")
+            return error_response(f"{func.__name__} timed out after {timeout}s")
+        except asyncio.CancelledError:
+            cancelled.set()
+            logger.info(f"{func.__name__} was cancelled by the client")
+            raise
+    return wrapper
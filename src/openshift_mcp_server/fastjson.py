@@ -0,0 +1,27 @@
+"""JSON decoding for raw apiserver responses.
+
+Uses orjson when it is installed and falls back to the standard library otherwise.
+"""
+try:
+    import orjson
+
+    def loads(data):
+        return orjson.loads(data)
+
+    def dumps(obj) -> bytes:
+        return orjson.dumps(obj, default=str)
+except ImportError:  # pragma: no cover - depends on the environment
+    import json
+
+    def loads(data):
+        return json.loads(data)
+
+    def dumps(obj) -> bytes:
+        return json.dumps(obj, default=str).encode()
+
+
+def dumped_size(obj) -> int:
+    """Size in bytes of obj serialized as JSON (non-JSON values are stringified)."""
+    if isinstance(obj, str):
+        return len(obj.encode())
+    return len(dumps(obj))
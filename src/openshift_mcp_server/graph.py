@@ -0,0 +1,211 @@
+"""In-memory index of the relationships between workload objects.
+
+Two kinds of edges are kept:
+
+- ownership, from ownerReferences: Deployment -> ReplicaSet -> Pod, CronJob -> Job -> Pod, ...
+- selection, from label selectors and route targets: Route -> Service -> Pods
+
+so "which deployment owns this pod" and "which pods serve this route" are answered
+from dict and set lookups instead of chained API calls. The index is either fed
+incrementally by the informers of the kinds it covers (see attach) or loaded from
+one-off lists of a namespace.
+"""
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+# Kinds held in the index, by informer kind name.
+GRAPH_KINDS = {"pods": "Pod", "replicasets": "ReplicaSet", "jobs": "Job", "services": "Service", "routes": "Route"}
+
+# Kinds each query needs in the index.
+OWNER_KINDS = ("pods", "replicasets", "jobs")
+BACKING_KINDS = {
+    "Pod": ("pods",),
+    "Service": ("pods", "services"),
+    "Route": ("pods", "services", "routes"),
+}  # any other kind is a controller and needs OWNER_KINDS
+
+Key = Tuple[str, str, str]  # (kind, namespace, name)
+
+
+# Controllers that own pods directly or through the kinds above.
+CONTROLLER_KINDS = ("Deployment", "ReplicaSet", "StatefulSet", "DaemonSet", "Job", "CronJob",
+                    "ReplicationController", "DeploymentConfig")
+
+# Lower-cased singular and plural names of every kind the queries accept, to their Kind.
+_KIND_NAMES = {
+    name.lower(): kind
+    for kind in {*GRAPH_KINDS.values(), *CONTROLLER_KINDS}
+    for name in (kind, kind + "s")
+}
+
+
+def normalize_kind(kind: str) -> str:
+    """Map "statefulset", "statefulsets" or "StatefulSet" (and so on) to the Kind name used in ownerReferences."""
+    kind_name = _KIND_NAMES.get(kind.lower())
+    if kind_name is None:
+        raise ValueError(f"Unknown kind '{kind}'. Available: {', '.join(sorted(set(_KIND_NAMES.values())))}")
+    return kind_name
+
+
+class _Node:
+    __slots__ = ("labels", "owners", "selector", "backends")
+
+    def __init__(self, labels: Dict[str, str], owners: List[Tuple[str, str]], selector: Optional[Dict[str, str]],
+                 backends: List[str]):
+        self.labels = labels
+        self.owners = owners
+        self.selector = selector
+        self.backends = backends
+
+
+def _node(kind: str, obj: dict) -> _Node:
+    metadata = obj.get("metadata") or {}
+    refs = metadata.get("ownerReferences") or []
+    # The managing controller first, so owner chains follow it.
+    refs = sorted(refs, key=lambda ref: not ref.get("controller"))
+    spec = obj.get("spec") or {}
+    selector = spec.get("selector") if kind == "Service" else None
+    backends = []
+    if kind == "Route":
+        backends = [backend.get("name") for backend in [spec.get("to") or {}, *(spec.get("alternateBackends") or [])]
+                    if backend.get("kind", "Service") == "Service" and backend.get("name")]
+    return _Node(metadata.get("labels") or {}, [(ref.get("kind"), ref.get("name")) for ref in refs], selector, backends)
+
+
+class RelationshipIndex:
+    """Owner and selector edges between pods, replicasets, jobs, services and routes."""
+
+    def __init__(self):
+        self._nodes: Dict[Key, _Node] = {}
+        self._children: Dict[Key, Set[Key]] = {}
+        self._pods_by_label: Dict[Tuple[str, str, str], Set[str]] = {}
+        self._lock = threading.RLock()
+        self._covered: Callable[[str], bool] = lambda kind: False
+
+    @classmethod
+    def attach(cls, informers) -> "RelationshipIndex":
+        """An index kept current by the informers of the graph kinds that are cached."""
+        index = cls()
+        for name, kind in GRAPH_KINDS.items():
+            informer = informers.informers.get(name)
+            if informer is not None:
+                informer.add_handler(
+                    lambda event_type, obj, kind=kind: index.apply(kind, event_type, obj),
+                    lambda objs, kind=kind: index.load(kind, objs),
+                )
+        index._covered = lambda name: informers.get(name) is not None
+        return index
+
+    def covers(self, kinds: Iterable[str]) -> bool:
+        """Whether every kind is fed by a synced, fresh informer."""
+        return all(self._covered(kind) for kind in kinds)
+
+    def load(self, kind: str, objs: Iterable[dict]) -> None:
+        """Replace every object of kind with objs (a full list)."""
+        with self._lock:
+            for key in [key for key in self._nodes if key[0] == kind]:
+                self._remove(key)
+            for obj in objs:
+                self._add(kind, obj)
+
+    def apply(self, kind: str, event_type: str, obj: dict) -> None:
+        """Apply one watch event."""
+        metadata = obj.get("metadata") or {}
+        key = (kind, metadata.get("namespace", ""), metadata.get("name"))
+        with self._lock:
+            self._remove(key)
+            if event_type in ("ADDED", "MODIFIED"):
+                self._add(kind, obj)
+
+    def _add(self, kind: str, obj: dict) -> None:
+        metadata = obj.get("metadata") or {}
+        namespace, name = metadata.get("namespace", ""), metadata.get("name")
+        key = (kind, namespace, name)
+        node = self._nodes[key] = _node(kind, obj)
+        for owner_kind, owner_name in node.owners:
+            self._children.setdefault((owner_kind, namespace, owner_name), set()).add(key)
+        if kind == "Pod":
+            for label in node.labels.items():
+                self._pods_by_label.setdefault((namespace, *label), set()).add(name)
+
+    def _remove(self, key: Key) -> None:
+        node = self._nodes.pop(key, None)
+        if node is None:
+            return
+        kind, namespace, name = key
+        for owner_kind, owner_name in node.owners:
+            owner = (owner_kind, namespace, owner_name)
+            children = self._children.get(owner)
+            if children is not None:
+                children.discard(key)
+                if not children:
+                    del self._children[owner]
+        if kind == "Pod":
+            for label in node.labels.items():
+                pods = self._pods_by_label.get((namespace, *label))
+                if pods is not None:
+                    pods.discard(name)
+                    if not pods:
+                        del self._pods_by_label[(namespace, *label)]
+
+    def owner_chain(self, kind: str, namespace: str, name: str) -> List[dict]:
+        """[object, its controller, that one's controller, ...]; owners outside the index end the chain."""
+        chain = [{"kind": kind, "name": name}]
+        seen = {(kind, name)}
+        with self._lock:
+            node = self._nodes.get((kind, namespace, name))
+            while node is not None and node.owners:
+                kind, name = node.owners[0]
+                if (kind, name) in seen:
+                    break
+                seen.add((kind, name))
+                chain.append({"kind": kind, "name": name})
+                node = self._nodes.get((kind, namespace, name))
+        return chain
+
+    def _selected_pods(self, namespace: str, selector: Dict[str, str]) -> Set[str]:
+        # A service without a selector has no automatically managed endpoints.
+        if not selector:
+            return set()
+        sets = sorted((self._pods_by_label.get((namespace, *label), set()) for label in selector.items()), key=len)
+        return set.intersection(*sets) if sets[0] else set()
+
+    def backing_pods(self, kind: str, namespace: str, name: str) -> dict:
+        """The pods behind an object: {"pods": [...], "services": [...] for routes} or {"found": False}."""
+        key = (kind, namespace, name)
+        with self._lock:
+            if kind == "Pod":
+                return {"pods": [name]} if key in self._nodes else {"pods": [], "found": False}
+            if kind == "Service":
+                node = self._nodes.get(key)
+                if node is None:
+                    return {"pods": [], "found": False}
+                return {"pods": sorted(self._selected_pods(namespace, node.selector))}
+            if kind == "Route":
+                node = self._nodes.get(key)
+                if node is None:
+                    return {"pods": [], "found": False}
+                pods: Set[str] = set()
+                for service in node.backends:
+                    backend = self._nodes.get(("Service", namespace, service))
+                    if backend is not None:
+                        pods |= self._selected_pods(namespace, backend.selector)
+                return {"pods": sorted(pods), "services": node.backends}
+            # A controller: walk the ownership tree down to its pods. Controllers above the indexed
+            # kinds (Deployment, StatefulSet, ...) are only known by the objects they own.
+            if key not in self._nodes and key not in self._children:
+                return {"pods": [], "found": False}
+            pods = set()
+            stack = [key]
+            seen = {key}
+            while stack:
+                for child in self._children.get(stack.pop(), ()):
+                    if child in seen:
+                        continue
+                    seen.add(child)
+                    if child[0] == "Pod":
+                        pods.add(child[2])
+                    else:
+                        stack.append(child)
+            return {"pods": sorted(pods)}
+
@@ -0,0 +1,210 @@
+"""Watch-backed informer cache for the list tools.
+
+Each informer does one LIST of its kind across all namespaces, then follows a
+WATCH from the returned resourceVersion and applies every event to an
+in-memory store indexed by namespace. Bookmarks advance the resourceVersion
+without touching the store; a 410 Gone (expired resourceVersion) triggers a
+fresh LIST.
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from openshift_mcp_server.config import OPENSHIFT_MCP_CONNECT_TIMEOUT
+from openshift_mcp_server.fastjson import loads
+from openshift_mcp_server.kinds import ResourceKind, get_kind
+from openshift_mcp_server.logging_utils import logger
+
+HTTP_GONE = 410
+MAX_BACKOFF_SECONDS = 30
+
+
+class Informer:
+    """Keeps an in-memory, namespace-indexed copy of one resource kind."""
+
+    def __init__(self, kind: ResourceKind, list_func: Callable, watch_timeout: int = 300):
+        self.kind = kind
+        self._list_func = list_func
+        self._watch_timeout = watch_timeout
+        self._store: Dict[str, Dict[str, dict]] = {}
+        self._lock = threading.Lock()
+        self._resource_version: Optional[str] = None
+        self._last_sync: Optional[float] = None
+        self._synced = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._response = None
+        self._handlers: List[Tuple[Callable[[str, dict], None], Callable[[List[dict]], None]]] = []
+
+    def add_handler(self, on_event: Callable[[str, dict], None], on_relist: Callable[[List[dict]], None]) -> None:
+        """Call on_relist(objects) after every LIST and on_event(type, object) after every watch event."""
+        self._handlers.append((on_event, on_relist))
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name=f"informer-{self.kind.name}", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        response = self._response
+        if response is not None:
+            response.close()
+
+    def has_synced(self) -> bool:
+        return self._synced.is_set()
+
+    @property
+    def staleness(self) -> Optional[float]:
+        """Seconds since the store was last confirmed current by the apiserver."""
+        if self._last_sync is None:
+            return None
+        return time.monotonic() - self._last_sync
+
+    def list(self, namespace: Optional[str] = None) -> List[dict]:
+        """Return cached objects in a namespace, or across all namespaces if none is given."""
+        with self._lock:
+            if namespace is None:
+                objs = [obj for bucket in self._store.values() for obj in bucket.values()]
+            else:
+                objs = list(self._store.get(namespace, {}).values())
+        # Match the apiserver's LIST ordering so cached and live answers look the same.
+        return sorted(objs, key=lambda obj: (obj["metadata"].get("namespace", ""), obj["metadata"]["name"]))
+
+    def status(self) -> dict:
+        staleness = self.staleness
+        with self._lock:
+            count = sum(len(bucket) for bucket in self._store.values())
+        return {
+            "synced": self.has_synced(),
+            "staleness_seconds": round(staleness, 3) if staleness is not None else None,
+            "resource_version": self._resource_version,
+            "objects": count,
+        }
+
+    def _run(self) -> None:
+        backoff = 1
+        while not self._stopped.is_set():
+            try:
+                if self._resource_version is None:
+                    self._relist()
+                self._watch()
+                backoff = 1
+            except Exception as e:
+                if self._stopped.is_set():
+                    break
+                if getattr(e, 'status', None) == HTTP_GONE:
+                    logger.info(f"{self.kind.name} informer resourceVersion expired, relisting")
+                    self._resource_version = None
+                    continue
+                logger.warning(f"{self.kind.name} informer failed, retrying in {backoff}s: {e}")
+                self._stopped.wait(backoff)
+                backoff = min(backoff * 2, MAX_BACKOFF_SECONDS)
+
+    def _relist(self) -> None:
+        response = self._list_func(_preload_content=False, **self.kind.list_kwargs)
+        body = loads(response.data)
+        store: Dict[str, Dict[str, dict]] = {}
+        for obj in body.get("items") or []:
+            metadata = obj.get("metadata", {})
+            store.setdefault(metadata.get("namespace", ""), {})[metadata.get("name")] = obj
+        with self._lock:
+            self._store = store
+            self._resource_version = body.get("metadata", {}).get("resourceVersion")
+            self._last_sync = time.monotonic()
+        for _, on_relist in self._handlers:
+            self._notify(on_relist, body.get("items") or [])
+        self._synced.set()
+        logger.info(f"{self.kind.name} informer listed {sum(len(b) for b in store.values())} objects")
+
+    def _watch(self) -> None:
+        from kubernetes.watch.watch import iter_resp_lines
+
+        self._response = self._list_func(
+            watch=True,
+            resource_version=self._resource_version,
+            allow_watch_bookmarks=True,
+            timeout_seconds=self._watch_timeout,
+            _preload_content=False,
+            # Quiet watches only get a bookmark now and then; outlast the server-side timeout.
+            _request_timeout=(OPENSHIFT_MCP_CONNECT_TIMEOUT, self._watch_timeout + 30),
+            **self.kind.list_kwargs
+        )
+        try:
+            for line in iter_resp_lines(self._response):
+                if self._stopped.is_set():
+                    break
+                if line and not line.isspace():
+                    event = loads(line)
+                    self._apply(event["type"], event["object"])
+            else:
+                # The watch timed out cleanly; everything up to here is current.
+                self._last_sync = time.monotonic()
+        finally:
+            self._response.close()
+            self._response = None
+
+    def _apply(self, event_type: str, obj: dict) -> None:
+        if event_type == "ERROR":
+            from kubernetes.client.rest import ApiException
+            raise ApiException(status=obj.get("code"), reason=f"{obj.get('reason')}: {obj.get('message')}")
+        metadata = obj.get("metadata", {})
+        namespace = metadata.get("namespace", "")
+        name = metadata.get("name")
+        with self._lock:
+            if event_type in ("ADDED", "MODIFIED"):
+                self._store.setdefault(namespace, {})[name] = obj
+            elif event_type == "DELETED":
+                bucket = self._store.get(namespace, {})
+                bucket.pop(name, None)
+                if not bucket:
+                    self._store.pop(namespace, None)
+            self._resource_version = metadata.get("resourceVersion", self._resource_version)
+            self._last_sync = time.monotonic()
+        if event_type != "BOOKMARK":
+            for on_event, _ in self._handlers:
+                self._notify(on_event, event_type, obj)
+
+    def _notify(self, handler: Callable, *args) -> None:
+        # A failing handler must not stop the informer.
+        try:
+            handler(*args)
+        except Exception as e:
+            logger.warning(f"{self.kind.name} informer handler failed: {e}")
+
+
+class InformerCache:
+    """The set of informers running for one AppContext, keyed by kind name."""
+
+    def __init__(self, informers: Iterable[Informer], max_staleness: Optional[float] = None):
+        self.informers: Dict[str, Informer] = {inf.kind.name: inf for inf in informers}
+        self.max_staleness = max_staleness
+
+    @classmethod
+    def for_context(cls, app_context: Any, kinds: Iterable[str], watch_timeout: int = 300,
+                    max_staleness: Optional[float] = None) -> "InformerCache":
+        informers = []
+        for name in kinds:
+            kind = get_kind(name)
+            api = getattr(app_context, kind.api)
+            informers.append(Informer(kind, getattr(api, kind.list_all), watch_timeout))
+        return cls(informers, max_staleness)
+
+    def start(self) -> None:
+        for informer in self.informers.values():
+            informer.start()
+
+    def stop(self) -> None:
+        for informer in self.informers.values():
+            informer.stop()
+
+    def get(self, kind: str) -> Optional[Informer]:
+        """Return the informer for a kind if it is synced and fresh enough to serve."""
+        informer = self.informers.get(kind)
+        if informer is None or not informer.has_synced():
+            return None
+        if self.max_staleness is not None and informer.staleness > self.max_staleness:
+            return None
+        return informer
+
+    def status(self) -> Dict[str, dict]:
+        return {name: informer.status() for name, informer in self.informers.items()}
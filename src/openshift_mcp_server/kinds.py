@@ -0,0 +1,51 @@
+"""Registry of the resource kinds the server lists and watches."""
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+
+@dataclass(frozen=True)
+class ResourceKind:
+    """How to reach one resource kind through the APIs held by AppContext."""
+    name: str
+    api: str
+    list_all: str
+    list_namespaced: Optional[str] = None
+    list_kwargs: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def namespaced(self) -> bool:
+        return self.list_namespaced is not None
+
+
+_ROUTE_KWARGS = {"group": "route.openshift.io", "version": "v1", "plural": "routes"}
+
+RESOURCE_KINDS: Dict[str, ResourceKind] = {kind.name: kind for kind in [
+    ResourceKind("namespaces", "k8s_api", "list_namespace"),
+    ResourceKind("pods", "k8s_api", "list_pod_for_all_namespaces", "list_namespaced_pod"),
+    ResourceKind("services", "k8s_api", "list_service_for_all_namespaces", "list_namespaced_service"),
+    ResourceKind("configmaps", "k8s_api", "list_config_map_for_all_namespaces", "list_namespaced_config_map"),
+    ResourceKind("secrets", "k8s_api", "list_secret_for_all_namespaces", "list_namespaced_secret"),
+    ResourceKind("pvcs", "k8s_api", "list_persistent_volume_claim_for_all_namespaces",
+                 "list_namespaced_persistent_volume_claim"),
+    ResourceKind("serviceaccounts", "k8s_api", "list_service_account_for_all_namespaces",
+                 "list_namespaced_service_account"),
+    ResourceKind("resourcequotas", "k8s_api", "list_resource_quota_for_all_namespaces",
+                 "list_namespaced_resource_quota"),
+    ResourceKind("events", "k8s_api", "list_event_for_all_namespaces", "list_namespaced_event"),
+    ResourceKind("deployments", "apps_api", "list_deployment_for_all_namespaces", "list_namespaced_deployment"),
+    ResourceKind("replicasets", "apps_api", "list_replica_set_for_all_namespaces", "list_namespaced_replica_set"),
+    ResourceKind("jobs", "batch_api", "list_job_for_all_namespaces", "list_namespaced_job"),
+    ResourceKind("ingresses", "networking_api", "list_ingress_for_all_namespaces", "list_namespaced_ingress"),
+    ResourceKind("rolebindings", "rbac_api", "list_role_binding_for_all_namespaces",
+                 "list_namespaced_role_binding"),
+    ResourceKind("routes", "route_api", "list_cluster_custom_object", "list_namespaced_custom_object",
+                 _ROUTE_KWARGS),
+]}
+
+
+def get_kind(name: str) -> ResourceKind:
+    """Look up a registered kind by name, raising ValueError for unknown kinds."""
+    try:
+        return RESOURCE_KINDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown resource kind '{name}'. Known kinds: {', '.join(sorted(RESOURCE_KINDS))}")
@@ -0,0 +1,104 @@
+"""Concurrent, budgeted regex search over the logs of many pods."""
+import contextvars
+import re
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional, Tuple
+
+from openshift_mcp_server.logstream import LogStream
+
+
+class SearchBudget:
+    """Shared match and byte budget; once either runs out every worker stops."""
+
+    def __init__(self, max_matches: int, max_bytes: int):
+        self.max_matches = max_matches
+        self.bytes_left = max_bytes
+        self.matches: List[dict] = []
+        self.truncated = False
+        self.stop = threading.Event()
+        self._lock = threading.Lock()
+
+    def consume(self, nbytes: int) -> bool:
+        with self._lock:
+            if self.bytes_left < nbytes:
+                self.truncated = True
+                self.stop.set()
+                return False
+            self.bytes_left -= nbytes
+            return True
+
+    def add(self, match: dict) -> bool:
+        with self._lock:
+            if len(self.matches) >= self.max_matches:
+                self.truncated = True
+                self.stop.set()
+                return False
+            self.matches.append(match)
+            if len(self.matches) >= self.max_matches:
+                self.stop.set()
+            return True
+
+
+def search_lines(lines: Iterable[str], regex: re.Pattern, budget: SearchBudget, pod: str, container: str,
+                 context_lines: int = 0) -> None:
+    """Record lines matching regex, with up to context_lines of surrounding lines."""
+    before = deque(maxlen=context_lines)
+    pending: List[dict] = []
+    for number, line in enumerate(lines, 1):
+        if budget.stop.is_set() or not budget.consume(len(line) + 1):
+            break
+        for match in pending:
+            match["after"].append(line)
+        pending = [match for match in pending if len(match["after"]) < context_lines]
+        if regex.search(line):
+            match = {"pod": pod, "container": container, "line_number": number, "line": line,
+                     "before": list(before), "after": []}
+            if not budget.add(match):
+                break
+            if context_lines:
+                pending.append(match)
+        before.append(line)
+
+
+def search_pods(k8s_api, namespace: str, targets: List[Tuple[str, str]], regex: re.Pattern,
+                budget: SearchBudget, workers: int, max_bytes_per_stream: int, chunk_size: int,
+                context_lines: int = 0, **log_params) -> dict:
+    """Search the logs of (pod, container) targets concurrently on a bounded pool.
+
+    Returns a map of "pod/container" to error message for streams that failed.
+    """
+    errors = {}
+
+    def search(target: Tuple[str, str]) -> None:
+        pod, container = target
+        if budget.stop.is_set():
+            return
+        try:
+            stream = LogStream.open(k8s_api, namespace, pod, max_bytes_per_stream, chunk_size,
+                                    container=container, **log_params)
+            lines = stream.lines()
+            try:
+                search_lines(lines, regex, budget, pod, container, context_lines)
+            finally:
+                lines.close()
+        except Exception as e:
+            errors[f"{pod}/{container}"] = str(e)
+
+    context = contextvars.copy_context()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="log-search") as pool:
+        # Each worker runs in a copy of the caller's context so cancellation reaches it.
+        list(pool.map(lambda target: context.copy().run(search, target), targets))
+    return errors
+
+
+def compile_pattern(pattern: str, ignore_case: bool = False) -> re.Pattern:
+    return re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+
+
+def pod_containers(pod: dict, container: Optional[str] = None) -> List[Tuple[str, str]]:
+    """(pod, container) pairs to search in a raw pod object, optionally limited to one container."""
+    name = pod["metadata"]["name"]
+    names = [c["name"] for c in pod.get("spec", {}).get("containers", [])]
+    return [(name, c) for c in names if container is None or c == container]
@@ -0,0 +1,76 @@
+"""Chunked, byte-bounded reading of pod logs."""
+import codecs
+import time
+from typing import Iterator, Optional
+
+from openshift_mcp_server.config import OPENSHIFT_MCP_CONNECT_TIMEOUT
+from openshift_mcp_server.executor import check_cancelled
+
+
+class LogStream:
+    """Reads a pod log response incrementally, stopping at a byte budget or deadline.
+
+    After iteration, bytes_read holds how much was consumed and truncated tells
+    whether reading stopped before the log ended.
+    """
+
+    def __init__(self, response, max_bytes: int, chunk_size: int, deadline: Optional[float] = None):
+        self._response = response
+        self.max_bytes = max_bytes
+        self.chunk_size = chunk_size
+        self.deadline = deadline
+        self.bytes_read = 0
+        self.truncated = False
+
+    @classmethod
+    def open(cls, k8s_api, namespace: str, pod_name: str, max_bytes: int, chunk_size: int,
+             follow: bool = False, follow_seconds: Optional[float] = None, **params) -> "LogStream":
+        """Start a log request without preloading it; extra params go to read_namespaced_pod_log."""
+        deadline = time.monotonic() + follow_seconds if follow and follow_seconds else None
+        response = k8s_api.read_namespaced_pod_log(
+            name=pod_name,
+            namespace=namespace,
+            follow=follow,
+            limit_bytes=max_bytes,
+            _preload_content=False,
+            # A read timeout bounds how long a quiet followed log can block past the deadline.
+            _request_timeout=(OPENSHIFT_MCP_CONNECT_TIMEOUT, follow_seconds) if deadline else None,
+            **params
+        )
+        return cls(response, max_bytes, chunk_size, deadline)
+
+    def chunks(self) -> Iterator[str]:
+        """Yield decoded text chunks; multi-byte characters split across chunks are kept whole."""
+        from urllib3.exceptions import ReadTimeoutError
+
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        try:
+            for raw in self._response.stream(self.chunk_size):
+                check_cancelled()
+                raw = raw[:self.max_bytes - self.bytes_read]
+                self.bytes_read += len(raw)
+                text = decoder.decode(raw)
+                if text:
+                    yield text
+                if self.bytes_read >= self.max_bytes or (self.deadline and time.monotonic() >= self.deadline):
+                    self.truncated = True
+                    break
+        except ReadTimeoutError:
+            if self.deadline is None:
+                raise
+            self.truncated = True
+        finally:
+            self._response.release_conn()
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+
+    def lines(self) -> Iterator[str]:
+        """Yield complete lines (without newlines), joining lines split across chunks."""
+        pending = ""
+        for chunk in self.chunks():
+            pending += chunk
+            *complete, pending = pending.split("\n")
+            yield from complete
+        if pending:
+            yield pending
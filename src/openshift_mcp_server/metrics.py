@@ -0,0 +1,310 @@
+"""Process-wide latency and throughput metrics in the Prometheus text format.
+
+Every registered tool and resource is wrapped by instrument(), which records
+call and error counts, a latency histogram and the size of the response: exact
+for text, and for structured results measured by serializing a random sample of
+OPENSHIFT_MCP_METRICS_SIZE_SAMPLE of them, so large payloads are not encoded
+twice on every call. ApiClients built by create_api_client() are wrapped by
+instrument_api_client(), which records each upstream Kubernetes API request
+and attributes it to the tool that issued it.
+"""
+import bisect
+import contextvars
+import functools
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from openshift_mcp_server.config import OPENSHIFT_MCP_METRICS_HOST, OPENSHIFT_MCP_METRICS_SIZE_SAMPLE
+from openshift_mcp_server.errors import ToolCancelled
+from openshift_mcp_server.fastjson import dumped_size
+from openshift_mcp_server.logging_utils import logger
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 25, 50, 100, 250)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Counter:
+    """A monotonically increasing count per label combination."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labelvalues: str, amount: float = 1) -> None:
+        key = tuple(str(v) for v in labelvalues)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, *labelvalues: str) -> float:
+        with self._lock:
+            return self._values.get(tuple(str(v) for v in labelvalues), 0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{_labels(self.labelnames, key)} {_number(value)}" for key, value in values]
+
+
+class Histogram:
+    """Observations bucketed by upper bound, with their sum and count, per label combination."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label key: [per-bucket counts (+Inf last), sum, count]
+        self._values: Dict[Tuple[str, ...], list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        key = tuple(str(v) for v in labelvalues)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                series = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def count(self, *labelvalues: str) -> int:
+        with self._lock:
+            series = self._values.get(tuple(str(v) for v in labelvalues))
+            return series[2] if series else 0
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = sorted((key, [list(s[0]), s[1], s[2]]) for key, s in self._values.items())
+        lines = []
+        for key, (counts, total, count) in values:
+            cumulative = 0
+            for bound, n in zip(list(self.buckets) + ["+Inf"], counts):
+                cumulative += n
+                le = 'le="%s"' % (bound if bound == "+Inf" else _number(bound))
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_number(total)}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {count}")
+        return lines
+
+
+class Registry:
+    """A named collection of metrics rendered together."""
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help, labelnames))
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help, labelnames, buckets))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+TOOL_CALLS = REGISTRY.counter(
+    "mcp_tool_calls_total", "Tool and resource invocations.", ["tool"])
+TOOL_ERRORS = REGISTRY.counter(
+    "mcp_tool_errors_total", "Invocations that returned an error or raised, by upstream HTTP status.", ["tool", "status"])
+TOOL_LATENCY = REGISTRY.histogram(
+    "mcp_tool_duration_seconds", "Wall-clock time spent in a tool or resource.", ["tool"])
+TOOL_RESPONSE_BYTES = REGISTRY.histogram(
+    "mcp_tool_response_bytes", "Size of a tool or resource response (a sample of structured ones) serialized as JSON.",
+    ["tool"], SIZE_BUCKETS)
+TOOL_API_CALLS = REGISTRY.histogram(
+    "mcp_tool_kube_api_calls", "Kubernetes API requests issued per tool invocation.", ["tool"], COUNT_BUCKETS)
+KUBE_REQUESTS = REGISTRY.counter(
+    "kube_api_requests_total", "Kubernetes API requests, by calling tool, HTTP method and status.",
+    ["tool", "method", "status"])
+KUBE_LATENCY = REGISTRY.histogram(
+    "kube_api_request_duration_seconds", "Kubernetes API request latency (until headers for streamed responses).",
+    ["method"])
+KUBE_THROTTLED = REGISTRY.counter(
+    "kube_api_throttled_total", "Kubernetes API requests delayed by the client-side rate limiter.", ["method"])
+KUBE_THROTTLE_SECONDS = REGISTRY.counter(
+    "kube_api_throttle_seconds_total", "Time requests spent waiting for the client-side rate limiter.", ["method"])
+KUBE_RETRIES = REGISTRY.counter(
+    "kube_api_retries_total", "Kubernetes API requests retried, by HTTP method and the status that failed.",
+    ["method", "status"])
+KUBE_CIRCUIT_OPENED = REGISTRY.counter(
+    "kube_api_circuit_opened_total", "Times the circuit breaker of an apiserver opened.", ["host"])
+KUBE_CIRCUIT_REJECTED = REGISTRY.counter(
+    "kube_api_circuit_rejected_total", "Requests failed fast because the apiserver's circuit breaker was open.",
+    ["host"])
+
+
+class _CallState:
+    __slots__ = ("tool", "api_calls", "last_status", "_lock")
+
+    def __init__(self, tool: str):
+        self.tool = tool
+        self.api_calls = 0
+        self.last_status: Optional[str] = None
+        # Worker threads of one tool call (log search, snapshot, apply, ...) share its state.
+        self._lock = threading.Lock()
+
+    def record(self, failed_status: Optional[str]) -> None:
+        with self._lock:
+            self.api_calls += 1
+            if failed_status is not None:
+                self.last_status = failed_status
+
+
+_call_state: contextvars.ContextVar[Optional[_CallState]] = contextvars.ContextVar("metrics_call_state", default=None)
+
+
+def current_tool() -> str:
+    """Name of the tool whose call is running in this context, or "none" outside a tool."""
+    state = _call_state.get()
+    return state.tool if state is not None else "none"
+
+
+def _response_size(result) -> Optional[int]:
+    """Size of a text response, or of a sampled structured one serialized as JSON; None when not sampled."""
+    if isinstance(result, (str, bytes)):
+        return len(result)
+    if random.random() < OPENSHIFT_MCP_METRICS_SIZE_SAMPLE:
+        return dumped_size(result)
+    return None
+
+
+def _error_status(result) -> Optional[str]:
+    if isinstance(result, dict) and "error" in result:
+        return "error"
+    return None
+
+
+def instrument(func: Callable, name: Optional[str] = None) -> Callable:
+    """Wrap a blocking tool so every call is counted, timed and sized.
+
+    Error responses and exceptions are counted under the HTTP status of the last
+    failed upstream request made during the call, or "error"/"cancelled" when
+    there was none.
+    """
+    name = name or func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        state = _CallState(name)
+        token = _call_state.set(state)
+        start = time.perf_counter()
+        status = None
+        try:
+            result = func(*args, **kwargs)
+            status = _error_status(result)
+            size = _response_size(result) if status is None else None
+            if size is not None:
+                TOOL_RESPONSE_BYTES.observe(size, name)
+            return result
+        except ToolCancelled:
+            status = "cancelled"
+            raise
+        except Exception:
+            status = "error"
+            raise
+        finally:
+            _call_state.reset(token)
+            TOOL_CALLS.inc(name)
+            TOOL_LATENCY.observe(time.perf_counter() - start, name)
+            TOOL_API_CALLS.observe(state.api_calls, name)
+            if status is not None:
+                TOOL_ERRORS.inc(name, state.last_status if status == "error" and state.last_status else status)
+    return wrapper
+
+
+def instrument_api_client(api_client) -> None:
+    """Record the count, status and latency of every request made through api_client."""
+    call_api = api_client.call_api
+
+    def call_api_with_metrics(resource_path, method, *args, **kwargs):
+        state = _call_state.get()
+        start = time.perf_counter()
+        status = "2xx"
+        failed = False
+        try:
+            result = call_api(resource_path, method, *args, **kwargs)
+            # Raw (_preload_content=False) responses carry their exact status.
+            status = str(getattr(result, "status", None) or status)
+            return result
+        except Exception as e:
+            status = str(getattr(e, "status", None) or "error")
+            failed = True
+            raise
+        finally:
+            KUBE_LATENCY.observe(time.perf_counter() - start, method)
+            KUBE_REQUESTS.inc(state.tool if state is not None else "none", method, status)
+            if state is not None:
+                state.record(status if failed else None)
+
+    api_client.call_api = call_api_with_metrics
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry = REGISTRY
+
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = self.registry.render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(f"metrics endpoint: {format % args}")
+
+
+def start_http_server(port: int, host: str = OPENSHIFT_MCP_METRICS_HOST) -> ThreadingHTTPServer:
+    """Serve /metrics over HTTP from a daemon thread; call shutdown() on the result to stop it."""
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    logger.info(f"Serving metrics on http://{host}:{server.server_address[1]}/metrics")
+    return server
@@ -0,0 +1,62 @@
+"""Chunked LIST helpers built on the apiserver's limit/continue tokens.
+
+Pages are requested with _preload_content=False and decoded straight from the
+response bytes, so callers get plain dicts and the kubernetes client never
+builds model objects for the items.
+"""
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from openshift_mcp_server.coalesce import get_coalescer, read_key
+from openshift_mcp_server.executor import check_cancelled
+from openshift_mcp_server.fastjson import loads
+from openshift_mcp_server.representation import current_accept, table_items
+
+
+def read_json(list_func: Callable, *args, **kwargs) -> dict:
+    """Call a generated list function and decode its raw JSON body.
+
+    Identical concurrent calls (and, with a read cache TTL, recent ones) share a
+    single request and the same decoded body, which callers must not modify.
+    """
+    def fetch() -> dict:
+        response = list_func(*args, _preload_content=False, **kwargs)
+        return loads(response.data)
+
+    key = read_key(list_func, args, kwargs, current_accept())
+    try:
+        hash(key)
+    except TypeError:
+        return fetch()
+    return get_coalescer().do(key, fetch)
+
+
+def page_items(body: dict) -> List[dict]:
+    """The items of one page; the rows of a Table are converted with table_items()."""
+    if body.get("kind") == "Table":
+        return table_items(body)
+    return body.get("items") or []
+
+
+def continue_token(body: dict) -> Optional[str]:
+    return body.get("metadata", {}).get("continue") or None
+
+
+def iter_pages(list_func: Callable, *args, page_size: int, cursor: Optional[str] = None,
+               **kwargs) -> Iterator[Tuple[List[dict], Optional[str]]]:
+    """Yield (items, continue_token) one page at a time, starting from an optional cursor.
+
+    Only one page is held at a time, so peak memory is bounded by page_size.
+    """
+    while True:
+        check_cancelled()
+        body = read_json(list_func, *args, limit=page_size, _continue=cursor, **kwargs)
+        cursor = continue_token(body)
+        yield page_items(body), cursor
+        if not cursor:
+            return
+
+
+def iter_items(list_func: Callable, *args, page_size: int, **kwargs) -> Iterator[dict]:
+    """Yield every item of a collection, fetching it page by page."""
+    for items, _ in iter_pages(list_func, *args, page_size=page_size, **kwargs):
+        yield from items
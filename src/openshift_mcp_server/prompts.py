@@ -28,15 +28,22 @@ def prompt_list_pods(input: str, ctx, namespace: str = None):
     return list_pods(ns, ctx)
 
 @mcp.prompt()
-def prompt_get_pod_logs(input: str, ctx, namespace: str = None, pod_name: str = None, container: str = None):
+def prompt_get_pod_logs(input: str, ctx, namespace: str = None, pod_name: str = None, container: str = None,
+                        tail_lines: int = None, since_seconds: int = None, since_time: str = None,
+                        limit_bytes: int = None, previous: bool = False, timestamps: bool = False):
     """
-    Prompt: Get logs for a pod (optionally specify container).
-    Input: str (pod name), optional namespace/container
-    Output: dict with 'logs' or error dict
+    Prompt: Get logs for a pod (optionally specify container, how far back, and how much).
+    Input: str (pod name), optional namespace/container, tail_lines, since_seconds or since_time (RFC 3339),
+           limit_bytes, previous (logs of the previous container instance), timestamps
+    Output: dict with 'logs' and 'truncated', or error dict
     """
     ns = namespace or "default"
     pod = pod_name or input
-    return get_pod_logs(ns, pod, ctx, container)
+    return get_pod_logs(
+        ns, pod, ctx, container,
+        tail_lines=tail_lines, since_seconds=since_seconds, since_time=since_time,
+        limit_bytes=limit_bytes, previous=previous, timestamps=timestamps
+    )
 
 @mcp.prompt()
 def prompt_list_deployments(input: str, ctx, namespace: str = None):
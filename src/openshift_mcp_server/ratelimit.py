@@ -0,0 +1,73 @@
+"""Token-bucket rate limiting of requests to the apiserver."""
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from openshift_mcp_server.executor import sleep
+
+
+class TokenBucket:
+    """Allow rate requests per second on average, with bursts of up to burst requests.
+
+    The bucket starts full and is safe to share between threads. acquire() blocks
+    until a token is available, or the calling tool is cancelled.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self) -> float:
+        """Take a token if one is available and return 0, or return the seconds until one will be."""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self, timeout: Optional[float] = None) -> float:
+        """Wait for a token and return the seconds waited; raise TimeoutError after timeout seconds."""
+        wait = self.try_acquire()
+        if not wait:
+            return 0.0
+        start = time.monotonic()
+        while wait:
+            if timeout is not None and time.monotonic() + wait - start > timeout:
+                raise TimeoutError(f"No request budget left within {timeout}s")
+            sleep(wait)
+            wait = self.try_acquire()
+        return time.monotonic() - start
+
+
+def parse_rate_limits(spec: str) -> Dict[str, Tuple[float, int]]:
+    """Parse "GET=100:200,PATCH=10:20,*=50:100" (method=qps:burst) into {method: (qps, burst)}."""
+    limits = {}
+    for item in spec.split(","):
+        if not item.strip():
+            continue
+        method, _, value = item.partition("=")
+        qps, _, burst = value.partition(":")
+        limits[method.strip().upper()] = (float(qps), int(burst or max(1, float(qps))))
+    return limits
+
+
+class RateLimiter:
+    """One TokenBucket per HTTP method; "*" covers the methods without their own."""
+
+    def __init__(self, limits: Dict[str, Tuple[float, int]]):
+        self.buckets = {method: TokenBucket(qps, burst) for method, (qps, burst) in limits.items() if qps > 0}
+
+    def acquire(self, method: str) -> float:
+        """Wait for a token for one request with method and return the seconds waited (0 if unlimited)."""
+        bucket = self.buckets.get(method.upper()) or self.buckets.get("*")
+        return bucket.acquire() if bucket is not None else 0.0
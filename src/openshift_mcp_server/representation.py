@@ -0,0 +1,68 @@
+"""Alternative server-side representations of LIST responses.
+
+The apiserver can answer a LIST with only the metadata of each object
+(PartialObjectMetadataList) or with the printable columns kubectl shows (Table),
+selected through the Accept header. The generated list functions always send
+their own Accept header, so the override is carried in a context variable and
+applied by a call_api wrapper installed in create_api_client():
+
+    with accept(PARTIAL_OBJECT_METADATA):
+        body = read_json(k8s_api.list_namespaced_secret, namespace)
+
+Plain JSON is listed as a fallback, so servers (or aggregated APIs) that do not
+support a representation still return the full list.
+"""
+import contextvars
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+PARTIAL_OBJECT_METADATA = "application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1"
+TABLE = "application/json;as=Table;g=meta.k8s.io;v=v1"
+
+_accept: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("accept", default=None)
+
+# Position of header_params in ApiClient.call_api(resource_path, method, path_params, query_params, header_params, ...)
+_HEADER_PARAMS_INDEX = 4
+
+
+@contextmanager
+def accept(media_type: Optional[str]) -> Iterator[None]:
+    """Ask for media_type on every request made in this context (None leaves requests unchanged)."""
+    token = _accept.set(media_type)
+    try:
+        yield
+    finally:
+        _accept.reset(token)
+
+
+def current_accept() -> Optional[str]:
+    return _accept.get()
+
+
+def apply_accept_override(api_client) -> None:
+    """Make api_client honour the media type chosen with accept()."""
+    call_api = api_client.call_api
+
+    def call_api_with_accept(*args, **kwargs):
+        media_type = _accept.get()
+        if media_type is not None:
+            value = f"{media_type},application/json"
+            if len(args) > _HEADER_PARAMS_INDEX:
+                args = list(args)
+                args[_HEADER_PARAMS_INDEX] = {**(args[_HEADER_PARAMS_INDEX] or {}), "Accept": value}
+            else:
+                kwargs["header_params"] = {**(kwargs.get("header_params") or {}), "Accept": value}
+        return call_api(*args, **kwargs)
+
+    api_client.call_api = call_api_with_accept
+
+
+def table_items(body: dict) -> list:
+    """Turn the rows of a Table into item dicts: the row's object (metadata by default) plus its cells by column name."""
+    columns = [column["name"] for column in body.get("columnDefinitions") or []]
+    items = []
+    for row in body.get("rows") or []:
+        item = dict(row.get("object") or {})
+        item["cells"] = dict(zip(columns, row.get("cells") or []))
+        items.append(item)
+    return items
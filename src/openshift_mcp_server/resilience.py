@@ -0,0 +1,177 @@
+"""Client-side protection of an apiserver and of the tools from an overloaded one.
+
+apply_resilience() wraps an ApiClient's call_api so that every request:
+
+- waits for a token of the client's RateLimiter, so a runaway agent cannot flood the cluster
+- is refused with CircuitOpenError while the apiserver's CircuitBreaker is open
+- when it is a GET rejected with 429/502/503/504 (e.g. by API Priority and Fairness)
+  or failing to connect, is retried after the server's Retry-After or a jittered
+  exponential backoff. Read timeouts are not retried: the tool would wait as long again.
+
+Each ApiClient belongs to one cluster, so limits and breaker state are per cluster
+and shared by every tool calling it.
+"""
+import random
+import threading
+import time
+from typing import Optional
+
+from openshift_mcp_server.errors import CircuitOpenError
+from openshift_mcp_server.executor import sleep
+from openshift_mcp_server.logging_utils import logger
+from openshift_mcp_server.metrics import (
+    KUBE_CIRCUIT_OPENED, KUBE_CIRCUIT_REJECTED, KUBE_RETRIES, KUBE_THROTTLE_SECONDS, KUBE_THROTTLED
+)
+from openshift_mcp_server.ratelimit import RateLimiter
+
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+# Values of failed_status() that are retried: the statuses above and failures to connect, never "timeout".
+RETRYABLE_FAILURES = frozenset({str(status) for status in RETRY_STATUSES} | {"connection"})
+# Methods that are safe to send again.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD"})
+
+
+class CircuitBreaker:
+    """Open after threshold consecutive failures, refuse requests for cooldown seconds, then probe with one."""
+
+    def __init__(self, host: str, threshold: int, cooldown: float):
+        self.host = host
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            return "open" if time.monotonic() - self._opened_at < self.cooldown else "half-open"
+
+    def before(self) -> None:
+        """Raise CircuitOpenError unless a request may be sent now."""
+        if self._opened_at is None:
+            return
+        with self._lock:
+            if self._opened_at is None:
+                return
+            remaining = self.cooldown - (time.monotonic() - self._opened_at)
+            if remaining <= 0 and not self._probing:
+                # Half-open: this request finds out whether the apiserver has recovered.
+                self._probing = True
+                return
+        KUBE_CIRCUIT_REJECTED.inc(self.host)
+        raise CircuitOpenError(f"The apiserver at {self.host} is failing; not sending requests for "
+                               f"{max(0, remaining):.0f}s more after {self._failures} consecutive failures")
+
+    def success(self) -> None:
+        if not self._failures and self._opened_at is None:
+            return
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info(f"Circuit breaker for {self.host} closed")
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._probing or (self._opened_at is None and self._failures >= self.threshold):
+                logger.error(f"Circuit breaker for {self.host} opened for {self.cooldown}s "
+                             f"after {self._failures} consecutive failures")
+                KUBE_CIRCUIT_OPENED.inc(self.host)
+                self._opened_at = time.monotonic()
+            self._probing = False
+
+    def release(self) -> None:
+        """End a probe that neither reached the apiserver nor failed because of it."""
+        with self._lock:
+            self._probing = False
+
+
+def retry_after(exception: Exception) -> Optional[float]:
+    """The Retry-After of an ApiException in seconds, if it has one in that form."""
+    headers = getattr(exception, "headers", None) or {}
+    try:
+        return max(0.0, float(headers.get("Retry-After")))
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Full-jitter exponential backoff: uniform in [0, min(cap, base * 2**attempt)]."""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+def apply_resilience(api_client, limiter: RateLimiter, breaker: Optional[CircuitBreaker], retries: int,
+                     retry_base: float, retry_max_wait: float) -> None:
+    """Rate limit, circuit break and retry every request made through api_client (see the module docstring)."""
+    from kubernetes.client.rest import ApiException
+    from urllib3.exceptions import HTTPError, MaxRetryError, ReadTimeoutError
+
+    call_api = api_client.call_api
+
+    def failed_status(e: Exception) -> Optional[str]:
+        """Why a request failed when the apiserver is at fault ("503", "connection"), or None when it is not."""
+        if isinstance(e, MaxRetryError) and e.reason is not None:
+            # Raised by a pool that still retries on its own; what failed is the reason.
+            e = e.reason
+        if isinstance(e, ReadTimeoutError):
+            return "timeout"
+        if isinstance(e, HTTPError) or (isinstance(e, ApiException) and not e.status):
+            return "connection"
+        if isinstance(e, ApiException) and (e.status >= 500 or e.status in RETRY_STATUSES):
+            return str(e.status)
+        return None
+
+    def call_api_resilient(resource_path, method, *args, **kwargs):
+        attempt = 0
+        while True:
+            if breaker is not None:
+                breaker.before()
+            try:
+                waited = limiter.acquire(method)
+            except BaseException:
+                if breaker is not None:
+                    breaker.release()
+                raise
+            if waited:
+                KUBE_THROTTLED.inc(method)
+                KUBE_THROTTLE_SECONDS.inc(method, amount=waited)
+            try:
+                result = call_api(resource_path, method, *args, **kwargs)
+            except Exception as e:
+                status = failed_status(e)
+                if breaker is not None:
+                    # Throttling (429) means the apiserver is up and shedding load, not broken.
+                    if status is not None and status != "429":
+                        breaker.failure()
+                    elif isinstance(e, ApiException):
+                        breaker.success()
+                    else:
+                        breaker.release()
+                retryable = status in RETRYABLE_FAILURES
+                if not retryable or method not in IDEMPOTENT_METHODS or attempt >= retries:
+                    raise
+                if breaker is not None and breaker.state != "closed":
+                    # This failure opened the circuit: report it rather than the fast failure of a retry.
+                    raise
+                delay = retry_after(e)
+                if delay is None:
+                    delay = backoff_delay(attempt, retry_base, retry_max_wait)
+                elif delay > retry_max_wait:
+                    raise
+                KUBE_RETRIES.inc(method, status)
+                logger.warning(f"{method} {resource_path} failed with {status}, retry {attempt + 1}/{retries} "
+                               f"in {delay:.2f}s")
+                sleep(delay)
+                attempt += 1
+                continue
+            if breaker is not None:
+                breaker.success()
+            return result
+
+    api_client.call_api = call_api_resilient
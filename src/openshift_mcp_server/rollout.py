@@ -0,0 +1,279 @@
+"""Waiting for a Deployment rollout by watching it instead of polling.
+
+RolloutWatch reads the Deployment and lists its pods once, then follows two
+WATCH requests from the returned resourceVersions: one on the Deployment
+(selected by name) and one on its pods (selected by the Deployment's
+selector). Each runs on its own thread and feeds one queue, so the caller sees
+every change as soon as the apiserver sends it, at the cost of two long-lived
+connections instead of a request per poll. A watch that the apiserver ends is
+resumed from its last resourceVersion; one that has expired (410 Gone) is
+relisted.
+
+The rollout is judged like `kubectl rollout status`: from the Deployment's
+observedGeneration, replica counts and Progressing condition. Pods of the new
+ReplicaSet whose containers wait in a reason that will not clear by itself
+(CrashLoopBackOff, ImagePullBackOff, ...) fail the rollout early instead of
+waiting for the progress deadline.
+"""
+import contextvars
+import functools
+import math
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from openshift_mcp_server.config import OPENSHIFT_MCP_LIST_PAGE_SIZE
+from openshift_mcp_server.delta import ResourceVersionExpired, Watch, list_collection
+from openshift_mcp_server.errors import ToolCancelled
+from openshift_mcp_server.executor import check_cancelled
+from openshift_mcp_server.fastjson import loads
+from openshift_mcp_server.labels import selector_to_string
+from openshift_mcp_server.logging_utils import logger
+
+REVISION_ANNOTATION = "deployment.kubernetes.io/revision"
+# Container waiting reasons that fail the rollout: they will not resolve without a change to the Deployment.
+TERMINAL_REASONS = frozenset({
+    "CrashLoopBackOff", "ImagePullBackOff", "InvalidImageName", "CreateContainerConfigError", "CreateContainerError",
+    "ErrImageNeverPull",
+})
+# Waiting reasons of a container that is simply starting up.
+STARTING_REASONS = frozenset({"ContainerCreating", "PodInitializing"})
+# How often the waiting caller checks for cancellation while no events arrive.
+POLL_INTERVAL = 0.5
+
+
+def rollout_status(deployment: dict) -> Tuple[str, str]:
+    """("progressing" | "complete" | "failed", message) of a Deployment, as `kubectl rollout status` reports it."""
+    name = deployment["metadata"]["name"]
+    spec = deployment.get("spec") or {}
+    status = deployment.get("status") or {}
+    if deployment["metadata"].get("generation", 0) > status.get("observedGeneration", 0):
+        return "progressing", "Waiting for deployment spec update to be observed"
+    for condition in status.get("conditions") or []:
+        if condition.get("type") == "Progressing" and condition.get("reason") == "ProgressDeadlineExceeded":
+            return "failed", f"Deployment {name} exceeded its progress deadline"
+    desired = spec.get("replicas", 1)
+    updated = status.get("updatedReplicas", 0)
+    available = status.get("availableReplicas", 0)
+    if updated < desired:
+        return "progressing", f"{updated} of {desired} new replicas have been updated"
+    if status.get("replicas", 0) > updated:
+        return "progressing", f"{status['replicas'] - updated} old replicas are pending termination"
+    if available < updated:
+        return "progressing", f"{available} of {updated} updated replicas are available"
+    return "complete", f"Deployment {name} successfully rolled out"
+
+
+def replica_counts(deployment: dict) -> Dict[str, int]:
+    status = deployment.get("status") or {}
+    return {
+        "desired": (deployment.get("spec") or {}).get("replicas", 1),
+        "updated": status.get("updatedReplicas", 0),
+        "ready": status.get("readyReplicas", 0),
+        "available": status.get("availableReplicas", 0),
+        "unavailable": status.get("unavailableReplicas", 0),
+    }
+
+
+def failing_containers(pod: dict) -> List[dict]:
+    """Why a pod is not running: its containers waiting for something other than start-up, or why it is unschedulable."""
+    name = pod["metadata"]["name"]
+    status = pod.get("status") or {}
+    failing = []
+    for container in (status.get("initContainerStatuses") or []) + (status.get("containerStatuses") or []):
+        waiting = (container.get("state") or {}).get("waiting")
+        if waiting and waiting.get("reason") and waiting["reason"] not in STARTING_REASONS:
+            failing.append({"pod": name, "container": container["name"], "reason": waiting["reason"],
+                            "message": waiting.get("message", ""), "restarts": container.get("restartCount", 0)})
+    for condition in status.get("conditions") or []:
+        if condition.get("type") == "PodScheduled" and condition.get("status") == "False":
+            failing.append({"pod": name, "reason": condition.get("reason", "Unschedulable"),
+                            "message": condition.get("message", "")})
+    return failing
+
+
+def _owner_replica_set(pod: dict) -> Optional[str]:
+    for owner in pod["metadata"].get("ownerReferences") or []:
+        if owner.get("kind") == "ReplicaSet" and owner.get("controller"):
+            return owner["name"]
+    return None
+
+
+class RolloutWatch:
+    """Follow one Deployment and its pods until its rollout completes, fails or times out."""
+
+    def __init__(self, apps_api, k8s_api, namespace: str, name: str):
+        self.apps_api = apps_api
+        self.k8s_api = k8s_api
+        self.namespace = namespace
+        self.name = name
+        self.deployment: Optional[dict] = None
+        self.pods: Dict[str, dict] = {}
+        self._revisions: Dict[str, Optional[str]] = {}
+        self._events: "queue.Queue[Tuple[str, str, Any]]" = queue.Queue()
+        self._stopped = threading.Event()
+        self._watches: List[Watch] = []
+        self._lock = threading.Lock()
+
+    def _read_deployment(self) -> Tuple[dict, str]:
+        deployment = loads(self.apps_api.read_namespaced_deployment(
+            self.name, self.namespace, _preload_content=False).data)
+        return deployment, deployment["metadata"]["resourceVersion"]
+
+    def _list_pods(self, label_selector: str) -> Tuple[List[dict], str]:
+        return list_collection(self.k8s_api.list_namespaced_pod, self.namespace, label_selector=label_selector,
+                               page_size=OPENSHIFT_MCP_LIST_PAGE_SIZE)
+
+    def _revision(self, replica_set: str) -> Optional[str]:
+        """Revision annotation of a ReplicaSet, read once (None if it cannot be read)."""
+        if replica_set not in self._revisions:
+            try:
+                body = loads(self.apps_api.read_namespaced_replica_set(
+                    replica_set, self.namespace, _preload_content=False).data)
+                self._revisions[replica_set] = (body["metadata"].get("annotations") or {}).get(REVISION_ANNOTATION)
+            except ToolCancelled:
+                raise
+            except Exception as e:
+                logger.warning(f"Failed to read ReplicaSet {replica_set} in {self.namespace}: {e}")
+                self._revisions[replica_set] = None
+        return self._revisions[replica_set]
+
+    def failing_pods(self) -> List[dict]:
+        """Failing containers of the pods of the Deployment's current revision (of all its pods until it has one)."""
+        revision = (self.deployment["metadata"].get("annotations") or {}).get(REVISION_ANNOTATION)
+        failing = []
+        for pod in self.pods.values():
+            if pod["metadata"].get("deletionTimestamp"):
+                continue
+            problems = failing_containers(pod)
+            if not problems:
+                continue
+            replica_set = _owner_replica_set(pod)
+            if revision and (replica_set is None or self._revision(replica_set) != revision):
+                continue
+            failing.extend(problems)
+        return sorted(failing, key=lambda problem: (problem["pod"], problem.get("container", "")))
+
+    def _follow(self, kind: str, list_func: Callable, kwargs: dict, relist: Callable, resource_version: str,
+                deadline: float) -> None:
+        """Thread body: put every event of one watch on the queue, resuming and relisting until stopped."""
+        try:
+            while not self._stopped.is_set():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                try:
+                    watch = Watch(list_func, self.namespace, resource_version=resource_version,
+                                  timeout_seconds=max(1, math.ceil(remaining)), **kwargs)
+                    with self._lock:
+                        self._watches.append(watch)
+                    if self._stopped.is_set():
+                        watch.close()
+                        return
+                    for event_type, obj in watch:
+                        self._events.put((kind, event_type, obj))
+                    resource_version = watch.resource_version
+                except ResourceVersionExpired:
+                    logger.info(f"Watch of {kind} for rollout of {self.name} expired, relisting")
+                    objs, resource_version = relist()
+                    self._events.put((kind, "RELIST", objs))
+        except ToolCancelled:
+            return
+        except Exception as e:
+            # Closing the watch to stop this thread may surface here as a read error.
+            if not self._stopped.is_set():
+                self._events.put((kind, "ERROR", e))
+
+    def _apply(self, kind: str, event_type: str, obj: Any) -> None:
+        if event_type == "ERROR":
+            raise obj
+        if kind == "deployments":
+            if event_type == "RELIST":
+                obj = obj[0] if obj else None
+            if event_type == "DELETED" or obj is None:
+                raise ValueError(f"Deployment {self.name} was deleted")
+            self.deployment = obj
+        elif event_type == "RELIST":
+            self.pods = {pod["metadata"]["name"]: pod for pod in obj}
+        elif event_type == "DELETED":
+            self.pods.pop(obj["metadata"]["name"], None)
+        else:
+            self.pods[obj["metadata"]["name"]] = obj
+
+    def _stop(self, threads: List[threading.Thread]) -> None:
+        self._stopped.set()
+        with self._lock:
+            watches = list(self._watches)
+        for watch in watches:
+            try:
+                watch.close()
+            except Exception:
+                pass
+        for thread in threads:
+            thread.join(timeout=1)
+
+    def wait(self, timeout: float, on_progress: Optional[Callable[[str], Any]] = None) -> dict:
+        """Watch until the rollout completes, fails or timeout seconds pass, calling on_progress on every new status.
+
+        Returns {"status": "complete" | "failed" | "timeout", "message", "replicas", "failing_pods", "elapsed_seconds"}.
+        """
+        start = time.monotonic()
+        deadline = start + timeout
+        self.deployment, deployment_version = self._read_deployment()
+        label_selector = selector_to_string(self.deployment["spec"]["selector"])
+        pods, pod_version = self._list_pods(label_selector)
+        self.pods = {pod["metadata"]["name"]: pod for pod in pods}
+        field_selector = f"metadata.name={self.name}"
+
+        relist_deployment = functools.partial(list_collection, self.apps_api.list_namespaced_deployment,
+                                              self.namespace, field_selector=field_selector, page_size=1)
+        follows = [
+            ("deployments", self.apps_api.list_namespaced_deployment, {"field_selector": field_selector},
+             relist_deployment, deployment_version),
+            ("pods", self.k8s_api.list_namespaced_pod, {"label_selector": label_selector},
+             functools.partial(self._list_pods, label_selector), pod_version),
+        ]
+        context = contextvars.copy_context()
+        threads = []
+        for kind, list_func, kwargs, relist, resource_version in follows:
+            # Each watch runs in a copy of the caller's context so cancellation and metrics reach it.
+            thread = threading.Thread(target=context.copy().run, daemon=True, name=f"rollout-{kind}",
+                                      args=(self._follow, kind, list_func, kwargs, relist, resource_version, deadline))
+            thread.start()
+            threads.append(thread)
+        reported = None
+        try:
+            while True:
+                state, message = rollout_status(self.deployment)
+                failing = self.failing_pods()
+                if state == "progressing" and any(problem["reason"] in TERMINAL_REASONS for problem in failing):
+                    state = "failed"
+                    message = f"Pods of deployment {self.name} are failing: " + ", ".join(
+                        sorted({problem["reason"] for problem in failing if problem["reason"] in TERMINAL_REASONS}))
+                progress = (message, tuple((problem["pod"], problem["reason"]) for problem in failing))
+                if on_progress is not None and progress != reported:
+                    reasons = "; ".join(f"{problem['pod']}: {problem['reason']}" for problem in failing)
+                    on_progress(f"{message} ({reasons})" if reasons else message)
+                    reported = progress
+                remaining = deadline - time.monotonic()
+                if state == "progressing" and remaining <= 0:
+                    state = "timeout"
+                    message = f"Timed out after {timeout:g}s: {message}"
+                if state != "progressing":
+                    return {"status": state, "message": message, "replicas": replica_counts(self.deployment),
+                            "failing_pods": failing, "elapsed_seconds": round(time.monotonic() - start, 3)}
+                check_cancelled()
+                try:
+                    event = self._events.get(timeout=min(remaining, POLL_INTERVAL))
+                except queue.Empty:
+                    continue
+                self._apply(*event)
+                # Apply whatever else has arrived before judging the rollout again.
+                while True:
+                    try:
+                        self._apply(*self._events.get_nowait())
+                    except queue.Empty:
+                        break
+        finally:
+            self._stop(threads)
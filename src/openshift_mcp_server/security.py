@@ -1,39 +1,236 @@
-from typing import List, Dict, Any
+"""Security policy for workload manifests.
+
+Rules are declared as data: the part of the pod spec they look at (the pod
+itself, each container of every container list, or each volume), the path of
+the field inside it, and when its value is a violation. compile_rules() merges
+the paths of all rules into one trie per scope and flattens each trie into a
+table of steps, each reading one field of a value read by an earlier step. A
+manifest is checked by walking these tables in a single loop over its pod spec
+that reads every referenced field once, however many rules share it. Verdicts
+are memoized by a hash of the pod spec.
+"""
+import hashlib
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from openshift_mcp_server.coalesce import TTLCache
+from openshift_mcp_server.config import OPENSHIFT_MCP_SECURITY_CACHE_SIZE
+from openshift_mcp_server.fastjson import dumps
 from openshift_mcp_server.logging_utils import logger
 
-def check_host_network(pod_spec: Dict[str, Any], errors: List[str]) -> None:
-    if pod_spec.get('hostNetwork'):
-        errors.append("hostNetwork is disallowed for security reasons.")
+# Where each workload kind keeps its pod spec.
+POD_SPEC_PATHS: Dict[str, Tuple[str, ...]] = {
+    "Pod": ("spec",),
+    "Deployment": ("spec", "template", "spec"),
+    "DeploymentConfig": ("spec", "template", "spec"),
+    "ReplicaSet": ("spec", "template", "spec"),
+    "StatefulSet": ("spec", "template", "spec"),
+    "DaemonSet": ("spec", "template", "spec"),
+    "Job": ("spec", "template", "spec"),
+    "CronJob": ("spec", "jobTemplate", "spec", "template", "spec"),
+}
 
-def check_privileged_containers(pod_spec: Dict[str, Any], errors: List[str]) -> None:
-    for c in pod_spec.get('containers', []):
-        sc = c.get('securityContext', {})
-        if sc.get('privileged'):
-            errors.append(f"Container '{c.get('name', '')}' sets privileged=true, which is disallowed.")
+# Container lists of a pod spec and how their containers are named in messages.
+CONTAINER_LISTS = {"initContainers": "Init container", "containers": "Container",
+                   "ephemeralContainers": "Ephemeral container"}
 
-def check_host_pid_ipc(pod_spec: Dict[str, Any], errors: List[str]) -> None:
-    if pod_spec.get('hostPID'):
-        errors.append("hostPID is disallowed for security reasons.")
-    if pod_spec.get('hostIPC'):
-        errors.append("hostIPC is disallowed for security reasons.")
+DANGEROUS_CAPABILITIES = frozenset({
+    "ALL", "SYS_ADMIN", "NET_ADMIN", "SYS_MODULE", "SYS_PTRACE", "SYS_RAWIO", "SYS_BOOT", "SYS_TIME",
+    "DAC_READ_SEARCH", "BPF", "PERFMON", "MAC_ADMIN", "MAC_OVERRIDE",
+})
 
-def check_host_path_volumes(pod_spec: Dict[str, Any], errors: List[str]) -> None:
-    for v in pod_spec.get('volumes', []):
-        if 'hostPath' in v:
-            errors.append(f"Volume '{v.get('name', '')}' uses hostPath which is disallowed.")
 
-def validate_deployment_manifest_security(manifest: dict) -> List[str]:
-    """Validate deployment manifest against security policies. Returns a list of error messages if found."""
+@dataclass(frozen=True)
+class Rule:
+    """One policy: where to look, when the value found there is a violation, and what to report.
+
+    scope is "pod", "container" or "volume"; path is the field inside it. message is
+    formatted with subject (e.g. "Container 'app'"), name and value.
+    """
+    scope: str
+    path: Tuple[str, ...]
+    violates: Callable[[Any], bool]
+    message: str
+
+
+def _is_true(value: Any) -> bool:
+    return value is True
+
+
+def _is_root(value: Any) -> bool:
+    return value == 0
+
+
+def _is_unconfined(value: Any) -> bool:
+    return value == "Unconfined"
+
+
+def _has_dangerous_capability(value: Any) -> bool:
+    return any(str(cap).upper().removeprefix("CAP_") in DANGEROUS_CAPABILITIES for cap in value or [])
+
+
+def _has_host_port(value: Any) -> bool:
+    return any(isinstance(port, dict) and port.get("hostPort") for port in value or [])
+
+
+RULES: List[Rule] = [
+    Rule("pod", ("hostNetwork",), bool, "hostNetwork is disallowed for security reasons."),
+    Rule("pod", ("hostPID",), bool, "hostPID is disallowed for security reasons."),
+    Rule("pod", ("hostIPC",), bool, "hostIPC is disallowed for security reasons."),
+    Rule("pod", ("securityContext", "runAsUser"), _is_root,
+         "Pod securityContext sets runAsUser=0, which is disallowed."),
+    Rule("pod", ("securityContext", "seccompProfile", "type"), _is_unconfined,
+         "Pod securityContext sets seccompProfile Unconfined, which is disallowed."),
+    Rule("volume", ("hostPath",), lambda value: True, "Volume '{name}' uses hostPath which is disallowed."),
+    Rule("container", ("securityContext", "privileged"), _is_true,
+         "{subject} sets privileged=true, which is disallowed."),
+    Rule("container", ("securityContext", "allowPrivilegeEscalation"), _is_true,
+         "{subject} sets allowPrivilegeEscalation=true, which is disallowed."),
+    Rule("container", ("securityContext", "capabilities", "add"), _has_dangerous_capability,
+         "{subject} adds capabilities {value}, which is disallowed."),
+    Rule("container", ("securityContext", "runAsUser"), _is_root, "{subject} sets runAsUser=0, which is disallowed."),
+    Rule("container", ("securityContext", "procMount"), lambda value: value == "Unmasked",
+         "{subject} sets procMount=Unmasked, which is disallowed."),
+    Rule("container", ("securityContext", "seccompProfile", "type"), _is_unconfined,
+         "{subject} sets seccompProfile Unconfined, which is disallowed."),
+    Rule("container", ("ports",), _has_host_port, "{subject} binds a hostPort, which is disallowed."),
+]
+
+# field -> (rules that check this field's value, trie of the fields below it)
+Trie = Dict[str, Tuple[List[Rule], "Trie"]]
+# check(obj, label, name, errors) appends the violations found in one pod spec, container or volume.
+Check = Callable[[dict, str, str, List[str]], None]
+
+
+class Step(NamedTuple):
+    """Read field from the value of step parent (0 is the checked object) and test it with rules."""
+    parent: int
+    field: str
+    rules: Tuple[Rule, ...]
+
+
+@dataclass(frozen=True)
+class Policy:
+    """Rules compiled into one check function per scope."""
+    pod: Check
+    container: Check
+    volume: Check
+
+
+def _subject(label: str, name: str) -> str:
+    return f"{label} '{name}'" if name else label
+
+
+def _flatten(trie: Trie) -> Tuple[Step, ...]:
+    """The trie's fields in depth-first order, so each step comes after the step that reads its parent."""
+    steps: List[Step] = []
+
+    def walk(node: Trie, parent: int) -> None:
+        for field, (rules, children) in node.items():
+            steps.append(Step(parent, field, tuple(rules)))
+            walk(children, len(steps))
+
+    walk(trie, 0)
+    return tuple(steps)
+
+
+def _checker(steps: Tuple[Step, ...]) -> Check:
+    """A check that runs the steps in one loop: each field is read once and tested by every rule on it."""
+    def check(obj: dict, label: str, name: str, errors: List[str]) -> None:
+        values = [obj]
+        for parent, field, rules in steps:
+            source = values[parent]
+            value = source.get(field) if isinstance(source, dict) else None
+            values.append(value)
+            if value is not None:
+                for rule in rules:
+                    if rule.violates(value):
+                        errors.append(rule.message.format(subject=_subject(label, name), name=name, value=value))
+    return check
+
+
+def compile_rules(rules: List[Rule]) -> Policy:
+    """Merge the rules' field paths into one trie per scope and flatten each trie into a check function."""
+    tries: Dict[str, Trie] = {"pod": {}, "container": {}, "volume": {}}
+    for rule in rules:
+        if rule.scope not in tries:
+            raise ValueError(f"Unknown rule scope '{rule.scope}'")
+        node = tries[rule.scope]
+        for field in rule.path[:-1]:
+            node = node.setdefault(field, ([], {}))[1]
+        node.setdefault(rule.path[-1], ([], {}))[0].append(rule)
+    return Policy(**{scope: _checker(_flatten(trie)) for scope, trie in tries.items()})
+
+
+def pod_spec_of(manifest: dict) -> dict:
+    """The pod spec of a workload manifest (a Deployment's spec.template.spec when the kind is unknown).
+
+    A field on the way that is not a mapping gives an empty pod spec.
+    """
+    kind = manifest.get("kind")
+    node = manifest
+    for field in POD_SPEC_PATHS.get(kind if isinstance(kind, str) else None, POD_SPEC_PATHS["Deployment"]):
+        node = node.get(field)
+        if not isinstance(node, dict):
+            return {}
+    return node
+
+
+def _mappings(items: Any) -> List[dict]:
+    """The mappings of a list field; malformed entries are left to structural validation."""
+    return [item for item in items if isinstance(item, dict)] if isinstance(items, list) else []
+
+
+def check_pod_spec(policy: Policy, pod_spec: dict) -> List[str]:
+    """Apply a compiled policy to a pod spec in one pass over the pod, its containers and volumes."""
     errors: List[str] = []
-    spec = manifest.get('spec', {})
-    template = spec.get('template', {})
-    pod_spec = template.get('spec', {})
+    policy.pod(pod_spec, "Pod", "", errors)
+    for list_name, label in CONTAINER_LISTS.items():
+        for container in _mappings(pod_spec.get(list_name)):
+            policy.container(container, label, str(container.get("name", "")), errors)
+    for volume in _mappings(pod_spec.get("volumes")):
+        policy.volume(volume, "Volume", str(volume.get("name", "")), errors)
+    return errors
+
+
+DEFAULT_POLICY = compile_rules(RULES)
+_verdicts = TTLCache(ttl=float("inf"), maxsize=OPENSHIFT_MCP_SECURITY_CACHE_SIZE)
+
+
+def _memo_key(pod_spec: dict) -> Optional[bytes]:
+    """Content hash of a pod spec, or None when it does not serialize to JSON.
+
+    YAML turns keys such as `on` or `1` into booleans and numbers, which orjson refuses.
+    Such specs are rare enough to be checked every time instead.
+    """
+    try:
+        return hashlib.blake2b(dumps(pod_spec), digest_size=16).digest()
+    except (TypeError, ValueError):
+        return None
 
-    check_host_network(pod_spec, errors)
-    check_privileged_containers(pod_spec, errors)
-    check_host_pid_ipc(pod_spec, errors)
-    check_host_path_volumes(pod_spec, errors)
 
+def validate_manifest_security(manifest: dict, policy: Optional[Policy] = None) -> List[str]:
+    """Check a workload manifest (Pod, Deployment, StatefulSet, DaemonSet, Job, CronJob, ...) against the policy.
+
+    Returns a list of error messages, empty if the manifest is allowed. policy defaults
+    to DEFAULT_POLICY, compiled from RULES.
+    """
+    pod_spec = pod_spec_of(manifest)
+    if policy is not None and policy is not DEFAULT_POLICY:
+        errors = tuple(check_pod_spec(policy, pod_spec))
+    else:
+        # Only verdicts of the default policy are memoized; they depend on the pod spec alone.
+        key = _memo_key(pod_spec)
+        hit, errors = _verdicts.get(key) if key is not None else (False, None)
+        if not hit:
+            errors = tuple(check_pod_spec(DEFAULT_POLICY, pod_spec))
+            if key is not None:
+                _verdicts.put(key, errors)
     if errors:
-        logger.warning(f"Security checks failed: {errors}")
-    return errors
+        logger.warning(f"Security checks failed: {list(errors)}")
+    return list(errors)
+
+
+def validate_deployment_manifest_security(manifest: dict) -> List[str]:
+    """Validate deployment manifest against security policies. Returns a list of error messages if found."""
+    return validate_manifest_security(manifest)
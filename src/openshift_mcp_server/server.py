@@ -1,73 +1,278 @@
 from contextlib import asynccontextmanager
 from collections.abc import AsyncIterator
-from dataclasses import dataclass
-from typing import Optional
-import requests
-
-from kubernetes.client import CustomObjectsApi
-from kubernetes import client, config
-from mcp.server.fastmcp import FastMCP
-from openshift_mcp_server.config import OPENSHIFT_SERVER, OPENSHIFT_USERNAME, OPENSHIFT_PASSWORD
+from dataclasses import dataclass, field
+from functools import cached_property
+import functools
+import inspect
+import os
+import re
+import threading
+import typing
+from typing import TYPE_CHECKING, Callable, Optional
+from urllib.parse import parse_qsl
+
+from mcp.server.fastmcp import Context, FastMCP
+from openshift_mcp_server.config import (
+    OPENSHIFT_SERVER, OPENSHIFT_USERNAME, OPENSHIFT_PASSWORD,
+    OPENSHIFT_MCP_INFORMERS, OPENSHIFT_MCP_INFORMER_MAX_STALENESS, OPENSHIFT_MCP_INFORMER_WATCH_TIMEOUT,
+    OPENSHIFT_MCP_ASYNC_TOOLS, OPENSHIFT_TOKEN_CACHE, OPENSHIFT_TOKEN_REFRESH_MARGIN,
+    OPENSHIFT_MCP_METRICS_PORT, OPENSHIFT_MCP_CLUSTERS, OPENSHIFT_MCP_CLUSTERS_FILE
+)
+from openshift_mcp_server.apply import Discovery
+from openshift_mcp_server.clusters import ClusterPool, cluster_specs, with_cluster
+from openshift_mcp_server.connection import create_api_client
+from openshift_mcp_server.executor import run_in_executor, tool_timeout
+from openshift_mcp_server.graph import RelationshipIndex
+from openshift_mcp_server.informer import InformerCache
+from openshift_mcp_server import metrics
 from openshift_mcp_server.tools import (
     list_namespaces, list_pods, get_pod_logs, list_deployments, list_routes,
     get_route, list_services, get_service, get_all_services, get_cluster_info,
-    create_deployment, validate_openshift_manifest,
+    create_deployment, validate_openshift_manifest, validate_manifests, apply_manifests,
     list_configmaps, list_secrets, list_jobs, list_pvcs, list_ingresses, list_rolebindings,
-    list_projects, list_serviceaccounts, list_resourcequotas, list_events
+    list_projects, list_serviceaccounts, list_resourcequotas, list_events, get_cache_status,
+    search_pod_logs, get_connection_pool_stats, get_metrics,
+    get_pods_summary, get_deployments_summary, get_events_summary, get_cluster_snapshot, get_changes,
+    aggregate_events, list_clusters, query_clusters, get_owner_chain, get_backing_pods, wait_for_rollout
 )
 
+if TYPE_CHECKING:
+    from kubernetes import client
+
 @dataclass
 class AppContext:
-    k8s_api: client.CoreV1Api
-    apps_api: client.AppsV1Api
-    route_api: CustomObjectsApi
-    batch_api: client.BatchV1Api
-    networking_api: client.NetworkingV1Api
-    rbac_api: client.RbacAuthorizationV1Api
-
-def get_api_client_with_token(server_url: str, username: str, password: str) -> client.ApiClient:
-    """Authenticate with OpenShift and return an ApiClient using a Bearer token."""
-    oauth_url = f"{server_url}/oauth/authorize?response_type=token&client_id=openshift-challenging-client"
-    session = requests.Session()
-    session.get(oauth_url, verify=False)
-    auth = requests.auth.HTTPBasicAuth(username, password)
-    response = session.post(oauth_url, auth=auth, allow_redirects=False, verify=False)
-    location = response.headers.get("Location", "")
-    if "access_token=" not in location:
-        raise Exception("Failed to obtain OpenShift token via OAuth")
-    token = location.split("access_token=")[1].split("&")[0]
+    """Kubernetes/OpenShift API clients for the tools.
+
+    Nothing is imported from or connected to the cluster until a tool first touches
+    one of the APIs: the shared ApiClient comes from api_client_factory on first use,
+    and each API facade is built around it on its own first access.
+    """
+    api_client_factory: Callable[[], "client.ApiClient"]
+    informers: Optional[InformerCache] = None
+    graph: Optional[RelationshipIndex] = None
+    clusters: Optional[ClusterPool] = None
+    _api_client: Optional["client.ApiClient"] = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    @property
+    def api_client(self) -> "client.ApiClient":
+        if self._api_client is None:
+            with self._lock:
+                if self._api_client is None:
+                    self._api_client = self.api_client_factory()
+        return self._api_client
+
+    def close(self) -> None:
+        """Stop the informers and close the connection pool, if they were ever started."""
+        if self.informers:
+            self.informers.stop()
+        if self._api_client is not None:
+            self._api_client.close()
+
+    @cached_property
+    def discovery(self) -> Discovery:
+        return Discovery(self.api_client)
+
+    @cached_property
+    def core_api(self) -> "client.CoreApi":
+        from kubernetes import client
+        return client.CoreApi(self.api_client)
+
+    @cached_property
+    def k8s_api(self) -> "client.CoreV1Api":
+        from kubernetes import client
+        return client.CoreV1Api(self.api_client)
+
+    @cached_property
+    def apps_api(self) -> "client.AppsV1Api":
+        from kubernetes import client
+        return client.AppsV1Api(self.api_client)
+
+    @cached_property
+    def route_api(self) -> "client.CustomObjectsApi":
+        from kubernetes import client
+        return client.CustomObjectsApi(self.api_client)
+
+    @cached_property
+    def batch_api(self) -> "client.BatchV1Api":
+        from kubernetes import client
+        return client.BatchV1Api(self.api_client)
+
+    @cached_property
+    def networking_api(self) -> "client.NetworkingV1Api":
+        from kubernetes import client
+        return client.NetworkingV1Api(self.api_client)
+
+    @cached_property
+    def rbac_api(self) -> "client.RbacAuthorizationV1Api":
+        from kubernetes import client
+        return client.RbacAuthorizationV1Api(self.api_client)
+
+def get_api_client_with_token(server_url: str, username: str, password: str,
+                              rate_limits: Optional[str] = None) -> "client.ApiClient":
+    """Authenticate with OpenShift and return an ApiClient using a Bearer token.
+
+    The token is cached (optionally on disk, see OPENSHIFT_TOKEN_CACHE), refreshed
+    before it expires, and renewed once when a request is rejected with 401.
+    """
+    from kubernetes import client
+    from openshift_mcp_server.auth import TokenManager, retry_on_unauthorized
+
+    token_manager = TokenManager(
+        server_url, username, password,
+        cache_path=OPENSHIFT_TOKEN_CACHE,
+        refresh_margin=OPENSHIFT_TOKEN_REFRESH_MARGIN,
+    )
     configuration = client.Configuration()
     configuration.host = server_url
     configuration.verify_ssl = False
-    configuration.api_key = {"authorization": f"Bearer {token}"}
-    return client.ApiClient(configuration)
-
-def build_app_context(api_client: Optional[client.ApiClient] = None) -> AppContext:
-    """Create an AppContext with or without a custom ApiClient."""
-    return AppContext(
-        k8s_api=client.CoreV1Api(api_client) if api_client else client.CoreV1Api(),
-        apps_api=client.AppsV1Api(api_client) if api_client else client.AppsV1Api(),
-        route_api=CustomObjectsApi(api_client) if api_client else CustomObjectsApi(),
-        batch_api=client.BatchV1Api(api_client) if api_client else client.BatchV1Api(),
-        networking_api=client.NetworkingV1Api(api_client) if api_client else client.NetworkingV1Api(),
-        rbac_api=client.RbacAuthorizationV1Api(api_client) if api_client else client.RbacAuthorizationV1Api(),
-    )
+    token_manager.install(configuration)
+    api_client = create_api_client(configuration, rate_limits)
+    retry_on_unauthorized(api_client, token_manager)
+    return api_client
+
+def get_api_client_from_kubeconfig(context: Optional[str] = None, config_file: Optional[str] = None,
+                                   rate_limits: Optional[str] = None) -> "client.ApiClient":
+    """Return an ApiClient for a kubeconfig context (default: the current context of the default kubeconfig)."""
+    from kubernetes import client, config
+
+    configuration = client.Configuration()
+    config.load_kube_config(config_file=config_file, context=context, client_configuration=configuration)
+    return create_api_client(configuration, rate_limits)
+
+def connect() -> "client.ApiClient":
+    """Use username/password if provided via env vars, else the kube config."""
+    if OPENSHIFT_SERVER and OPENSHIFT_USERNAME and OPENSHIFT_PASSWORD:
+        return get_api_client_with_token(OPENSHIFT_SERVER, OPENSHIFT_USERNAME, OPENSHIFT_PASSWORD)
+    return get_api_client_from_kubeconfig()
+
+def build_app_context(api_client: Optional["client.ApiClient"] = None) -> AppContext:
+    """Create an AppContext around a custom ApiClient, or one connected on first use."""
+    if api_client is None:
+        return AppContext(api_client_factory=connect)
+    return AppContext(api_client_factory=lambda: api_client)
+
+def cluster_app_context(spec: dict) -> AppContext:
+    """Create the (lazily connected) AppContext of one cluster of the pool."""
+    if spec.get("server"):
+        def factory() -> "client.ApiClient":
+            # Read the password only when the cluster is first used.
+            return get_api_client_with_token(spec["server"], spec["username"], os.environ[spec["password_env"]],
+                                             spec.get("rate_limits"))
+    else:
+        factory = functools.partial(get_api_client_from_kubeconfig, spec.get("context"), spec.get("kubeconfig"),
+                                    spec.get("rate_limits"))
+    return AppContext(api_client_factory=factory)
+
+def build_cluster_pool() -> Optional[ClusterPool]:
+    """Create the pool of named clusters from OPENSHIFT_MCP_CLUSTERS and OPENSHIFT_MCP_CLUSTERS_FILE, if any."""
+    specs = cluster_specs(OPENSHIFT_MCP_CLUSTERS, OPENSHIFT_MCP_CLUSTERS_FILE)
+    if not specs:
+        return None
+    return ClusterPool({name: functools.partial(cluster_app_context, spec) for name, spec in specs.items()})
 
 @asynccontextmanager
 async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
-    """Initialize Kubernetes/OpenShift client with username/password if provided via env vars, else use kube config."""
-    server_url = OPENSHIFT_SERVER
-    username = OPENSHIFT_USERNAME
-    password = OPENSHIFT_PASSWORD
-
-    if server_url and username and password:
-        api_client = get_api_client_with_token(server_url, username, password)
-        context = build_app_context(api_client)
+    """Create the (lazily connected) Kubernetes/OpenShift context and start any configured informers."""
+    context = build_app_context()
+    context.clusters = build_cluster_pool()
+
+    kinds = [kind.strip() for kind in OPENSHIFT_MCP_INFORMERS.split(',') if kind.strip()]
+    if kinds:
+        context.informers = InformerCache.for_context(
+            context, kinds,
+            watch_timeout=OPENSHIFT_MCP_INFORMER_WATCH_TIMEOUT,
+            max_staleness=OPENSHIFT_MCP_INFORMER_MAX_STALENESS,
+        )
+        context.graph = RelationshipIndex.attach(context.informers)
+        context.informers.start()
+    metrics_server = metrics.start_http_server(OPENSHIFT_MCP_METRICS_PORT) if OPENSHIFT_MCP_METRICS_PORT else None
+    try:
+        yield context
+    finally:
+        context.close()
+        if context.clusters:
+            context.clusters.close()
+        if metrics_server:
+            metrics_server.shutdown()
+
+def _coerce(value: str, annotation):
+    types = typing.get_args(annotation) or (annotation,)
+    if bool in types:
+        return value.lower() in ('1', 'true', 'yes')
+    if int in types:
+        return int(value)
+    return value
+
+def split_query(kwargs: dict, optional: dict) -> dict:
+    """Move a query string off the end of a resource URI parameter into keyword arguments.
+
+    "cluster://pods/ns?labelSelector=app%3Dweb&wide=true" matches the template with
+    namespace="ns?labelSelector=...", which becomes namespace="ns",
+    label_selector="app=web", wide=True. Keys may be camelCase or snake_case and
+    must name one of the optional parameters.
+    """
+    kwargs = dict(kwargs)
+    for key, value in list(kwargs.items()):
+        if not isinstance(value, str) or "?" not in value:
+            continue
+        kwargs[key], query = value.split("?", 1)
+        for name, raw in parse_qsl(query, keep_blank_values=True):
+            name = re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+            if name not in optional:
+                raise ValueError(f"Unknown query parameter {name!r}; expected one of {sorted(optional)}")
+            kwargs[name] = _coerce(raw, optional[name].annotation)
+    return kwargs
+
+def bind_context(func: Callable, params: Optional[set] = None) -> Callable:
+    """Expose func to FastMCP with its ctx parameter typed as Context so the request context is injected.
+
+    If params is given, only those parameters (plus ctx) are exposed; resource
+    templates must take exactly their URI parameters. The rest keep their defaults
+    unless set in a query string on the URI (see split_query).
+    An empty params set means a fixed resource URI: FastMCP never matches a template
+    without parameters, so ctx is hidden as well and fetched from the current request.
+    """
+    sig = inspect.signature(func)
+    fixed = params is not None and not params
+    optional = {
+        name: p for name, p in sig.parameters.items()
+        if params and name not in params and name != "ctx"
+    }
+    parameters = [
+        p.replace(annotation=Context) if name == "ctx" else p
+        for name, p in sig.parameters.items()
+        if params is None or name in params or (name == "ctx" and not fixed)
+    ]
+
+    def with_context(kwargs):
+        if optional:
+            kwargs = split_query(kwargs, optional)
+        return {**kwargs, "ctx": mcp.get_context()} if fixed else kwargs
+
+    if inspect.iscoroutinefunction(func):
+        async def bound(**kwargs):
+            return await func(**with_context(kwargs))
     else:
-        config.load_kube_config()
-        context = build_app_context()
+        def bound(**kwargs):
+            return func(**with_context(kwargs))
+    functools.update_wrapper(bound, func)
+    del bound.__wrapped__
+    bound.__signature__ = sig.replace(parameters=parameters)
+    bound.__annotations__ = {p.name: p.annotation for p in parameters if p.annotation is not inspect.Parameter.empty}
+    return bound
+
+def as_handler(func, params: Optional[set] = None, per_cluster: bool = True):
+    """Adapt a blocking tool for registration: record its metrics and, in async mode, offload it to the thread pool.
 
-    yield context
+    With per_cluster the tool also takes an optional cluster parameter (see with_cluster).
+    """
+    if per_cluster:
+        func = with_cluster(func)
+    func = metrics.instrument(func)
+    if OPENSHIFT_MCP_ASYNC_TOOLS:
+        func = run_in_executor(func, tool_timeout(func.__name__))
+    return bind_context(func, params)
 
 # Create an MCP server for OpenShift operations with lifespan
 mcp = FastMCP("OpenShift MCP Server", lifespan=app_lifespan)
@@ -75,9 +280,14 @@ mcp = FastMCP("OpenShift MCP Server", lifespan=app_lifespan)
 # Register tools
 for tool in [
     list_namespaces, list_pods, get_pod_logs, list_deployments, list_routes,
-    get_route, list_services, get_service, create_deployment, validate_openshift_manifest
+    get_route, list_services, get_service, create_deployment, apply_manifests, validate_openshift_manifest,
+    get_cache_status, search_pod_logs, get_connection_pool_stats,
+    get_pods_summary, get_deployments_summary, get_events_summary, get_cluster_snapshot, get_changes,
+    aggregate_events, get_owner_chain, get_backing_pods, wait_for_rollout
 ]:
-    mcp.tool()(tool)
+    mcp.tool()(as_handler(tool))
+for tool in [list_clusters, query_clusters, validate_manifests]:
+    mcp.tool()(as_handler(tool, per_cluster=False))
 
 # Register resources
 resource_map = {
@@ -97,6 +307,8 @@ resource_map = {
     "cluster://serviceaccounts/{namespace}": list_serviceaccounts,
     "cluster://resourcequotas/{namespace}": list_resourcequotas,
     "cluster://events/{namespace}": list_events,
+    "cluster://snapshot": get_cluster_snapshot,
 }
 for uri, func in resource_map.items():
-    mcp.resource(uri)(func)
+    mcp.resource(uri)(as_handler(func, set(re.findall(r"{(\w+)}", uri))))
+mcp.resource("cluster://metrics", mime_type=metrics.CONTENT_TYPE)(as_handler(get_metrics, set(), per_cluster=False))
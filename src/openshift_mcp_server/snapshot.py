@@ -0,0 +1,81 @@
+"""Cluster-wide inventory built from one all-namespaces LIST per kind.
+
+Every kind is listed across all namespaces at once (metadata only), the kinds
+concurrently, and the objects are counted per namespace in a single pass.
+A full overview therefore costs about one request per kind and page instead of
+one per kind and namespace. Kinds held by a synced informer are counted from
+the cache instead.
+"""
+import contextvars
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Optional
+
+from openshift_mcp_server.informer import InformerCache
+from openshift_mcp_server.kinds import get_kind
+from openshift_mcp_server.pagination import iter_items
+from openshift_mcp_server.representation import PARTIAL_OBJECT_METADATA, accept
+
+DEFAULT_KINDS = (
+    "namespaces", "pods", "deployments", "services", "routes", "configmaps", "secrets",
+    "pvcs", "jobs", "ingresses", "serviceaccounts", "events",
+)
+
+
+def _namespaces_of(app_context: Any, kind_name: str, informers: Optional[InformerCache], page_size: int) -> Iterable[str]:
+    informer = informers.get(kind_name) if informers else None
+    if informer is not None:
+        objs = informer.list()
+    else:
+        kind = get_kind(kind_name)
+        list_func = getattr(getattr(app_context, kind.api), kind.list_all)
+        objs = iter_items(list_func, page_size=page_size, **kind.list_kwargs)
+    key = "name" if kind_name == "namespaces" else "namespace"
+    for obj in objs:
+        yield obj["metadata"].get(key, "")
+
+
+def count_kind(app_context: Any, kind_name: str, informers: Optional[InformerCache], page_size: int) -> Counter:
+    """Number of objects of a kind in each namespace (for namespaces: 1 per existing namespace)."""
+    with accept(PARTIAL_OBJECT_METADATA):
+        return Counter(_namespaces_of(app_context, kind_name, informers, page_size))
+
+
+def take_snapshot(app_context: Any, kinds: Iterable[str], page_size: int,
+                  informers: Optional[InformerCache] = None) -> Dict[str, Any]:
+    """Per-namespace object counts of each kind, plus cluster totals and per-kind errors.
+
+    A kind that cannot be listed (forbidden, or not served by this cluster) is
+    reported under "errors" and left out of the counts.
+    """
+    kinds = list(dict.fromkeys(kinds))
+    for kind_name in kinds:
+        get_kind(kind_name)
+    context = contextvars.copy_context()
+    with ThreadPoolExecutor(max_workers=max(1, len(kinds)), thread_name_prefix="snapshot") as pool:
+        # Each list runs in a copy of the caller's context so cancellation reaches it.
+        futures = {
+            kind_name: pool.submit(context.copy().run, count_kind, app_context, kind_name, informers, page_size)
+            for kind_name in kinds
+        }
+    namespaces: Dict[str, Dict[str, int]] = {}
+    totals: Dict[str, int] = {}
+    errors: Dict[str, str] = {}
+    for kind_name, future in futures.items():
+        try:
+            counts = future.result()
+        except Exception as e:
+            errors[kind_name] = str(e)
+            continue
+        totals[kind_name] = sum(counts.values())
+        for namespace, count in counts.items():
+            inventory = namespaces.setdefault(namespace, {})
+            if kind_name != "namespaces":
+                inventory[kind_name] = count
+    result = {
+        "totals": totals,
+        "namespaces": {namespace: namespaces[namespace] for namespace in sorted(namespaces)},
+    }
+    if errors:
+        result["errors"] = errors
+    return result
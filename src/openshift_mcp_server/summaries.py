@@ -0,0 +1,139 @@
+"""Compact per-kind summaries of raw API objects, returned by the list tools when wide=True.
+
+Each summary picks a handful of status fields (phase, node, restarts, readiness, ...)
+out of the raw JSON dict so that a follow-up get call is rarely needed.
+"""
+from typing import Callable, Dict
+
+
+def _meta(obj: dict) -> dict:
+    return obj.get("metadata") or {}
+
+
+def namespace_summary(ns: dict) -> dict:
+    return {"name": _meta(ns)["name"], "phase": (ns.get("status") or {}).get("phase")}
+
+
+def pod_summary(pod: dict) -> dict:
+    spec = pod.get("spec") or {}
+    status = pod.get("status") or {}
+    statuses = status.get("containerStatuses") or []
+    return {
+        "name": _meta(pod)["name"],
+        "phase": status.get("phase"),
+        "node": spec.get("nodeName"),
+        "ready": f"{sum(1 for c in statuses if c.get('ready'))}/{len(spec.get('containers') or statuses)}",
+        "restarts": sum(c.get("restartCount", 0) for c in statuses),
+    }
+
+
+def deployment_summary(dep: dict) -> dict:
+    status = dep.get("status") or {}
+    return {
+        "name": _meta(dep)["name"],
+        "replicas": (dep.get("spec") or {}).get("replicas"),
+        "ready": status.get("readyReplicas", 0),
+        "updated": status.get("updatedReplicas", 0),
+        "available": status.get("availableReplicas", 0),
+    }
+
+
+def route_summary(route: dict) -> dict:
+    spec = route.get("spec") or {}
+    return {"name": _meta(route)["name"], "host": spec.get("host"), "service": (spec.get("to") or {}).get("name")}
+
+
+def service_summary(svc: dict) -> dict:
+    spec = svc.get("spec") or {}
+    return {
+        "name": _meta(svc)["name"],
+        "type": spec.get("type", "ClusterIP"),
+        "cluster_ip": spec.get("clusterIP"),
+        "ports": [f"{p.get('port')}/{p.get('protocol', 'TCP')}" for p in spec.get("ports") or []],
+    }
+
+
+def configmap_summary(cm: dict) -> dict:
+    return {"name": _meta(cm)["name"], "keys": sorted({**(cm.get("data") or {}), **(cm.get("binaryData") or {})})}
+
+
+def secret_summary(secret: dict) -> dict:
+    # Never include the data, not even its keys. Table rows carry the type as a column.
+    return {"name": _meta(secret)["name"], "type": secret.get("type") or (secret.get("cells") or {}).get("Type")}
+
+
+def job_summary(job: dict) -> dict:
+    status = job.get("status") or {}
+    return {
+        "name": _meta(job)["name"],
+        "active": status.get("active", 0),
+        "succeeded": status.get("succeeded", 0),
+        "failed": status.get("failed", 0),
+        "completion_time": status.get("completionTime"),
+    }
+
+
+def pvc_summary(pvc: dict) -> dict:
+    spec = pvc.get("spec") or {}
+    status = pvc.get("status") or {}
+    return {
+        "name": _meta(pvc)["name"],
+        "phase": status.get("phase"),
+        "capacity": (status.get("capacity") or {}).get("storage"),
+        "storage_class": spec.get("storageClassName"),
+        "volume": spec.get("volumeName"),
+    }
+
+
+def ingress_summary(ingress: dict) -> dict:
+    rules = (ingress.get("spec") or {}).get("rules") or []
+    return {"name": _meta(ingress)["name"], "hosts": [rule.get("host") for rule in rules if rule.get("host")]}
+
+
+def rolebinding_summary(rb: dict) -> dict:
+    role = rb.get("roleRef") or {}
+    return {
+        "name": _meta(rb)["name"],
+        "role": f"{role.get('kind')}/{role.get('name')}",
+        "subjects": [f"{s.get('kind')}/{s.get('name')}" for s in rb.get("subjects") or []],
+    }
+
+
+def serviceaccount_summary(sa: dict) -> dict:
+    return {"name": _meta(sa)["name"], "created": _meta(sa).get("creationTimestamp")}
+
+
+def resourcequota_summary(quota: dict) -> dict:
+    status = quota.get("status") or {}
+    return {"name": _meta(quota)["name"], "hard": status.get("hard") or {}, "used": status.get("used") or {}}
+
+
+def event_summary(event: dict) -> dict:
+    obj = event.get("involvedObject") or {}
+    return {
+        "name": _meta(event)["name"],
+        "type": event.get("type"),
+        "reason": event.get("reason"),
+        "object": f"{obj.get('kind')}/{obj.get('name')}",
+        "count": event.get("count"),
+        "last_seen": event.get("lastTimestamp") or event.get("eventTime"),
+        "message": event.get("message"),
+    }
+
+
+SUMMARIES: Dict[str, Callable[[dict], dict]] = {
+    "namespaces": namespace_summary,
+    "pods": pod_summary,
+    "deployments": deployment_summary,
+    "routes": route_summary,
+    "services": service_summary,
+    "configmaps": configmap_summary,
+    "secrets": secret_summary,
+    "jobs": job_summary,
+    "pvcs": pvc_summary,
+    "ingresses": ingress_summary,
+    "rolebindings": rolebinding_summary,
+    "serviceaccounts": serviceaccount_summary,
+    "resourcequotas": resourcequota_summary,
+    "events": event_summary,
+}
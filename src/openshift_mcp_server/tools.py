@@ -1,66 +1,291 @@
-from typing import List, Optional
+import contextvars
+import math
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Optional
+from openshift_mcp_server.config import (
+    OPENSHIFT_MCP_LIST_PAGE_SIZE, OPENSHIFT_MCP_CHANGES_WATCH_SECONDS,
+    OPENSHIFT_MCP_FANOUT_TIMEOUT, OPENSHIFT_MCP_FANOUT_WORKERS,
+    OPENSHIFT_MCP_LOG_MAX_BYTES, OPENSHIFT_MCP_LOG_CHUNK_SIZE,
+    OPENSHIFT_MCP_LOG_FOLLOW_SECONDS, OPENSHIFT_MCP_LOG_SEARCH_WORKERS, OPENSHIFT_MCP_LOG_SEARCH_MAX_BYTES,
+    OPENSHIFT_MCP_APPLY_CONCURRENCY, OPENSHIFT_MCP_APPLY_QPS, OPENSHIFT_MCP_FIELD_MANAGER,
+    OPENSHIFT_MCP_ROLLOUT_TIMEOUT
+)
+from openshift_mcp_server.apply import apply_all, apply_errors
+from openshift_mcp_server.clusters import fan_out
+from openshift_mcp_server.connection import pool_stats
+from openshift_mcp_server.delta import (
+    ResourceVersionExpired, collection, decode_cursor, encode_cursor, list_collection, watch_changes
+)
 from openshift_mcp_server.errors import error_response
+from openshift_mcp_server.events import EventAggregator
+from openshift_mcp_server.executor import report_partial, tool_timeout
+from openshift_mcp_server.fastjson import loads
+from openshift_mcp_server.graph import BACKING_KINDS, GRAPH_KINDS, OWNER_KINDS, RelationshipIndex, normalize_kind
+from openshift_mcp_server.kinds import get_kind
+from openshift_mcp_server.labels import selector_to_string
 from openshift_mcp_server.logging_utils import logger
+from openshift_mcp_server.logsearch import SearchBudget, compile_pattern, pod_containers, search_pods
+from openshift_mcp_server.logstream import LogStream
+from openshift_mcp_server.metrics import REGISTRY
+from openshift_mcp_server.pagination import iter_items, iter_pages
+from openshift_mcp_server.ratelimit import TokenBucket
+from openshift_mcp_server.rollout import RolloutWatch
+from openshift_mcp_server.representation import PARTIAL_OBJECT_METADATA, TABLE, accept
 from openshift_mcp_server.security import validate_deployment_manifest_security
-
-
-def list_namespaces(ctx) -> List[str]:
+from openshift_mcp_server.snapshot import DEFAULT_KINDS, take_snapshot
+from openshift_mcp_server.summaries import SUMMARIES, secret_summary
+from openshift_mcp_server.validation import (
+    check_deployment, document_key, load_documents, validate_batch, validate_document
+)
+
+
+def _cached(ctx, kind: str, namespace: Optional[str] = None, *bypass) -> Optional[List[dict]]:
+    """Objects of a kind from the informer cache, or None when the cache cannot serve them.
+
+    Any truthy value in bypass (a page size, a cursor, a selector) asks for something
+    only the apiserver can answer, so the cache is skipped.
+    """
+    if any(bypass):
+        return None
+    informers = ctx.request_context.lifespan_context.informers
+    informer = informers.get(kind) if informers else None
+    if informer is None:
+        return None
+    return informer.list(namespace)
+
+
+def _name(obj: dict) -> str:
+    return obj["metadata"]["name"]
+
+
+def _object(obj: dict) -> dict:
+    """The object itself, without metadata.managedFields (as kubectl prints it)."""
+    metadata = {key: value for key, value in obj["metadata"].items() if key != "managedFields"}
+    return {**obj, "metadata": metadata}
+
+
+def _projection(kind: str, wide: bool) -> Callable:
+    """What a list tool returns per object: its name, or with wide=True a summary of its status.
+
+    Kinds without a summary return the whole object with wide=True.
+    """
+    return SUMMARIES.get(kind, _object) if wide else _name
+
+
+def _list(list_func: Callable, *args, page_size: Optional[int] = None, cursor: Optional[str] = None,
+          project: Callable = _name, representation: Optional[str] = None, **kwargs):
+    """Project every item of a collection, fetched in pages of OPENSHIFT_MCP_LIST_PAGE_SIZE.
+
+    Items are raw JSON dicts, so project should pick out only the fields the tool returns.
+    When only names are wanted (the default project) the apiserver is asked for
+    object metadata alone; pass another representation (e.g. TABLE) to override.
+
+    When the caller passes a page_size or a cursor, only that one page is fetched and
+    {"items": [...], "cursor": <next cursor or None>} is returned instead.
+    """
+    if representation is None and project is _name:
+        representation = PARTIAL_OBJECT_METADATA
+    with accept(representation):
+        if page_size or cursor:
+            items, next_cursor = next(iter_pages(
+                list_func, *args, page_size=page_size or OPENSHIFT_MCP_LIST_PAGE_SIZE, cursor=cursor, **kwargs
+            ))
+            return {"items": [project(item) for item in items], "cursor": next_cursor}
+        return [project(item) for item in iter_items(list_func, *args, page_size=OPENSHIFT_MCP_LIST_PAGE_SIZE, **kwargs)]
+
+
+def _table(kind: str, list_func: Callable, *args, page_size: Optional[int] = None,
+           cursor: Optional[str] = None, **kwargs) -> dict:
+    """Fetch a collection as the apiserver's Table: {"columns": [...], "rows": [[...], ...]}.
+
+    Only the columns kubectl prints travel over the wire. If the server cannot render
+    a Table, rows fall back to the kind's wide summary of each full object. With a
+    page_size or cursor a single page is returned, with the next "cursor".
+    """
+    def cells(item: dict) -> dict:
+        return item["cells"] if "cells" in item else _projection(kind, True)(item)
+
+    page = _list(list_func, *args, page_size=page_size, cursor=cursor, project=cells, representation=TABLE, **kwargs)
+    items = page["items"] if isinstance(page, dict) else page
+    result = {"columns": list(items[0]) if items else [], "rows": [list(item.values()) for item in items]}
+    if isinstance(page, dict):
+        result["cursor"] = page["cursor"]
+    return result
+
+
+def list_namespaces(ctx, page_size: Optional[int] = None, cursor: Optional[str] = None,
+                    label_selector: Optional[str] = None, field_selector: Optional[str] = None,
+                    wide: bool = False) -> list:
     """List all namespaces in the cluster."""
     try:
         k8s_api = ctx.request_context.lifespan_context.k8s_api
-        namespaces = k8s_api.list_namespace()
-        return [ns.metadata.name for ns in namespaces.items]
+        project = _projection("namespaces", wide)
+        cached = _cached(ctx, "namespaces", None, page_size, cursor, label_selector, field_selector)
+        if cached is not None:
+            return [project(obj) for obj in cached]
+        return _list(k8s_api.list_namespace, page_size=page_size, cursor=cursor,
+                     label_selector=label_selector, field_selector=field_selector, project=project)
     except Exception as e:
         logger.error(f"Failed to list namespaces: {e}")
         return error_response("Failed to list namespaces", str(e))
 
 
-def list_pods(namespace: str, ctx) -> List[str]:
+def list_pods(namespace: str, ctx, page_size: Optional[int] = None, cursor: Optional[str] = None,
+              label_selector: Optional[str] = None, field_selector: Optional[str] = None,
+              wide: bool = False) -> list:
     """List all pods in the given namespace."""
     try:
         k8s_api = ctx.request_context.lifespan_context.k8s_api
-        pods = k8s_api.list_namespaced_pod(namespace)
-        return [pod.metadata.name for pod in pods.items]
+        project = _projection("pods", wide)
+        cached = _cached(ctx, "pods", namespace, page_size, cursor, label_selector, field_selector)
+        if cached is not None:
+            return [project(obj) for obj in cached]
+        return _list(k8s_api.list_namespaced_pod, namespace, page_size=page_size, cursor=cursor,
+                     label_selector=label_selector, field_selector=field_selector, project=project)
     except Exception as e:
         logger.error(f"Failed to list pods in {namespace}: {e}")
         return error_response(f"Failed to list pods in {namespace}", str(e))
 
 
-def get_pod_logs(namespace: str, pod_name: str, ctx, container: Optional[str] = None) -> dict:
-    """Get logs for a specific pod (and optionally container) in a namespace."""
+def _since_seconds(since_seconds: Optional[int], since_time: Optional[str]) -> Optional[int]:
+    """Resolve since_time (RFC 3339) to the since_seconds the log API understands."""
+    if since_time is None:
+        return since_seconds
+    if since_seconds is not None:
+        raise ValueError("Pass either since_seconds or since_time, not both")
+    start = datetime.fromisoformat(since_time.replace("Z", "+00:00"))
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+    return max(1, math.ceil((datetime.now(timezone.utc) - start).total_seconds()))
+
+
+def get_pod_logs(namespace: str, pod_name: str, ctx, container: Optional[str] = None,
+                 tail_lines: Optional[int] = None, since_seconds: Optional[int] = None,
+                 since_time: Optional[str] = None, limit_bytes: Optional[int] = None,
+                 previous: bool = False, timestamps: bool = False,
+                 stream: bool = False, follow: bool = False) -> dict:
+    """Get logs for a specific pod (and optionally container) in a namespace.
+
+    Output is capped at limit_bytes, and never exceeds OPENSHIFT_MCP_LOG_MAX_BYTES.
+    With stream=True the log is read in chunks and each chunk is also sent to the
+    client as a log notification; follow=True keeps streaming new output for up to
+    OPENSHIFT_MCP_LOG_FOLLOW_SECONDS.
+    """
     try:
         k8s_api = ctx.request_context.lifespan_context.k8s_api
-        logs = k8s_api.read_namespaced_pod_log(
-            name=pod_name,
-            namespace=namespace,
-            container=container
+        max_bytes = min(limit_bytes, OPENSHIFT_MCP_LOG_MAX_BYTES) if limit_bytes else OPENSHIFT_MCP_LOG_MAX_BYTES
+        params = dict(
+            container=container,
+            tail_lines=tail_lines,
+            since_seconds=_since_seconds(since_seconds, since_time),
+            previous=previous,
+            timestamps=timestamps
         )
-        return {"logs": logs}
+        if not (stream or follow):
+            logs = k8s_api.read_namespaced_pod_log(name=pod_name, namespace=namespace, limit_bytes=max_bytes, **params)
+            return {"logs": logs, "truncated": len(logs.encode()) >= max_bytes}
+        log_stream = LogStream.open(
+            k8s_api, namespace, pod_name, max_bytes, OPENSHIFT_MCP_LOG_CHUNK_SIZE,
+            follow=follow, follow_seconds=OPENSHIFT_MCP_LOG_FOLLOW_SECONDS, **params
+        )
+        chunks = []
+        for chunk in log_stream.chunks():
+            chunks.append(chunk)
+            report_partial(ctx, chunk)
+        return {"logs": "".join(chunks), "truncated": log_stream.truncated}
     except Exception as e:
         logger.error(f"Failed to get logs for pod {pod_name} in {namespace}: {e}")
         return error_response(f"Failed to get logs for pod {pod_name} in {namespace}", str(e))
 
 
-def list_deployments(namespace: str, ctx) -> List[str]:
+def search_pod_logs(namespace: str, pattern: str, ctx, label_selector: Optional[str] = None,
+                    deployment: Optional[str] = None, container: Optional[str] = None,
+                    context_lines: int = 0, max_matches: int = 100, ignore_case: bool = False,
+                    tail_lines: Optional[int] = None, since_seconds: Optional[int] = None) -> dict:
+    """Search the logs of every pod matching a label selector or deployment for a regex.
+
+    Logs are streamed from all pods/containers concurrently and filtered line by line on
+    the server; only matching lines (with context_lines around them) are returned. The
+    search stops early once max_matches is reached or OPENSHIFT_MCP_LOG_SEARCH_MAX_BYTES
+    have been read. line_number counts from the start of the fetched window.
+    """
+    try:
+        regex = compile_pattern(pattern, ignore_case)
+        k8s_api = ctx.request_context.lifespan_context.k8s_api
+        if deployment:
+            apps_api = ctx.request_context.lifespan_context.apps_api
+            dep = loads(apps_api.read_namespaced_deployment(deployment, namespace, _preload_content=False).data)
+            label_selector = selector_to_string(dep["spec"]["selector"])
+        if not label_selector:
+            return error_response("Pass a label_selector or a deployment to choose the pods to search")
+        targets = [
+            target
+            for pod in iter_items(k8s_api.list_namespaced_pod, namespace, label_selector=label_selector,
+                                  page_size=OPENSHIFT_MCP_LIST_PAGE_SIZE)
+            for target in pod_containers(pod, container)
+        ]
+        budget = SearchBudget(max_matches, OPENSHIFT_MCP_LOG_SEARCH_MAX_BYTES)
+        errors = search_pods(
+            k8s_api, namespace, targets, regex, budget,
+            workers=OPENSHIFT_MCP_LOG_SEARCH_WORKERS,
+            max_bytes_per_stream=OPENSHIFT_MCP_LOG_MAX_BYTES,
+            chunk_size=OPENSHIFT_MCP_LOG_CHUNK_SIZE,
+            context_lines=context_lines,
+            tail_lines=tail_lines,
+            since_seconds=since_seconds
+        )
+        matches = sorted(budget.matches, key=lambda m: (m["pod"], m["container"], m["line_number"]))
+        result = {
+            "matches": matches,
+            "streams_searched": len(targets),
+            "truncated": budget.truncated,
+        }
+        if errors:
+            result["errors"] = errors
+        return result
+    except Exception as e:
+        logger.error(f"Failed to search pod logs in {namespace}: {e}")
+        return error_response(f"Failed to search pod logs in {namespace}", str(e))
+
+
+def list_deployments(namespace: str, ctx, page_size: Optional[int] = None, cursor: Optional[str] = None,
+                     label_selector: Optional[str] = None, field_selector: Optional[str] = None,
+                     wide: bool = False) -> list:
     """List all deployments in the given namespace."""
     try:
         apps_api = ctx.request_context.lifespan_context.apps_api
-        deployments = apps_api.list_namespaced_deployment(namespace)
-        return [dep.metadata.name for dep in deployments.items]
+        project = _projection("deployments", wide)
+        cached = _cached(ctx, "deployments", namespace, page_size, cursor, label_selector, field_selector)
+        if cached is not None:
+            return [project(obj) for obj in cached]
+        return _list(apps_api.list_namespaced_deployment, namespace, page_size=page_size, cursor=cursor,
+                     label_selector=label_selector, field_selector=field_selector, project=project)
     except Exception as e:
         logger.error(f"Failed to list deployments in {namespace}: {e}")
         return error_response(f"Failed to list deployments in {namespace}", str(e))
 
 
-def list_routes(namespace: str, ctx) -> List[str]:
+def list_routes(namespace: str, ctx, page_size: Optional[int] = None, cursor: Optional[str] = None,
+                label_selector: Optional[str] = None, field_selector: Optional[str] = None,
+                wide: bool = False) -> list:
+    project = _projection("routes", wide)
+    cached = _cached(ctx, "routes", namespace, page_size, cursor, label_selector, field_selector)
+    if cached is not None:
+        return [project(obj) for obj in cached]
     route_api = ctx.request_context.lifespan_context.route_api
-    routes = route_api.list_namespaced_custom_object(
+    return _list(
+        route_api.list_namespaced_custom_object,
         group="route.openshift.io",
         version="v1",
         namespace=namespace,
-        plural="routes"
+        plural="routes",
+        page_size=page_size,
+        cursor=cursor,
+        label_selector=label_selector,
+        field_selector=field_selector,
+        project=project
     )
-    return [item["metadata"]["name"] for item in routes.get("items", [])]
 
 
 def get_route(namespace: str, route_name: str, ctx) -> dict:
@@ -79,10 +304,16 @@ def get_route(namespace: str, route_name: str, ctx) -> dict:
         return error_response(f"Failed to get route {route_name}", str(e))
 
 
-def list_services(namespace: str, ctx) -> List[str]:
+def list_services(namespace: str, ctx, page_size: Optional[int] = None, cursor: Optional[str] = None,
+                  label_selector: Optional[str] = None, field_selector: Optional[str] = None,
+                  wide: bool = False) -> list:
+    project = _projection("services", wide)
+    cached = _cached(ctx, "services", namespace, page_size, cursor, label_selector, field_selector)
+    if cached is not None:
+        return [project(obj) for obj in cached]
     k8s_api = ctx.request_context.lifespan_context.k8s_api
-    services = k8s_api.list_namespaced_service(namespace)
-    return [svc.metadata.name for svc in services.items]
+    return _list(k8s_api.list_namespaced_service, namespace, page_size=page_size, cursor=cursor,
+                 label_selector=label_selector, field_selector=field_selector, project=project)
 
 
 def get_service(namespace: str, service_name: str, ctx) -> dict:
@@ -95,87 +326,133 @@ def get_service(namespace: str, service_name: str, ctx) -> dict:
         return error_response(f"Failed to get service {service_name}", str(e))
 
 
-def list_configmaps(namespace: str, ctx) -> list:
+def list_configmaps(namespace: str, ctx, page_size: Optional[int] = None, cursor: Optional[str] = None,
+                    label_selector: Optional[str] = None, field_selector: Optional[str] = None,
+                    wide: bool = False) -> list:
     """List all ConfigMaps in the given namespace."""
     k8s_api = ctx.request_context.lifespan_context.k8s_api
     try:
-        cms = k8s_api.list_namespaced_config_map(namespace)
-        return [cm.metadata.name for cm in cms.items]
+        project = _projection("configmaps", wide)
+        cached = _cached(ctx, "configmaps", namespace, page_size, cursor, label_selector, field_selector)
+        if cached is not None:
+            return [project(obj) for obj in cached]
+        return _list(k8s_api.list_namespaced_config_map, namespace, page_size=page_size, cursor=cursor,
+                     label_selector=label_selector, field_selector=field_selector, project=project)
     except Exception as e:
         logger.error(f"Failed to list ConfigMaps in {namespace}: {e}")
         return error_response(f"Failed to list ConfigMaps in {namespace}", str(e))
 
 
-def list_secrets(namespace: str, ctx) -> list:
+def list_secrets(namespace: str, ctx, page_size: Optional[int] = None, cursor: Optional[str] = None,
+                 label_selector: Optional[str] = None, field_selector: Optional[str] = None,
+                 wide: bool = False) -> list:
     """List all Secrets in the given namespace (only names and types, not data)."""
     k8s_api = ctx.request_context.lifespan_context.k8s_api
     try:
-        secrets = k8s_api.list_namespaced_secret(namespace)
-        # Only return name and type, not secret data
-        return [{"name": s.metadata.name, "type": s.type} for s in secrets.items]
+        # Only name and type, never the secret data; wide adds nothing here.
+        project = secret_summary
+        cached = _cached(ctx, "secrets", namespace, page_size, cursor, label_selector, field_selector)
+        if cached is not None:
+            return [project(obj) for obj in cached]
+        # PartialObjectMetadata has no type, but the Table columns do, and neither carries the data.
+        return _list(k8s_api.list_namespaced_secret, namespace, page_size=page_size, cursor=cursor,
+                     label_selector=label_selector, field_selector=field_selector, project=project,
+                     representation=TABLE)
     except Exception as e:
         logger.error(f"Failed to list Secrets in {namespace}: {e}")
         return error_response(f"Failed to list Secrets in {namespace}", str(e))
 
 
-def list_jobs(namespace: str, ctx) -> list:
+def list_jobs(namespace: str, ctx, page_size: Optional[int] = None, cursor: Optional[str] = None,
+              label_selector: Optional[str] = None, field_selector: Optional[str] = None,
+              wide: bool = False) -> list:
     """List all Jobs in the given namespace."""
     batch_api = ctx.request_context.lifespan_context.batch_api
     try:
-        jobs = batch_api.list_namespaced_job(namespace)
-        return [job.metadata.name for job in jobs.items]
+        project = _projection("jobs", wide)
+        cached = _cached(ctx, "jobs", namespace, page_size, cursor, label_selector, field_selector)
+        if cached is not None:
+            return [project(obj) for obj in cached]
+        return _list(batch_api.list_namespaced_job, namespace, page_size=page_size, cursor=cursor,
+                     label_selector=label_selector, field_selector=field_selector, project=project)
     except Exception as e:
         logger.error(f"Failed to list Jobs in {namespace}: {e}")
         return error_response(f"Failed to list Jobs in {namespace}", str(e))
 
 
-def list_pvcs(namespace: str, ctx) -> list:
+def list_pvcs(namespace: str, ctx, page_size: Optional[int] = None, cursor: Optional[str] = None,
+              label_selector: Optional[str] = None, field_selector: Optional[str] = None,
+              wide: bool = False) -> list:
     """List all PersistentVolumeClaims in the given namespace."""
     k8s_api = ctx.request_context.lifespan_context.k8s_api
     try:
-        pvcs = k8s_api.list_namespaced_persistent_volume_claim(namespace)
-        return [pvc.metadata.name for pvc in pvcs.items]
+        project = _projection("pvcs", wide)
+        cached = _cached(ctx, "pvcs", namespace, page_size, cursor, label_selector, field_selector)
+        if cached is not None:
+            return [project(obj) for obj in cached]
+        return _list(k8s_api.list_namespaced_persistent_volume_claim, namespace, page_size=page_size, cursor=cursor,
+                     label_selector=label_selector, field_selector=field_selector, project=project)
     except Exception as e:
         logger.error(f"Failed to list PVCs in {namespace}: {e}")
         return error_response(f"Failed to list PVCs in {namespace}", str(e))
 
 
-def list_ingresses(namespace: str, ctx) -> list:
+def list_ingresses(namespace: str, ctx, page_size: Optional[int] = None, cursor: Optional[str] = None,
+                   label_selector: Optional[str] = None, field_selector: Optional[str] = None,
+                   wide: bool = False) -> list:
     """List all Ingresses in the given namespace."""
     networking_api = ctx.request_context.lifespan_context.networking_api
     try:
-        ingresses = networking_api.list_namespaced_ingress(namespace)
-        return [ing.metadata.name for ing in ingresses.items]
+        project = _projection("ingresses", wide)
+        cached = _cached(ctx, "ingresses", namespace, page_size, cursor, label_selector, field_selector)
+        if cached is not None:
+            return [project(obj) for obj in cached]
+        return _list(networking_api.list_namespaced_ingress, namespace, page_size=page_size, cursor=cursor,
+                     label_selector=label_selector, field_selector=field_selector, project=project)
     except Exception as e:
         logger.error(f"Failed to list Ingresses in {namespace}: {e}")
         return error_response(f"Failed to list Ingresses in {namespace}", str(e))
 
 
-def list_rolebindings(namespace: str, ctx) -> list:
+def list_rolebindings(namespace: str, ctx, page_size: Optional[int] = None, cursor: Optional[str] = None,
+                      label_selector: Optional[str] = None, field_selector: Optional[str] = None,
+                      wide: bool = False) -> list:
     """List all RoleBindings in the given namespace."""
     rbac_api = ctx.request_context.lifespan_context.rbac_api
     try:
-        rbs = rbac_api.list_namespaced_role_binding(namespace)
-        return [rb.metadata.name for rb in rbs.items]
+        project = _projection("rolebindings", wide)
+        cached = _cached(ctx, "rolebindings", namespace, page_size, cursor, label_selector, field_selector)
+        if cached is not None:
+            return [project(obj) for obj in cached]
+        return _list(rbac_api.list_namespaced_role_binding, namespace, page_size=page_size, cursor=cursor,
+                     label_selector=label_selector, field_selector=field_selector, project=project)
     except Exception as e:
         logger.error(f"Failed to list RoleBindings in {namespace}: {e}")
         return error_response(f"Failed to list RoleBindings in {namespace}", str(e))
 
 
-def get_all_services(namespace: str, ctx) -> dict:
+def get_all_services(namespace: str, ctx, label_selector: Optional[str] = None,
+                     field_selector: Optional[str] = None) -> dict:
     """List all services in a given namespace."""
     k8s_api = ctx.request_context.lifespan_context.k8s_api
     try:
+        cached = _cached(ctx, "services", namespace or None, label_selector, field_selector)
+        if cached is not None:
+            ns_services = {namespace: []} if namespace else {}
+            for svc in cached:
+                ns_services.setdefault(svc["metadata"]["namespace"], []).append(svc["metadata"]["name"])
+            return ns_services
         if namespace:
-            svcs = k8s_api.list_namespaced_service(namespace)
-            return {namespace: [svc.metadata.name for svc in svcs.items]}
+            return {namespace: _list(k8s_api.list_namespaced_service, namespace,
+                                     label_selector=label_selector, field_selector=field_selector)}
         else:
-            svcs = k8s_api.list_service_for_all_namespaces()
             ns_services = {}
-            for svc in svcs.items:
-                ns = svc.metadata.namespace
-                name = svc.metadata.name
-                ns_services.setdefault(ns, []).append(name)
+            with accept(PARTIAL_OBJECT_METADATA):
+                for svc in iter_items(k8s_api.list_service_for_all_namespaces, page_size=OPENSHIFT_MCP_LIST_PAGE_SIZE,
+                                      label_selector=label_selector, field_selector=field_selector):
+                    ns = svc["metadata"]["namespace"]
+                    name = svc["metadata"]["name"]
+                    ns_services.setdefault(ns, []).append(name)
             return ns_services
     except Exception as e:
         logger.error(f"Failed to get services: {e}")
@@ -183,18 +460,185 @@ def get_all_services(namespace: str, ctx) -> dict:
 
 
 def get_cluster_info(ctx, namespace: Optional[str] = None) -> dict:
-    k8s_api = ctx.request_context.lifespan_context.k8s_api
+    app_context = ctx.request_context.lifespan_context
     try:
         if namespace:
-            ns_obj = k8s_api.read_namespace(namespace)
+            ns_obj = app_context.k8s_api.read_namespace(namespace)
             return {"namespace_status": ns_obj.status.phase}
-        version = k8s_api.get_api_versions()
+        # The API versions (GET /api) are served by CoreApi, not CoreV1Api.
+        version = app_context.core_api.get_api_versions()
         return {"api_versions": version.versions}
     except Exception as e:
         logger.error(f"Failed to get cluster info: {e}")
         return error_response("Failed to get cluster info", str(e))
 
 
+def get_cache_status(ctx) -> dict:
+    """Report sync state and staleness (seconds since last confirmed current) of each informer."""
+    informers = ctx.request_context.lifespan_context.informers
+    return informers.status() if informers else {}
+
+
+def get_connection_pool_stats(ctx) -> dict:
+    """Report utilization of the HTTP connection pools used to reach the apiserver."""
+    try:
+        return pool_stats(ctx.request_context.lifespan_context.k8s_api.api_client)
+    except Exception as e:
+        logger.error(f"Failed to get connection pool stats: {e}")
+        return error_response("Failed to get connection pool stats", str(e))
+
+
+def get_cluster_snapshot(ctx, kinds: Optional[str] = None) -> dict:
+    """Count the objects of each kind per namespace with one all-namespaces list per kind.
+
+    kinds is a comma-separated list of kind names (default: the common workload,
+    config and networking kinds). Kinds that cannot be listed are reported under "errors".
+    """
+    app_context = ctx.request_context.lifespan_context
+    wanted = [k.strip() for k in kinds.split(",") if k.strip()] if kinds else DEFAULT_KINDS
+    try:
+        return take_snapshot(app_context, wanted, OPENSHIFT_MCP_LIST_PAGE_SIZE, app_context.informers)
+    except Exception as e:
+        logger.error(f"Failed to take cluster snapshot: {e}")
+        return error_response("Failed to take cluster snapshot", str(e))
+
+
+def get_changes(kind: str, ctx, namespace: Optional[str] = None, cursor: Optional[str] = None,
+                label_selector: Optional[str] = None, field_selector: Optional[str] = None,
+                wide: bool = False, wait_seconds: Optional[int] = None) -> dict:
+    """Return what changed in a collection since the cursor of a previous call.
+
+    Without a cursor the collection is listed: {"items": [...], "cursor": ...}.
+    With one, the apiserver is watched from that point for wait_seconds and only the
+    changes are returned: {"changes": [{"type": "ADDED|MODIFIED|DELETED", "name": ...}], "cursor": ...}.
+    If the cursor is too old to resume from, the collection is listed again and
+    "relisted": true is set. Pass the returned cursor to the next call.
+    """
+    try:
+        kind_info = get_kind(kind)
+        project = _projection(kind, wide)
+        if cursor:
+            state = decode_cursor(cursor)
+            if (state["kind"], state["namespace"]) != (kind, namespace or None):
+                raise ValueError(f"Cursor was issued for {state['kind']} in {state['namespace'] or 'all namespaces'}")
+            label_selector, field_selector = state["label_selector"], state["field_selector"]
+        list_func, kwargs = collection(ctx.request_context.lifespan_context, kind_info, namespace)
+        selectors = {"label_selector": label_selector, "field_selector": field_selector, **kwargs}
+        if cursor:
+            try:
+                events, resource_version = watch_changes(
+                    list_func, resource_version=state["resource_version"],
+                    timeout_seconds=wait_seconds or OPENSHIFT_MCP_CHANGES_WATCH_SECONDS, **selectors
+                )
+                changes = []
+                for event_type, obj in events:
+                    change = {"type": event_type, "name": obj["metadata"]["name"]}
+                    if not namespace:
+                        change["namespace"] = obj["metadata"].get("namespace")
+                    if wide:
+                        change["object"] = project(obj)
+                    changes.append(change)
+                return {"changes": changes, "cursor": encode_cursor(kind, namespace or None, resource_version,
+                                                                    label_selector, field_selector)}
+            except ResourceVersionExpired:
+                logger.info(f"Changes cursor for {kind} expired, relisting")
+        with accept(None if wide else PARTIAL_OBJECT_METADATA):
+            items, resource_version = list_collection(list_func, page_size=OPENSHIFT_MCP_LIST_PAGE_SIZE, **selectors)
+        result = {"items": [project(item) for item in items],
+                  "cursor": encode_cursor(kind, namespace or None, resource_version, label_selector, field_selector)}
+        if cursor:
+            result["relisted"] = True
+        return result
+    except Exception as e:
+        logger.error(f"Failed to get changes of {kind}: {e}")
+        return error_response(f"Failed to get changes of {kind}", str(e))
+
+
+def _graph(ctx, namespace: str, kinds) -> RelationshipIndex:
+    """The informer-fed relationship index if it covers kinds, else one loaded from lists of the namespace."""
+    app_context = ctx.request_context.lifespan_context
+    if app_context.graph is not None and app_context.graph.covers(kinds):
+        return app_context.graph
+
+    def fetch(name: str) -> list:
+        kind = get_kind(name)
+        list_func = getattr(getattr(app_context, kind.api), kind.list_namespaced)
+        # Ownership and labels are metadata; services and routes need their spec.
+        with accept(PARTIAL_OBJECT_METADATA if name in OWNER_KINDS else None):
+            return list(iter_items(list_func, page_size=OPENSHIFT_MCP_LIST_PAGE_SIZE, namespace=namespace,
+                                   **kind.list_kwargs))
+
+    index = RelationshipIndex()
+    context = contextvars.copy_context()
+    with ThreadPoolExecutor(max_workers=len(kinds), thread_name_prefix="graph") as pool:
+        lists = list(pool.map(lambda name: context.copy().run(fetch, name), kinds))
+    for name, objs in zip(kinds, lists):
+        index.load(GRAPH_KINDS[name], objs)
+    return index
+
+
+def get_owner_chain(namespace: str, kind: str, name: str, ctx) -> dict:
+    """Which controllers own an object, following ownerReferences, e.g. Pod -> ReplicaSet -> Deployment."""
+    try:
+        kind = normalize_kind(kind)
+        return {"chain": _graph(ctx, namespace, OWNER_KINDS).owner_chain(kind, namespace, name)}
+    except Exception as e:
+        logger.error(f"Failed to get owner chain of {kind} {name} in {namespace}: {e}")
+        return error_response(f"Failed to get owner chain of {kind} {name} in {namespace}", str(e))
+
+
+def get_backing_pods(namespace: str, kind: str, name: str, ctx) -> dict:
+    """Which pods are behind an object, e.g. the pods serving a Route or owned by a Deployment.
+
+    Routes resolve through their services, services through their label selector,
+    and controllers (Deployment, ReplicaSet, StatefulSet, Job, CronJob, ...) through
+    the ownerReferences of what they created.
+    """
+    try:
+        kind = normalize_kind(kind)
+        index = _graph(ctx, namespace, BACKING_KINDS.get(kind, OWNER_KINDS))
+        return index.backing_pods(kind, namespace, name)
+    except Exception as e:
+        logger.error(f"Failed to get pods behind {kind} {name} in {namespace}: {e}")
+        return error_response(f"Failed to get pods behind {kind} {name} in {namespace}", str(e))
+
+
+def list_clusters(ctx) -> dict:
+    """List the named clusters tools can be pointed at with their cluster parameter."""
+    clusters = ctx.request_context.lifespan_context.clusters
+    return clusters.status() if clusters else {}
+
+
+def query_clusters(tool: str, ctx, clusters: Optional[str] = None, arguments: Optional[dict] = None,
+                   timeout_seconds: Optional[float] = None) -> dict:
+    """Run a read-only tool against many clusters at once.
+
+    clusters is a comma-separated list of cluster names (default: all of them) and
+    arguments the tool's own arguments, e.g. tool="list_pods", arguments={"namespace": "shop"}.
+    Returns {"results": {cluster: result}, "errors": {cluster: error}}; a cluster that
+    fails or does not answer within timeout_seconds is only reported under "errors".
+    """
+    try:
+        func = FANOUT_TOOLS.get(tool)
+        if func is None:
+            raise ValueError(f"Tool '{tool}' cannot be fanned out. Available: {', '.join(sorted(FANOUT_TOOLS))}")
+        pool = ctx.request_context.lifespan_context.clusters
+        if clusters:
+            names = [name.strip() for name in clusters.split(",") if name.strip()]
+        else:
+            names = pool.names() if pool else []
+        return fan_out(ctx, names, lambda cluster_ctx: func(ctx=cluster_ctx, **(arguments or {})),
+                       timeout_seconds or OPENSHIFT_MCP_FANOUT_TIMEOUT, OPENSHIFT_MCP_FANOUT_WORKERS)
+    except Exception as e:
+        logger.error(f"Failed to query clusters with {tool}: {e}")
+        return error_response(f"Failed to query clusters with {tool}", str(e))
+
+
+def get_metrics(ctx) -> str:
+    """Per-tool call counts, errors, latencies, response sizes and upstream API calls in Prometheus text format."""
+    return REGISTRY.render()
+
+
 def list_tools_and_resources(ctx) -> dict:
     from inspect import signature, getdoc
     from openshift_mcp_server.server import mcp
@@ -221,47 +665,95 @@ def create_deployment(namespace: str, deployment_manifest: dict, ctx) -> dict:
         return error_response("Failed to create deployment", str(e))
 
 
+def apply_manifests(ctx, manifests: Optional[list] = None, yaml_text: Optional[str] = None,
+                    namespace: Optional[str] = None, dry_run: bool = False, force: bool = False,
+                    concurrency: Optional[int] = None, qps: Optional[float] = None) -> dict:
+    """Create or update many manifests of any kind with server-side apply.
+
+    Every manifest must pass the checks of validate_manifests, including the security
+    checks of create_deployment, or nothing is applied. namespace is used for namespaced
+    objects without metadata.namespace. dry_run=True has the apiserver validate and
+    default each object without persisting it. force takes over fields owned by other
+    field managers instead of reporting a conflict. At most concurrency requests run at
+    once and at most qps are started per second.
+    """
+    try:
+        documents = list(manifests or []) + (load_documents(yaml_text) if yaml_text else [])
+        if not documents:
+            return error_response("Pass manifests or yaml_text")
+        problems = []
+        for index, document in enumerate(documents):
+            key = document_key(document, index)
+            errors = validate_document(document)["errors"] or apply_errors(document)
+            problems.extend(f"{key}: {error}" for error in errors)
+        if problems:
+            logger.error(f"Validation errors in manifests to apply: {problems}")
+            return error_response("Validation failed; nothing was applied", "; ".join(problems))
+        app_context = ctx.request_context.lifespan_context
+        concurrency = concurrency or OPENSHIFT_MCP_APPLY_CONCURRENCY
+        bucket = TokenBucket(qps or OPENSHIFT_MCP_APPLY_QPS, burst=concurrency)
+        return apply_all(app_context.api_client, app_context.discovery, documents, namespace,
+                         OPENSHIFT_MCP_FIELD_MANAGER, dry_run, force, concurrency, bucket)
+    except Exception as e:
+        logger.error(f"Failed to apply manifests: {e}")
+        return error_response("Failed to apply manifests", str(e))
+
+
+def wait_for_rollout(namespace: str, name: str, ctx, timeout_seconds: Optional[float] = None) -> dict:
+    """Wait for a Deployment's rollout to finish, e.g. after create_deployment or apply_manifests.
+
+    The Deployment and its pods are watched rather than polled, and each change of
+    progress (replica counts, reasons pods are failing) is sent to the client as a log
+    notification. Returns {"status": "complete|failed|timeout", "message", "replicas",
+    "failing_pods", "elapsed_seconds"}: failed on ProgressDeadlineExceeded or when pods
+    of the new revision are in CrashLoopBackOff, ImagePullBackOff and the like.
+    timeout_seconds defaults to OPENSHIFT_MCP_ROLLOUT_TIMEOUT and is capped a few
+    seconds below the tool's own timeout.
+    """
+    try:
+        app_context = ctx.request_context.lifespan_context
+        timeout = min(timeout_seconds or OPENSHIFT_MCP_ROLLOUT_TIMEOUT, tool_timeout("wait_for_rollout") - 5)
+        watch = RolloutWatch(app_context.apps_api, app_context.k8s_api, namespace, name)
+        return watch.wait(max(1.0, timeout), on_progress=lambda message: report_partial(ctx, message))
+    except Exception as e:
+        logger.error(f"Failed to wait for rollout of deployment {name} in {namespace}: {e}")
+        return error_response(f"Failed to wait for rollout of deployment {name} in {namespace}", str(e))
+
+
 def validate_openshift_manifest(manifest: dict, ctx) -> dict:
-    errors = []
-    warnings = []
-    if manifest.get("kind") != "Deployment":
-        errors.append("Manifest kind must be 'Deployment'.")
-    metadata = manifest.get("metadata", {})
-    if not metadata.get("name"):
-        errors.append("metadata.name is required.")
-    spec = manifest.get("spec", {})
-    template = spec.get("template", {})
-    spec_containers = template.get("spec", {}).get("containers", [])
-    if not spec_containers:
-        errors.append("At least one container must be defined in spec.template.spec.containers.")
-    if "hostNetwork" in template.get("spec", {}):
-        warnings.append("hostNetwork is discouraged in OpenShift unless absolutely required.")
-    for container in spec_containers:
-        resources = container.get("resources", {})
-        limits = resources.get("limits")
-        requests = resources.get("requests")
-        if not limits or not requests:
-            warnings.append(f"Container '{container.get('name','')}' should specify resource requests and limits.")
-    security_ctx = template.get("spec", {}).get("securityContext", {})
-    if security_ctx.get("runAsUser") == 0:
-        warnings.append("Running as root (runAsUser: 0) is discouraged in OpenShift.")
-    for container in spec_containers:
-        if container.get("imagePullPolicy") == "Always":
-            warnings.append(f"Container '{container.get('name','')}' uses imagePullPolicy: Always. Make sure this is intended.")
-    if "serviceAccountName" not in template.get("spec", {}):
-        warnings.append("No serviceAccountName specified. OpenShift recommends using dedicated service accounts.")
-    labels = metadata.get("labels", {})
-    if not labels.get("app"):
-        warnings.append("metadata.labels.app is recommended for OpenShift apps.")
-    return {"errors": errors, "warnings": warnings}
-
-
-def list_projects(ctx) -> list:
+    return check_deployment(manifest)
+
+
+def validate_manifests(ctx, manifests: Optional[list] = None, yaml_text: Optional[str] = None,
+                       fail_fast: bool = False, summary_only: bool = False) -> dict:
+    """Validate many manifests at once: a list of manifests and/or a multi-document YAML stream (e.g. a Helm render).
+
+    Every document gets structural and security checks, Deployments also the best-practice
+    checks of validate_openshift_manifest. Results are keyed by kind/namespace/name.
+    fail_fast stops at the first invalid document; summary_only returns only the counts
+    and the keys of the invalid documents.
+    """
+    if not manifests and not yaml_text:
+        return error_response("Pass manifests or yaml_text")
+    try:
+        return validate_batch(manifests, yaml_text, fail_fast=fail_fast, summary_only=summary_only)
+    except Exception as e:
+        logger.error(f"Failed to validate manifests: {e}")
+        return error_response("Failed to validate manifests", str(e))
+
+
+def list_projects(ctx, page_size: Optional[int] = None, cursor: Optional[str] = None,
+                  label_selector: Optional[str] = None, field_selector: Optional[str] = None,
+                  wide: bool = False) -> list:
     """List all OpenShift projects (namespaces with OpenShift metadata)."""
     k8s_api = ctx.request_context.lifespan_context.k8s_api
     try:
-        projects = k8s_api.list_namespace()
-        return [ns.metadata.name for ns in projects.items]
+        project = _projection("namespaces", wide)
+        cached = _cached(ctx, "namespaces", None, page_size, cursor, label_selector, field_selector)
+        if cached is not None:
+            return [project(obj) for obj in cached]
+        return _list(k8s_api.list_namespace, page_size=page_size, cursor=cursor,
+                     label_selector=label_selector, field_selector=field_selector, project=project)
     except Exception as e:
         if hasattr(e, 'status') and getattr(e, 'status', None) == 403:
             logger.error(f"Permission denied: {e}")
@@ -270,34 +762,133 @@ def list_projects(ctx) -> list:
         return error_response("Failed to list projects", str(e))
 
 
-def list_serviceaccounts(namespace: str, ctx) -> list:
+def list_serviceaccounts(namespace: str, ctx, page_size: Optional[int] = None, cursor: Optional[str] = None,
+                         label_selector: Optional[str] = None, field_selector: Optional[str] = None,
+                         wide: bool = False) -> list:
     """List all ServiceAccounts in the given namespace."""
     k8s_api = ctx.request_context.lifespan_context.k8s_api
     try:
-        sas = k8s_api.list_namespaced_service_account(namespace)
-        return [sa.metadata.name for sa in sas.items]
+        project = _projection("serviceaccounts", wide)
+        cached = _cached(ctx, "serviceaccounts", namespace, page_size, cursor, label_selector, field_selector)
+        if cached is not None:
+            return [project(obj) for obj in cached]
+        return _list(k8s_api.list_namespaced_service_account, namespace, page_size=page_size, cursor=cursor,
+                     label_selector=label_selector, field_selector=field_selector, project=project)
     except Exception as e:
         logger.error(f"Failed to list ServiceAccounts in {namespace}: {e}")
         return error_response(f"Failed to list ServiceAccounts in {namespace}", str(e))
 
 
-def list_resourcequotas(namespace: str, ctx) -> list:
+def list_resourcequotas(namespace: str, ctx, page_size: Optional[int] = None, cursor: Optional[str] = None,
+                        label_selector: Optional[str] = None, field_selector: Optional[str] = None,
+                        wide: bool = False) -> list:
     """List all ResourceQuotas in the given namespace."""
     k8s_api = ctx.request_context.lifespan_context.k8s_api
     try:
-        rqs = k8s_api.list_namespaced_resource_quota(namespace)
-        return [rq.metadata.name for rq in rqs.items]
+        project = _projection("resourcequotas", wide)
+        cached = _cached(ctx, "resourcequotas", namespace, page_size, cursor, label_selector, field_selector)
+        if cached is not None:
+            return [project(obj) for obj in cached]
+        return _list(k8s_api.list_namespaced_resource_quota, namespace, page_size=page_size, cursor=cursor,
+                     label_selector=label_selector, field_selector=field_selector, project=project)
     except Exception as e:
         logger.error(f"Failed to list ResourceQuotas in {namespace}: {e}")
         return error_response(f"Failed to list ResourceQuotas in {namespace}", str(e))
 
 
-def list_events(namespace: str, ctx) -> list:
+def list_events(namespace: str, ctx, page_size: Optional[int] = None, cursor: Optional[str] = None,
+                label_selector: Optional[str] = None, field_selector: Optional[str] = None,
+                wide: bool = False) -> list:
     """List all Events in the given namespace."""
     k8s_api = ctx.request_context.lifespan_context.k8s_api
     try:
-        events = k8s_api.list_namespaced_event(namespace)
-        return [event.metadata.name for event in events.items]
+        project = _projection("events", wide)
+        cached = _cached(ctx, "events", namespace, page_size, cursor, label_selector, field_selector)
+        if cached is not None:
+            return [project(obj) for obj in cached]
+        return _list(k8s_api.list_namespaced_event, namespace, page_size=page_size, cursor=cursor,
+                     label_selector=label_selector, field_selector=field_selector, project=project)
     except Exception as e:
         logger.error(f"Failed to list Events in {namespace}: {e}")
         return error_response(f"Failed to list Events in {namespace}", str(e))
+
+
+def aggregate_events(namespace: str, ctx, event_type: Optional[str] = None, since_seconds: Optional[int] = None,
+                     since_time: Optional[str] = None, top: int = 20, label_selector: Optional[str] = None,
+                     field_selector: Optional[str] = None) -> dict:
+    """Group the events in a namespace by involved object, reason and type and return the top groups.
+
+    Each group reports its total count, first/last seen times and latest message.
+    event_type (e.g. "Warning") is filtered by the apiserver; since_seconds or
+    since_time (RFC 3339) keeps only events last seen within that window.
+    """
+    try:
+        since = _since_seconds(since_seconds, since_time)
+        start = datetime.now(timezone.utc) - timedelta(seconds=since) if since is not None else None
+        aggregator = EventAggregator(start, event_type)
+        cached = _cached(ctx, "events", namespace, label_selector, field_selector)
+        if cached is not None:
+            aggregator.extend(cached)
+        else:
+            k8s_api = ctx.request_context.lifespan_context.k8s_api
+            selector = ",".join(s for s in [field_selector, f"type={event_type}" if event_type else None] if s)
+            aggregator.extend(iter_items(k8s_api.list_namespaced_event, namespace,
+                                         page_size=OPENSHIFT_MCP_LIST_PAGE_SIZE,
+                                         label_selector=label_selector, field_selector=selector or None))
+        return {"groups": aggregator.top(top), "total_groups": len(aggregator.groups),
+                "events": aggregator.matched}
+    except Exception as e:
+        logger.error(f"Failed to aggregate events in {namespace}: {e}")
+        return error_response(f"Failed to aggregate events in {namespace}", str(e))
+
+
+def get_pods_summary(namespace: str, ctx, label_selector: Optional[str] = None,
+                     field_selector: Optional[str] = None, page_size: Optional[int] = None,
+                     cursor: Optional[str] = None) -> dict:
+    """Status table of the pods in a namespace (Name, Ready, Status, Restarts, Age, IP, Node, ...) in one call."""
+    try:
+        k8s_api = ctx.request_context.lifespan_context.k8s_api
+        return _table("pods", k8s_api.list_namespaced_pod, namespace, page_size=page_size, cursor=cursor,
+                      label_selector=label_selector, field_selector=field_selector)
+    except Exception as e:
+        logger.error(f"Failed to summarize pods in {namespace}: {e}")
+        return error_response(f"Failed to summarize pods in {namespace}", str(e))
+
+
+def get_deployments_summary(namespace: str, ctx, label_selector: Optional[str] = None,
+                            field_selector: Optional[str] = None, page_size: Optional[int] = None,
+                            cursor: Optional[str] = None) -> dict:
+    """Rollout table of the deployments in a namespace (Name, Ready, Up-to-date, Available, Age, ...) in one call."""
+    try:
+        apps_api = ctx.request_context.lifespan_context.apps_api
+        return _table("deployments", apps_api.list_namespaced_deployment, namespace, page_size=page_size,
+                      cursor=cursor, label_selector=label_selector, field_selector=field_selector)
+    except Exception as e:
+        logger.error(f"Failed to summarize deployments in {namespace}: {e}")
+        return error_response(f"Failed to summarize deployments in {namespace}", str(e))
+
+
+def get_events_summary(namespace: str, ctx, label_selector: Optional[str] = None,
+                       field_selector: Optional[str] = None, page_size: Optional[int] = None,
+                       cursor: Optional[str] = None) -> dict:
+    """Table of the events in a namespace (Last Seen, Type, Reason, Object, Message, ...) in one call.
+
+    Use field_selector to narrow it, e.g. "type=Warning" or "involvedObject.name=my-pod".
+    """
+    try:
+        k8s_api = ctx.request_context.lifespan_context.k8s_api
+        return _table("events", k8s_api.list_namespaced_event, namespace, page_size=page_size, cursor=cursor,
+                      label_selector=label_selector, field_selector=field_selector)
+    except Exception as e:
+        logger.error(f"Failed to summarize events in {namespace}: {e}")
+        return error_response(f"Failed to summarize events in {namespace}", str(e))
+
+
+# Tools query_clusters may run on many clusters: the read-only ones.
+FANOUT_TOOLS = {func.__name__: func for func in [
+    list_namespaces, list_projects, list_pods, get_pod_logs, search_pod_logs, list_deployments, list_routes,
+    get_route, list_services, get_service, get_all_services, list_configmaps, list_secrets, list_jobs, list_pvcs,
+    list_ingresses, list_rolebindings, list_serviceaccounts, list_resourcequotas, list_events, aggregate_events,
+    get_pods_summary, get_deployments_summary, get_events_summary, get_cluster_snapshot, get_changes,
+    get_owner_chain, get_backing_pods, get_connection_pool_stats, wait_for_rollout,
+]}
@@ -0,0 +1,315 @@
+"""Validation of many manifests in one call.
+
+Input is either a list of manifests or a multi-document YAML stream such as a
+Helm render. The stream is split into its documents on the "---" separator
+lines, and each document is parsed and validated on its own: a document that
+does not parse is reported without affecting the others. The stream is split
+as it is consumed, so with fail_fast the documents after the first invalid one
+are, for the most part, never parsed.
+
+Streams of at least OPENSHIFT_MCP_VALIDATE_PARALLEL_BYTES are parsed and
+validated in batches on a process pool, so that large renders use more than one
+core; smaller ones are not worth the inter-process round trip.
+"""
+import atexit
+import io
+import multiprocessing
+import re
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from openshift_mcp_server.config import OPENSHIFT_MCP_VALIDATE_PARALLEL_BYTES, OPENSHIFT_MCP_VALIDATE_WORKERS
+from openshift_mcp_server.executor import check_cancelled
+from openshift_mcp_server.security import CONTAINER_LISTS, POD_SPEC_PATHS, validate_manifest_security
+
+# Documents sent to a pool worker per task.
+BATCH_SIZE = 16
+
+_SEPARATOR = re.compile(r"^---(?:\s|$)")
+_END = re.compile(r"^\.\.\.\s*$")
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _mapping(value: Any) -> dict:
+    return value if isinstance(value, dict) else {}
+
+
+def shape_errors(manifest: dict) -> List[str]:
+    """Errors for the fields the checks descend into (metadata, the pod spec and its lists) that have the wrong type."""
+    errors = []
+    metadata = manifest.get("metadata")
+    if metadata is not None and not isinstance(metadata, dict):
+        errors.append("metadata must be a mapping.")
+    elif metadata:
+        for field in ("name", "generateName", "namespace"):
+            if metadata.get(field) is not None and not isinstance(metadata[field], str):
+                errors.append(f"metadata.{field} must be a string.")
+        for field in ("labels", "annotations"):
+            if metadata.get(field) is not None and not isinstance(metadata[field], dict):
+                errors.append(f"metadata.{field} must be a mapping.")
+    path = POD_SPEC_PATHS.get(manifest.get("kind")) if isinstance(manifest.get("kind"), str) else None
+    if not path:
+        return errors
+    node = manifest
+    for depth, field in enumerate(path):
+        node = node.get(field)
+        if node is None:
+            return errors
+        if not isinstance(node, dict):
+            errors.append(f"{'.'.join(path[:depth + 1])} must be a mapping.")
+            return errors
+    for field in (*CONTAINER_LISTS, "volumes"):
+        items = node.get(field)
+        if items is not None and not (isinstance(items, list) and all(isinstance(item, dict) for item in items)):
+            errors.append(f"{'.'.join(path)}.{field} must be a list of mappings.")
+    return errors
+
+
+def check_deployment(manifest: dict) -> dict:
+    """Best-practice checks of a Deployment manifest: {"errors": [...], "warnings": [...]}."""
+    if not isinstance(manifest, dict):
+        return {"errors": ["Manifest must be a mapping."], "warnings": []}
+    errors = shape_errors(manifest)
+    warnings = []
+    if manifest.get("kind") != "Deployment":
+        errors.append("Manifest kind must be 'Deployment'.")
+    metadata = _mapping(manifest.get("metadata"))
+    if not metadata.get("name"):
+        errors.append("metadata.name is required.")
+    spec = _mapping(manifest.get("spec"))
+    template = _mapping(spec.get("template"))
+    pod_spec = _mapping(template.get("spec"))
+    containers = pod_spec.get("containers")
+    spec_containers = [c for c in containers if isinstance(c, dict)] if isinstance(containers, list) else []
+    if not spec_containers:
+        errors.append("At least one container must be defined in spec.template.spec.containers.")
+    if "hostNetwork" in pod_spec:
+        warnings.append("hostNetwork is discouraged in OpenShift unless absolutely required.")
+    for container in spec_containers:
+        resources = _mapping(container.get("resources"))
+        limits = resources.get("limits")
+        requests = resources.get("requests")
+        if not limits or not requests:
+            warnings.append(f"Container '{container.get('name','')}' should specify resource requests and limits.")
+    security_ctx = _mapping(pod_spec.get("securityContext"))
+    if security_ctx.get("runAsUser") == 0:
+        warnings.append("Running as root (runAsUser: 0) is discouraged in OpenShift.")
+    for container in spec_containers:
+        if container.get("imagePullPolicy") == "Always":
+            warnings.append(f"Container '{container.get('name','')}' uses imagePullPolicy: Always. Make sure this is intended.")
+    if "serviceAccountName" not in pod_spec:
+        warnings.append("No serviceAccountName specified. OpenShift recommends using dedicated service accounts.")
+    labels = _mapping(metadata.get("labels"))
+    if not labels.get("app"):
+        warnings.append("metadata.labels.app is recommended for OpenShift apps.")
+    return {"errors": errors, "warnings": warnings}
+
+
+def document_key(manifest: Any, index: int) -> str:
+    """kind/namespace/name of a manifest (kind/name when it has no namespace), or #index when it has no name."""
+    if not isinstance(manifest, dict):
+        return f"#{index}"
+    metadata = _mapping(manifest.get("metadata"))
+    name = metadata.get("name") or metadata.get("generateName")
+    if not name or not isinstance(name, str):
+        return f"#{index}"
+    parts = [manifest.get("kind"), metadata.get("namespace"), name]
+    return "/".join(part for part in parts if part and isinstance(part, str))
+
+
+def validate_document(manifest: Any) -> dict:
+    """Structural, best-practice and security checks of one manifest: {"errors": [...], "warnings": [...]}."""
+    if not isinstance(manifest, dict):
+        return {"errors": ["Document is not a mapping."], "warnings": []}
+    errors = shape_errors(manifest)
+    warnings = []
+    kind = manifest.get("kind")
+    if not manifest.get("apiVersion"):
+        errors.append("apiVersion is required.")
+    elif not isinstance(manifest["apiVersion"], str):
+        errors.append("apiVersion must be a string.")
+    if not kind:
+        errors.append("kind is required.")
+    elif not isinstance(kind, str):
+        errors.append("kind must be a string.")
+        kind = None
+    metadata = _mapping(manifest.get("metadata"))
+    if not (metadata.get("name") or metadata.get("generateName")):
+        errors.append("metadata.name is required.")
+    if kind == "Deployment":
+        findings = check_deployment(manifest)
+        errors.extend(error for error in findings["errors"] if error not in errors)
+        warnings.extend(findings["warnings"])
+    if kind in POD_SPEC_PATHS:
+        errors.extend(validate_manifest_security(manifest))
+    return {"errors": errors, "warnings": warnings}
+
+
+def split_documents(text: str) -> Iterator[Tuple[int, str]]:
+    """(index, text) of each document of a YAML stream, read line by line; documents with no content are skipped."""
+    lines: List[str] = []
+    index = 0
+
+    def document() -> Optional[str]:
+        body = "".join(lines)
+        return body if any(line.strip() and not line.lstrip().startswith("#") for line in lines) else None
+
+    for line in io.StringIO(text):
+        if _SEPARATOR.match(line) or _END.match(line):
+            body = document()
+            if body is not None:
+                yield index, body
+            index += 1
+            # "--- value" starts the next document on the separator line itself.
+            lines = [line[3:]] if _SEPARATOR.match(line) and line[3:].strip() else []
+            continue
+        lines.append(line)
+    body = document()
+    if body is not None:
+        yield index, body
+
+
+def _loader():
+    import yaml
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_documents(yaml_text: str) -> List[Any]:
+    """The documents of a YAML stream, raising ValueError that names the first one that does not parse."""
+    import yaml
+
+    loader = _loader()
+    documents = []
+    for index, text in split_documents(yaml_text):
+        try:
+            documents.append(yaml.load(text, Loader=loader))
+        except yaml.YAMLError as e:
+            raise ValueError(f"Document {index} is not valid YAML: {e}")
+    return documents
+
+
+def _parse_and_validate(index: int, text: str, loader) -> Tuple[int, Any, dict]:
+    import yaml
+
+    try:
+        manifest = yaml.load(text, Loader=loader)
+    except yaml.YAMLError as e:
+        return index, None, {"errors": [f"Invalid YAML: {e}"], "warnings": []}
+    return index, manifest, validate_document(manifest)
+
+
+def _validate_batch(batch: List[Tuple[int, str]]) -> List[Tuple[int, str, dict]]:
+    """Pool task: parse and validate a batch of documents, returning (index, key, findings) of each."""
+    loader = _loader()
+    results = []
+    for index, text in batch:
+        index, manifest, findings = _parse_and_validate(index, text, loader)
+        results.append((index, document_key(manifest, index), findings))
+    return results
+
+
+def _process_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # Workers are spawned rather than forked: the server process runs many threads.
+            _pool = ProcessPoolExecutor(max_workers=OPENSHIFT_MCP_VALIDATE_WORKERS,
+                                        mp_context=multiprocessing.get_context("spawn"))
+            atexit.register(_pool.shutdown, wait=False, cancel_futures=True)
+        return _pool
+
+
+def _serial(documents: Iterable[Tuple[int, Any]], parse: bool) -> Iterator[Tuple[int, str, dict]]:
+    loader = _loader() if parse else None
+    for index, document in documents:
+        check_cancelled()
+        if parse:
+            index, document, findings = _parse_and_validate(index, document, loader)
+        else:
+            findings = validate_document(document)
+        yield index, document_key(document, index), findings
+
+
+def _parallel(documents: Iterator[Tuple[int, str]]) -> Iterator[Tuple[int, str, dict]]:
+    """Batches on the process pool, in order, with a bounded number in flight so the stream is split as it goes."""
+    pool = _process_pool()
+    in_flight: Deque[Future] = deque()
+
+    def submit() -> bool:
+        batch = list(islice(documents, BATCH_SIZE))
+        if batch:
+            in_flight.append(pool.submit(_validate_batch, batch))
+        return bool(batch)
+
+    try:
+        while len(in_flight) < 2 * OPENSHIFT_MCP_VALIDATE_WORKERS and submit():
+            pass
+        while in_flight:
+            check_cancelled()
+            results = in_flight.popleft().result()
+            submit()
+            yield from results
+    finally:
+        # Reached early on fail_fast or cancellation: drop the batches not started yet.
+        for future in in_flight:
+            future.cancel()
+
+
+def validate_batch(manifests: Optional[List[Any]] = None, yaml_text: Optional[str] = None,
+                   fail_fast: bool = False, summary_only: bool = False) -> dict:
+    """Validate a list of manifests and/or the documents of a YAML stream.
+
+    Returns {"documents", "valid", "invalid", "with_warnings"} plus either
+    "results": {key: {"document", "valid", "errors"?, "warnings"?}} or, with
+    summary_only, just the keys of the invalid documents under "failed". Keys are
+    kind/namespace/name (see document_key), suffixed with #index when repeated.
+    With fail_fast the documents after the first invalid one are not validated
+    and "stopped_early" is set.
+    """
+    sources = []
+    if manifests:
+        sources.append(_serial(enumerate(manifests), parse=False))
+    if yaml_text:
+        offset = len(manifests or [])
+        documents = ((offset + index, text) for index, text in split_documents(yaml_text))
+        if len(yaml_text) >= OPENSHIFT_MCP_VALIDATE_PARALLEL_BYTES and OPENSHIFT_MCP_VALIDATE_WORKERS > 1:
+            sources.append(_parallel(documents))
+        else:
+            sources.append(_serial(documents, parse=True))
+    summary: Dict[str, Any] = {"documents": 0, "valid": 0, "invalid": 0, "with_warnings": 0}
+    results: Dict[str, dict] = {}
+    failed: List[str] = []
+    seen = set()
+    for source in sources:
+        for index, key, findings in source:
+            if key in seen:
+                key = f"{key}#{index}"
+            seen.add(key)
+            summary["documents"] += 1
+            valid = not findings["errors"]
+            summary["valid" if valid else "invalid"] += 1
+            if findings["warnings"]:
+                summary["with_warnings"] += 1
+            if not valid:
+                failed.append(key)
+            if not summary_only:
+                result = {"document": index, "valid": valid}
+                result.update((name, value) for name, value in findings.items() if value)
+                results[key] = result
+            if fail_fast and not valid:
+                summary["stopped_early"] = True
+                source.close()
+                break
+        if summary.get("stopped_early"):
+            break
+    if summary_only:
+        summary["failed"] = failed
+    else:
+        summary["results"] = results
+    return summary
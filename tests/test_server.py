@@ -1,36 +1,47 @@
+import json
 import pytest
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 from openshift_mcp_server.tools import (
     list_namespaces, list_pods, get_pod_logs, list_deployments, get_cluster_info,
     list_routes, get_route, list_services, get_service, get_all_services,
     create_deployment, validate_openshift_manifest, list_configmaps, list_secrets,
-    list_jobs, list_pvcs, list_ingresses, list_rolebindings
+    list_jobs, list_pvcs, list_ingresses, list_rolebindings, get_cache_status,
+    search_pod_logs
 )
+from openshift_mcp_server.informer import Informer, InformerCache
+from openshift_mcp_server.kinds import RESOURCE_KINDS
 
 class DummyContext:
     def __init__(self):
         self.request_context = MagicMock()
         self.request_context.lifespan_context = MagicMock()
+        self.request_context.lifespan_context.informers = None
+        self.request_context.lifespan_context.graph = None
+def _obj(name, namespace=None, **fields):
+    metadata = {'name': name}
+    if namespace:
+        metadata['namespace'] = namespace
+    return {'metadata': metadata, **fields}
+
+def _page(items, next_cursor=None):
+    return _raw({'metadata': {'continue': next_cursor}, 'items': items})
 
 @pytest.fixture
 def ctx():
     return DummyContext()
 
 def test_list_namespaces(ctx):
-    ns1 = MagicMock()
-    ns1.metadata.name = 'ns1'
-    ns2 = MagicMock()
-    ns2.metadata.name = 'ns2'
-    ctx.request_context.lifespan_context.k8s_api.list_namespace.return_value.items = [ns1, ns2]
+    ns1 = _obj('ns1')
+    ns2 = _obj('ns2')
+    ctx.request_context.lifespan_context.k8s_api.list_namespace.return_value = _page([ns1, ns2])
     result = list_namespaces(ctx)
     assert result == ['ns1', 'ns2']
 
 def test_list_pods(ctx):
-    pod1 = MagicMock()
-    pod1.metadata.name = 'pod1'
-    pod2 = MagicMock()
-    pod2.metadata.name = 'pod2'
-    ctx.request_context.lifespan_context.k8s_api.list_namespaced_pod.return_value.items = [pod1, pod2]
+    pod1 = _obj('pod1')
+    pod2 = _obj('pod2')
+    ctx.request_context.lifespan_context.k8s_api.list_namespaced_pod.return_value = _page([pod1, pod2])
     result = list_pods('ns', ctx)
     assert result == ['pod1', 'pod2']
 
@@ -43,13 +54,12 @@ def test_get_pod_logs(ctx):
     assert isinstance(result, dict) and 'error' in result and 'Failed to get logs for pod pod in ns' in result['error']
 
 def test_list_deployments(ctx):
-    dep1 = MagicMock()
-    dep1.metadata.name = 'dep1'
-    ctx.request_context.lifespan_context.apps_api.list_namespaced_deployment.return_value.items = [dep1]
+    dep1 = _obj('dep1')
+    ctx.request_context.lifespan_context.apps_api.list_namespaced_deployment.return_value = _page([dep1])
     assert list_deployments('ns', ctx) == ['dep1']
 
 def test_get_cluster_info(ctx):
-    ctx.request_context.lifespan_context.k8s_api.get_api_versions.return_value.versions = ['v1']
+    ctx.request_context.lifespan_context.core_api.get_api_versions.return_value.versions = ['v1']
     result = get_cluster_info(ctx)
     assert 'v1' in result['api_versions']
     ctx.request_context.lifespan_context.k8s_api.read_namespace.return_value.status.phase = 'Active'
@@ -57,9 +67,7 @@ def test_get_cluster_info(ctx):
     assert result['namespace_status'] == 'Active'
 
 def test_list_routes(ctx):
-    ctx.request_context.lifespan_context.route_api.list_namespaced_custom_object.return_value = {
-        'items': [{'metadata': {'name': 'route1'}}]
-    }
+    ctx.request_context.lifespan_context.route_api.list_namespaced_custom_object.return_value = _page([_obj('route1')])
     assert list_routes('ns', ctx) == ['route1']
 
 def test_get_route(ctx):
@@ -69,9 +77,8 @@ def test_get_route(ctx):
     assert 'error' in get_route('ns', 'route1', ctx)
 
 def test_list_services(ctx):
-    svc1 = MagicMock()
-    svc1.metadata.name = 'svc1'
-    ctx.request_context.lifespan_context.k8s_api.list_namespaced_service.return_value.items = [svc1]
+    svc1 = _obj('svc1')
+    ctx.request_context.lifespan_context.k8s_api.list_namespaced_service.return_value = _page([svc1])
     assert list_services('ns', ctx) == ['svc1']
 
 def test_get_service(ctx):
@@ -83,20 +90,16 @@ def test_get_service(ctx):
     assert 'error' in get_service('ns', 'svc1', ctx)
 
 def test_get_all_services(ctx):
-    svc1 = MagicMock()
-    svc1.metadata.namespace = 'ns1'
-    svc1.metadata.name = 'svc1'
-    svc2 = MagicMock()
-    svc2.metadata.namespace = 'ns2'
-    svc2.metadata.name = 'svc2'
-    ctx.request_context.lifespan_context.k8s_api.list_service_for_all_namespaces.return_value.items = [svc1, svc2]
+    svc1 = _obj('svc1', 'ns1')
+    svc2 = _obj('svc2', 'ns2')
+    ctx.request_context.lifespan_context.k8s_api.list_service_for_all_namespaces.return_value = _page([svc1, svc2])
     # Test all namespaces (simulate by passing empty string or None)
     out = get_all_services('', ctx)
     assert 'ns1' in out and 'ns2' in out
     assert out['ns1'] == ['svc1']
     assert out['ns2'] == ['svc2']
     # Test single namespace
-    ctx.request_context.lifespan_context.k8s_api.list_namespaced_service.return_value.items = [svc1]
+    ctx.request_context.lifespan_context.k8s_api.list_namespaced_service.return_value = _page([svc1])
     out_ns = get_all_services('ns1', ctx)
     assert out_ns['ns1'] == ['svc1']
 
@@ -123,19 +126,16 @@ def test_validate_openshift_manifest(ctx):
     assert result['errors']
 
 def test_list_configmaps(ctx):
-    cm1 = MagicMock()
-    cm1.metadata.name = 'cm1'
-    ctx.request_context.lifespan_context.k8s_api.list_namespaced_config_map.return_value.items = [cm1]
+    cm1 = _obj('cm1')
+    ctx.request_context.lifespan_context.k8s_api.list_namespaced_config_map.return_value = _page([cm1])
     assert list_configmaps('ns', ctx) == ['cm1']
     ctx.request_context.lifespan_context.k8s_api.list_namespaced_config_map.side_effect = Exception('fail')
     out = list_configmaps('ns', ctx)
     assert isinstance(out, dict) and 'error' in out
 
 def test_list_secrets(ctx):
-    s1 = MagicMock()
-    s1.metadata.name = 's1'
-    s1.type = 'Opaque'
-    ctx.request_context.lifespan_context.k8s_api.list_namespaced_secret.return_value.items = [s1]
+    s1 = _obj('s1', type='Opaque')
+    ctx.request_context.lifespan_context.k8s_api.list_namespaced_secret.return_value = _page([s1])
     out = list_secrets('ns', ctx)
     assert out == [{'name': 's1', 'type': 'Opaque'}]
     ctx.request_context.lifespan_context.k8s_api.list_namespaced_secret.side_effect = Exception('fail')
@@ -143,9 +143,8 @@ def test_list_secrets(ctx):
     assert isinstance(out, dict) and 'error' in out
 
 def test_list_jobs(ctx):
-    job1 = MagicMock()
-    job1.metadata.name = 'job1'
-    ctx.request_context.lifespan_context.batch_api.list_namespaced_job.return_value.items = [job1]
+    job1 = _obj('job1')
+    ctx.request_context.lifespan_context.batch_api.list_namespaced_job.return_value = _page([job1])
     out = list_jobs('ns', ctx)
     assert out == ['job1']
     ctx.request_context.lifespan_context.batch_api.list_namespaced_job.side_effect = Exception('fail')
@@ -153,9 +152,8 @@ def test_list_jobs(ctx):
     assert isinstance(out, dict) and 'error' in out
 
 def test_list_pvcs(ctx):
-    pvc1 = MagicMock()
-    pvc1.metadata.name = 'pvc1'
-    ctx.request_context.lifespan_context.k8s_api.list_namespaced_persistent_volume_claim.return_value.items = [pvc1]
+    pvc1 = _obj('pvc1')
+    ctx.request_context.lifespan_context.k8s_api.list_namespaced_persistent_volume_claim.return_value = _page([pvc1])
     out = list_pvcs('ns', ctx)
     assert out == ['pvc1']
     ctx.request_context.lifespan_context.k8s_api.list_namespaced_persistent_volume_claim.side_effect = Exception('fail')
@@ -163,9 +161,8 @@ def test_list_pvcs(ctx):
     assert isinstance(out, dict) and 'error' in out
 
 def test_list_ingresses(ctx):
-    ing1 = MagicMock()
-    ing1.metadata.name = 'ing1'
-    ctx.request_context.lifespan_context.networking_api.list_namespaced_ingress.return_value.items = [ing1]
+    ing1 = _obj('ing1')
+    ctx.request_context.lifespan_context.networking_api.list_namespaced_ingress.return_value = _page([ing1])
     out = list_ingresses('ns', ctx)
     assert out == ['ing1']
     ctx.request_context.lifespan_context.networking_api.list_namespaced_ingress.side_effect = Exception('fail')
@@ -173,11 +170,1105 @@ def test_list_ingresses(ctx):
     assert isinstance(out, dict) and 'error' in out
 
 def test_list_rolebindings(ctx):
-    rb1 = MagicMock()
-    rb1.metadata.name = 'rb1'
-    ctx.request_context.lifespan_context.rbac_api.list_namespaced_role_binding.return_value.items = [rb1]
+    rb1 = _obj('rb1')
+    ctx.request_context.lifespan_context.rbac_api.list_namespaced_role_binding.return_value = _page([rb1])
     out = list_rolebindings('ns', ctx)
     assert out == ['rb1']
     ctx.request_context.lifespan_context.rbac_api.list_namespaced_role_binding.side_effect = Exception('fail')
     out = list_rolebindings('ns', ctx)
     assert isinstance(out, dict) and 'error' in out
+
+
+def _raw(body):
+    return SimpleNamespace(data=json.dumps(body).encode(), close=lambda: None)
+
+def _pod(name, namespace='ns', rv='1'):
+    return {'metadata': {'name': name, 'namespace': namespace, 'resourceVersion': rv}}
+
+def test_informer_relist_and_events():
+    list_func = MagicMock(return_value=_raw({'metadata': {'resourceVersion': '10'},
+                                             'items': [_pod('b'), _pod('a'), _pod('c', 'other')]}))
+    informer = Informer(RESOURCE_KINDS['pods'], list_func)
+    assert not informer.has_synced()
+    informer._relist()
+    assert informer.has_synced()
+    assert [p['metadata']['name'] for p in informer.list('ns')] == ['a', 'b']
+    informer._apply('ADDED', _pod('d', rv='11'))
+    informer._apply('DELETED', _pod('a', rv='12'))
+    informer._apply('DELETED', _pod('c', 'other', rv='13'))
+    informer._apply('BOOKMARK', {'metadata': {'resourceVersion': '20'}})
+    assert [p['metadata']['name'] for p in informer.list()] == ['b', 'd']
+    status = informer.status()
+    assert status['resource_version'] == '20' and status['objects'] == 2
+    assert status['staleness_seconds'] is not None
+
+def test_informer_error_event_signals_gone():
+    informer = Informer(RESOURCE_KINDS['pods'], MagicMock())
+    with pytest.raises(Exception) as excinfo:
+        informer._apply('ERROR', {'code': 410, 'reason': 'Expired', 'message': 'too old'})
+    assert excinfo.value.status == 410
+
+def test_list_tools_served_from_informer(ctx):
+    list_func = MagicMock(return_value=_raw({'metadata': {'resourceVersion': '1'},
+                                             'items': [_pod('pod1'), _pod('pod2')]}))
+    informer = Informer(RESOURCE_KINDS['pods'], list_func)
+    informer._relist()
+    ctx.request_context.lifespan_context.informers = InformerCache([informer], max_staleness=60)
+    assert list_pods('ns', ctx) == ['pod1', 'pod2']
+    ctx.request_context.lifespan_context.k8s_api.list_namespaced_pod.assert_not_called()
+    assert get_cache_status(ctx)['pods']['synced'] is True
+    # Kinds without a running informer still go to the apiserver
+    dep1 = _obj('dep1')
+    ctx.request_context.lifespan_context.apps_api.list_namespaced_deployment.return_value = _page([dep1])
+    assert list_deployments('ns', ctx) == ['dep1']
+
+def test_list_pods_pages_through_continue_tokens(ctx):
+    pods = [_obj('pod1'), _obj('pod2'), _obj('pod3')]
+    list_func = ctx.request_context.lifespan_context.k8s_api.list_namespaced_pod
+    list_func.side_effect = [_page(pods[:2], 'tok1'), _page(pods[2:])]
+    assert list_pods('ns', ctx) == ['pod1', 'pod2', 'pod3']
+    assert list_func.call_args_list[1].kwargs['_continue'] == 'tok1'
+    assert list_func.call_args.kwargs['_preload_content'] is False
+    # Client-driven paging returns one page and the cursor for the next
+    list_func.side_effect = [_page(pods[:2], 'tok1')]
+    assert list_pods('ns', ctx, page_size=2) == {'items': ['pod1', 'pod2'], 'cursor': 'tok1'}
+    assert list_func.call_args.kwargs['limit'] == 2
+    list_func.side_effect = [_page(pods[2:])]
+    assert list_pods('ns', ctx, page_size=2, cursor='tok1') == {'items': ['pod3'], 'cursor': None}
+    assert list_func.call_args.kwargs['_continue'] == 'tok1'
+
+def test_list_routes_pages_custom_objects(ctx):
+    list_func = ctx.request_context.lifespan_context.route_api.list_namespaced_custom_object
+    list_func.side_effect = [_page([_obj('route1')], 'tok1'), _page([_obj('route2')])]
+    assert list_routes('ns', ctx) == ['route1', 'route2']
+
+def test_run_in_executor_overlaps_blocking_calls():
+    import asyncio
+    import inspect
+    import time
+    from openshift_mcp_server.executor import run_in_executor
+
+    def slow_tool(namespace: str, ctx, delay: float = 0.2) -> dict:
+        time.sleep(delay)
+        return {"namespace": namespace}
+
+    wrapped = run_in_executor(slow_tool, timeout=5)
+    assert inspect.iscoroutinefunction(wrapped)
+    assert list(inspect.signature(wrapped).parameters) == ['namespace', 'ctx', 'delay']
+
+    async def run_concurrently():
+        start = time.perf_counter()
+        results = await asyncio.gather(*(wrapped(f'ns{i}', None) for i in range(4)))
+        return results, time.perf_counter() - start
+
+    results, elapsed = asyncio.run(run_concurrently())
+    assert [r['namespace'] for r in results] == ['ns0', 'ns1', 'ns2', 'ns3']
+    assert elapsed < 0.6
+
+def test_run_in_executor_timeout_cancels_paging():
+    import asyncio
+    import threading
+    from openshift_mcp_server.errors import ToolCancelled
+    from openshift_mcp_server.executor import run_in_executor
+    from openshift_mcp_server.pagination import iter_items
+
+    release = threading.Event()
+    outcome = {}
+
+    def list_func(**kwargs):
+        release.wait(2)
+        return _page([_obj('pod1')], 'more')
+
+    def paging_tool():
+        try:
+            for _ in iter_items(list_func, page_size=1):
+                pass
+        except ToolCancelled:
+            outcome['cancelled'] = True
+
+    result = asyncio.run(run_in_executor(paging_tool, timeout=0.05)())
+    assert 'error' in result and 'timed out' in result['error']
+    release.set()
+    for _ in range(100):
+        if outcome:
+            break
+        threading.Event().wait(0.01)
+    assert outcome == {'cancelled': True}
+
+class _LogResponse:
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self.released = False
+
+    def stream(self, chunk_size):
+        yield from self._chunks
+
+    def release_conn(self):
+        self.released = True
+
+def test_get_pod_logs_passes_bounds(ctx):
+    read_log = ctx.request_context.lifespan_context.k8s_api.read_namespaced_pod_log
+    read_log.return_value = 'line1\nline2\n'
+    result = get_pod_logs('ns', 'pod', ctx, tail_lines=10, limit_bytes=100, previous=True, timestamps=True)
+    assert result == {'logs': 'line1\nline2\n', 'truncated': False}
+    kwargs = read_log.call_args.kwargs
+    assert kwargs['tail_lines'] == 10 and kwargs['limit_bytes'] == 100
+    assert kwargs['previous'] is True and kwargs['timestamps'] is True
+    # since_time is turned into since_seconds
+    get_pod_logs('ns', 'pod', ctx, since_time='2000-01-01T00:00:00Z')
+    assert read_log.call_args.kwargs['since_seconds'] > 0
+    result = get_pod_logs('ns', 'pod', ctx, since_seconds=5, since_time='2000-01-01T00:00:00Z')
+    assert 'error' in result
+
+def test_get_pod_logs_stream_is_bounded(ctx):
+    read_log = ctx.request_context.lifespan_context.k8s_api.read_namespaced_pod_log
+    response = _LogResponse([b'hello ', 'wörld\n'.encode()[:2], 'wörld\n'.encode()[2:], b'more output'])
+    read_log.return_value = response
+    result = get_pod_logs('ns', 'pod', ctx, stream=True, limit_bytes=15)
+    assert result == {'logs': 'hello wörld\nmo', 'truncated': True}
+    assert read_log.call_args.kwargs['_preload_content'] is False
+    assert response.released
+
+def test_log_stream_lines_and_notifications():
+    import asyncio
+    from openshift_mcp_server.executor import run_in_executor
+    from openshift_mcp_server.logstream import LogStream
+
+    stream = LogStream(_LogResponse([b'a\nb', b'c\n', b'd']), max_bytes=100, chunk_size=4)
+    assert list(stream.lines()) == ['a', 'bc', 'd'] and not stream.truncated
+
+    received = []
+
+    class NotifyingContext(DummyContext):
+        async def info(self, message):
+            received.append(message)
+
+    async def call():
+        context = NotifyingContext()
+        context.request_context.lifespan_context.k8s_api.read_namespaced_pod_log.return_value = \
+            _LogResponse([b'one\n', b'two\n'])
+        result = await run_in_executor(get_pod_logs, timeout=5)('ns', 'pod', context, stream=True)
+        await asyncio.sleep(0.05)
+        return result
+
+    assert asyncio.run(call())['logs'] == 'one\ntwo\n'
+    assert received == ['one\n', 'two\n']
+
+def _pod_with_containers(name, *containers):
+    return {'metadata': {'name': name}, 'spec': {'containers': [{'name': c} for c in containers]}}
+
+def test_search_pod_logs_across_deployment_pods(ctx):
+    lc = ctx.request_context.lifespan_context
+    lc.apps_api.read_namespaced_deployment.return_value = _raw(
+        {'spec': {'selector': {'matchLabels': {'app': 'web', 'tier': 'fe'}}}})
+    lc.k8s_api.list_namespaced_pod.return_value = _page(
+        [_pod_with_containers('web-1', 'app', 'proxy'), _pod_with_containers('web-2', 'app')])
+    logs = {
+        ('web-1', 'app'): b'start\nERROR boom\nretry\nok\n',
+        ('web-1', 'proxy'): b'GET /\n',
+        ('web-2', 'app'): b'start\nerror again\n',
+    }
+    lc.k8s_api.read_namespaced_pod_log.side_effect = \
+        lambda name, namespace, container, **kw: _LogResponse([logs[(name, container)]])
+    result = search_pod_logs('ns', 'error', ctx, deployment='web', context_lines=1, ignore_case=True)
+    assert lc.k8s_api.list_namespaced_pod.call_args.kwargs['label_selector'] == 'app=web,tier=fe'
+    assert result['streams_searched'] == 3 and not result['truncated']
+    assert result['matches'] == [
+        {'pod': 'web-1', 'container': 'app', 'line_number': 2, 'line': 'ERROR boom',
+         'before': ['start'], 'after': ['retry']},
+        {'pod': 'web-2', 'container': 'app', 'line_number': 2, 'line': 'error again',
+         'before': ['start'], 'after': []},
+    ]
+
+def test_search_pod_logs_stops_at_max_matches(ctx):
+    lc = ctx.request_context.lifespan_context
+    lc.k8s_api.list_namespaced_pod.return_value = _page([_pod_with_containers('p', 'c')])
+    lc.k8s_api.read_namespaced_pod_log.return_value = _LogResponse([b'x\n' * 50])
+    result = search_pod_logs('ns', 'x', ctx, label_selector='app=p', max_matches=3)
+    assert len(result['matches']) == 3
+    assert 'error' in search_pod_logs('ns', 'x', ctx)
+    assert 'error' in search_pod_logs('ns', '(', ctx, label_selector='app=p')
+
+def test_selector_to_string():
+    from openshift_mcp_server.labels import selector_to_string
+    selector = {'matchLabels': {'b': '2', 'a': '1'}, 'matchExpressions': [
+        {'key': 'env', 'operator': 'In', 'values': ['prod', 'stage']},
+        {'key': 'canary', 'operator': 'DoesNotExist'}]}
+    assert selector_to_string(selector) == 'a=1,b=2,env in (prod,stage),!canary'
+
+class _FakeOAuthSession:
+    def __init__(self, *tokens, expires_in=86400):
+        self.tokens = list(tokens)
+        self.expires_in = expires_in
+        self.posts = 0
+
+    def post(self, url, **kwargs):
+        self.posts += 1
+        token = self.tokens.pop(0)
+        location = f'https://oauth/implicit#access_token={token}&expires_in={self.expires_in}&token_type=Bearer'
+        return SimpleNamespace(headers={'Location': location})
+
+def test_token_manager_caches_and_refreshes(tmp_path, monkeypatch):
+    import os
+    import time
+    from openshift_mcp_server import auth
+    from openshift_mcp_server.auth import TokenManager
+    cache = tmp_path / 'token.json'
+    session = _FakeOAuthSession('tok1', 'tok2', expires_in=3600)
+    manager = TokenManager('https://api', 'user', 'pw', cache_path=str(cache), refresh_margin=60, session=session)
+    assert manager.get_token() == 'tok1'
+    assert manager.get_token() == 'tok1' and session.posts == 1
+    assert os.stat(cache).st_mode & 0o777 == 0o600
+    # A restarted server reuses the persisted token without an OAuth round-trip
+    restarted = TokenManager('https://api', 'user', 'pw', cache_path=str(cache), session=_FakeOAuthSession())
+    assert restarted.get_token() == 'tok1'
+    # Tokens inside the refresh margin are renewed proactively
+    now = time.time()
+    monkeypatch.setattr(auth.time, 'time', lambda: now + 3590)
+    assert manager.get_token() == 'tok2' and session.posts == 2
+
+def test_retry_on_unauthorized_uses_new_token():
+    from openshift_mcp_server.auth import TokenManager, retry_on_unauthorized
+    manager = TokenManager('https://api', 'user', 'pw', session=_FakeOAuthSession('old', 'new'))
+    configuration = SimpleNamespace(api_key={})
+    manager.install(configuration)
+    seen = []
+
+    def call_api(*args, **kwargs):
+        seen.append(configuration.api_key['authorization'])
+        if len(seen) == 1:
+            raise _Unauthorized()
+        return 'ok'
+
+    api_client = SimpleNamespace(configuration=configuration, call_api=call_api)
+    retry_on_unauthorized(api_client, manager)
+    assert api_client.call_api('/api/v1/pods', 'GET') == 'ok'
+    assert seen == ['Bearer old', 'Bearer new']
+
+class _Unauthorized(Exception):
+    status = 401
+
+def test_create_api_client_tunes_pool():
+    pytest.importorskip('kubernetes')
+    import socket
+    from kubernetes import client
+    from openshift_mcp_server.connection import create_api_client, pool_stats
+    configuration = client.Configuration()
+    configuration.host = 'http://127.0.0.1:1'
+    api_client = create_api_client(configuration)
+    pool_manager = api_client.rest_client.pool_manager
+    assert pool_manager.connection_pool_kw['maxsize'] == configuration.connection_pool_maxsize
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in pool_manager.connection_pool_kw['socket_options']
+    pool_manager.connection_from_url('http://127.0.0.1:1')
+    stats = pool_stats(api_client)['pools']
+    assert stats[0]['host'] == '127.0.0.1' and stats[0]['in_use'] == 0 and stats[0]['idle'] == 0
+
+def test_apply_default_timeout_keeps_explicit_timeouts():
+    from openshift_mcp_server.connection import apply_default_timeout
+    calls = []
+    api_client = SimpleNamespace(call_api=lambda *args, **kwargs: calls.append(kwargs['_request_timeout']))
+    apply_default_timeout(api_client, (1, 2))
+    api_client.call_api('/api/v1/pods', 'GET', _request_timeout=None)
+    api_client.call_api('/api/v1/pods', 'GET', _request_timeout=(3, 300))
+    assert calls == [(1, 2), (3, 300)]
+
+def test_server_import_defers_kubernetes():
+    pytest.importorskip('mcp.server.fastmcp')
+    import os
+    import subprocess
+    import sys
+    snippet = "import sys, openshift_mcp_server.server; print('kubernetes' in sys.modules)"
+    out = subprocess.run([sys.executable, '-c', snippet], capture_output=True, text=True, check=True,
+                         env={**os.environ, 'PYTHONPATH': os.pathsep.join(sys.path)})
+    assert out.stdout.strip() == 'False'
+
+def test_app_context_builds_clients_on_first_use():
+    pytest.importorskip('mcp.server.fastmcp')
+    pytest.importorskip('kubernetes')
+    from kubernetes import client
+    from openshift_mcp_server.server import AppContext
+    api_client = client.ApiClient()
+    factory = MagicMock(return_value=api_client)
+    context = AppContext(api_client_factory=factory)
+    factory.assert_not_called()
+    assert context.k8s_api is context.k8s_api
+    assert context.apps_api.api_client is api_client and context.rbac_api.api_client is api_client
+    factory.assert_called_once()
+
+def test_metrics_instrument_records_tool_and_upstream_calls(monkeypatch):
+    import contextvars
+    from concurrent.futures import ThreadPoolExecutor
+    from openshift_mcp_server import metrics
+    from openshift_mcp_server.errors import error_response
+    class Forbidden(Exception):
+        status = 403
+    def call_api(resource_path, method, **kwargs):
+        if resource_path.endswith('secrets'):
+            raise Forbidden()
+        return ['ok']
+    api_client = SimpleNamespace(call_api=call_api)
+    metrics.instrument_api_client(api_client)
+    def metrics_probe_ok():
+        return api_client.call_api('/api/v1/pods', 'GET')
+    def metrics_probe_denied():
+        try:
+            api_client.call_api('/api/v1/secrets', 'GET')
+        except Forbidden as e:
+            return error_response("Failed to list secrets", str(e))
+    def metrics_probe_text():
+        return 'x' * 300
+    def metrics_probe_fan_out():
+        # Worker threads of one call share its request count.
+        context = contextvars.copy_context()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda _: context.copy().run(api_client.call_api, '/api/v1/pods', 'GET'), range(400)))
+        return {}
+    monkeypatch.setattr(metrics, 'OPENSHIFT_MCP_METRICS_SIZE_SAMPLE', 1.0)
+    metrics.instrument(metrics_probe_ok)()
+    metrics.instrument(metrics_probe_ok)()
+    metrics.instrument(metrics_probe_denied)()
+    # Structured responses outside the sample are not serialized; text is always measured by its length.
+    monkeypatch.setattr(metrics, 'OPENSHIFT_MCP_METRICS_SIZE_SAMPLE', 0.0)
+    monkeypatch.setattr(metrics, 'dumped_size', lambda result: pytest.fail('serialized an unsampled response'))
+    metrics.instrument(metrics_probe_ok)()
+    metrics.instrument(metrics_probe_text)()
+    assert metrics.TOOL_RESPONSE_BYTES.count('metrics_probe_text') == 1
+    assert 'mcp_tool_response_bytes_sum{tool="metrics_probe_text"} 300' in metrics.REGISTRY.render()
+    metrics.instrument(metrics_probe_fan_out)()
+    assert 'mcp_tool_kube_api_calls_sum{tool="metrics_probe_fan_out"} 400' in metrics.REGISTRY.render()
+    assert metrics.TOOL_CALLS.value('metrics_probe_ok') == 3
+    assert metrics.TOOL_ERRORS.value('metrics_probe_denied', '403') == 1
+    assert metrics.KUBE_REQUESTS.value('metrics_probe_ok', 'GET', '2xx') == 3
+    assert metrics.TOOL_RESPONSE_BYTES.count('metrics_probe_ok') == 2
+    text = metrics.REGISTRY.render()
+    assert '# TYPE mcp_tool_duration_seconds histogram' in text
+    assert 'mcp_tool_duration_seconds_bucket{tool="metrics_probe_ok",le="+Inf"} 3' in text
+    assert 'kube_api_requests_total{tool="metrics_probe_denied",method="GET",status="403"} 1' in text
+
+def test_metrics_http_endpoint():
+    from urllib.request import urlopen
+    from openshift_mcp_server import metrics
+    server = metrics.start_http_server(0)
+    try:
+        assert server.server_address[0] == '127.0.0.1'
+        with urlopen(f'http://127.0.0.1:{server.server_address[1]}/metrics') as response:
+            assert response.headers['Content-Type'].startswith('text/plain')
+            assert b'# TYPE mcp_tool_calls_total counter' in response.read()
+    finally:
+        server.shutdown()
+
+def test_list_pods_pushes_selectors_down_and_summarizes(ctx):
+    lc = ctx.request_context.lifespan_context
+    lc.informers = MagicMock()
+    pod = _obj('web-1', 'ns', spec={'nodeName': 'worker-1', 'containers': [{'name': 'a'}, {'name': 'b'}]},
+               status={'phase': 'Pending', 'containerStatuses': [{'ready': True, 'restartCount': 2},
+                                                                 {'ready': False, 'restartCount': 1}]})
+    lc.k8s_api.list_namespaced_pod.return_value = _page([pod])
+    result = list_pods('ns', ctx, label_selector='app=web', field_selector='status.phase!=Running', wide=True)
+    assert result == [{'name': 'web-1', 'phase': 'Pending', 'node': 'worker-1', 'ready': '1/2', 'restarts': 3}]
+    kwargs = lc.k8s_api.list_namespaced_pod.call_args.kwargs
+    assert kwargs['label_selector'] == 'app=web' and kwargs['field_selector'] == 'status.phase!=Running'
+    lc.informers.get.assert_not_called()
+
+def test_resource_query_string_sets_optional_params():
+    pytest.importorskip('mcp.server.fastmcp')
+    import inspect
+    from openshift_mcp_server.server import split_query
+    optional = {name: p for name, p in inspect.signature(list_pods).parameters.items()
+                if name not in ('namespace', 'ctx')}
+    kwargs = split_query({'namespace': 'ns?labelSelector=app%3Dweb&wide=true&page_size=50'}, optional)
+    assert kwargs == {'namespace': 'ns', 'label_selector': 'app=web', 'wide': True, 'page_size': 50}
+    assert split_query({'namespace': 'ns'}, optional) == {'namespace': 'ns'}
+    with pytest.raises(ValueError):
+        split_query({'namespace': 'ns?color=blue'}, optional)
+
+def test_accept_override_sets_header_only_inside_context():
+    from openshift_mcp_server.representation import PARTIAL_OBJECT_METADATA, accept, apply_accept_override
+    headers = []
+    api_client = SimpleNamespace(call_api=lambda path, method, path_params, query_params, header_params, **kw:
+                                 headers.append(header_params['Accept']))
+    apply_accept_override(api_client)
+    with accept(PARTIAL_OBJECT_METADATA):
+        api_client.call_api('/api/v1/namespaces/ns/configmaps', 'GET', {}, [], {'Accept': 'application/json'})
+    api_client.call_api('/api/v1/namespaces/ns/configmaps', 'GET', {}, [], {'Accept': 'application/json'})
+    assert headers == [PARTIAL_OBJECT_METADATA + ',application/json', 'application/json']
+
+def test_list_secrets_reads_type_from_table(ctx):
+    table = {
+        'kind': 'Table', 'metadata': {'continue': ''},
+        'columnDefinitions': [{'name': 'Name'}, {'name': 'Type'}, {'name': 'Data'}, {'name': 'Age'}],
+        'rows': [{'cells': ['tls', 'kubernetes.io/tls', 2, '5d'], 'object': {'metadata': {'name': 'tls'}}}],
+    }
+    ctx.request_context.lifespan_context.k8s_api.list_namespaced_secret.return_value = _raw(table)
+    assert list_secrets('ns', ctx) == [{'name': 'tls', 'type': 'kubernetes.io/tls'}]
+
+def test_get_pods_summary_returns_table_rows(ctx):
+    from openshift_mcp_server.tools import get_pods_summary
+    table = {
+        'kind': 'Table', 'metadata': {'continue': 'tok'},
+        'columnDefinitions': [{'name': 'Name'}, {'name': 'Ready'}, {'name': 'Status'}, {'name': 'Restarts'},
+                              {'name': 'Node'}],
+        'rows': [{'cells': ['web-1', '1/1', 'Running', 0, 'worker-1'], 'object': {'metadata': {'name': 'web-1'}}}],
+    }
+    ctx.request_context.lifespan_context.k8s_api.list_namespaced_pod.return_value = _raw(table)
+    result = get_pods_summary('ns', ctx, page_size=1)
+    assert result == {'columns': ['Name', 'Ready', 'Status', 'Restarts', 'Node'],
+                      'rows': [['web-1', '1/1', 'Running', 0, 'worker-1']], 'cursor': 'tok'}
+
+def test_read_json_coalesces_identical_concurrent_lists():
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from openshift_mcp_server.pagination import read_json
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+    def list_func(namespace, **kwargs):
+        calls.append(namespace)
+        started.set()
+        release.wait(2)
+        return _page([_obj('pod1')])
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        leader = pool.submit(read_json, list_func, 'ns', limit=10)
+        started.wait(2)
+        followers = [pool.submit(read_json, list_func, 'ns', limit=10) for _ in range(2)]
+        other = pool.submit(read_json, list_func, 'other', limit=10)
+        threading.Event().wait(0.1)
+        release.set()
+        bodies = [f.result() for f in [leader, *followers]]
+        other.result()
+    assert sorted(calls) == ['ns', 'other']
+    assert all(body is bodies[0] for body in bodies)
+
+def test_coalesced_followers_survive_a_cancelled_leader():
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from openshift_mcp_server import coalesce
+    from openshift_mcp_server.errors import ToolCancelled
+    coalescer = coalesce.Coalescer()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def cancelled_leader():
+        calls.append('leader')
+        started.set()
+        release.wait(2)
+        raise ToolCancelled('Tool call was cancelled')
+
+    def follower_read():
+        calls.append('follower')
+        return 'pods'
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        leader = pool.submit(coalescer.do, 'key', cancelled_leader)
+        started.wait(2)
+        followers = [pool.submit(coalescer.do, 'key', follower_read) for _ in range(2)]
+        threading.Event().wait(0.2)
+        release.set()
+        with pytest.raises(ToolCancelled):
+            leader.result()
+        # The followers were not cancelled: one of them makes the read again and shares it.
+        assert [f.result() for f in followers] == ['pods', 'pods']
+    assert calls[0] == 'leader' and 1 <= calls.count('follower') <= 2
+
+def test_ttl_cache_expires_and_evicts_least_recently_used(monkeypatch):
+    from openshift_mcp_server import coalesce
+    now = [100.0]
+    monkeypatch.setattr(coalesce.time, 'monotonic', lambda: now[0])
+    coalescer = coalesce.Coalescer(ttl=5, maxsize=2)
+    calls = []
+    def fetch(key):
+        return lambda: calls.append(key) or key
+    assert coalescer.do('a', fetch('a')) == 'a'
+    assert coalescer.do('a', fetch('a')) == 'a'
+    coalescer.do('b', fetch('b'))
+    coalescer.do('a', fetch('a'))
+    coalescer.do('c', fetch('c'))  # evicts b, the least recently used
+    coalescer.do('b', fetch('b'))
+    now[0] += 6
+    coalescer.do('c', fetch('c'))
+    assert calls == ['a', 'b', 'c', 'b', 'c']
+
+def test_get_cluster_snapshot_counts_per_namespace(ctx):
+    from openshift_mcp_server.tools import get_cluster_snapshot
+    app = ctx.request_context.lifespan_context
+    app.k8s_api.list_namespace.return_value = _page([_obj('a'), _obj('b'), _obj('empty')])
+    app.k8s_api.list_pod_for_all_namespaces.return_value = _page([_obj('p1', 'a'), _obj('p2', 'a'), _obj('p3', 'b')])
+    app.route_api.list_cluster_custom_object.side_effect = Exception('404 Not Found')
+    result = get_cluster_snapshot(ctx, kinds='namespaces,pods,routes')
+    assert result == {
+        'totals': {'namespaces': 3, 'pods': 3},
+        'namespaces': {'a': {'pods': 2}, 'b': {'pods': 1}, 'empty': {}},
+        'errors': {'routes': '404 Not Found'},
+    }
+    assert 'error' in get_cluster_snapshot(ctx, kinds='widgets')
+
+def _watch_stream(*events):
+    data = b''.join(json.dumps(event).encode() + b'\n' for event in events)
+    return SimpleNamespace(stream=lambda amt=None, decode_content=False: iter([data]), close=lambda: None)
+
+def test_get_changes_lists_then_watches_from_cursor(ctx):
+    from kubernetes.client.rest import ApiException
+    from openshift_mcp_server.tools import get_changes
+    list_pods = ctx.request_context.lifespan_context.k8s_api.list_namespaced_pod
+    list_pods.return_value = _raw({'metadata': {'resourceVersion': '10'}, 'items': [_obj('a'), _obj('b')]})
+    first = get_changes('pods', ctx, namespace='ns')
+    assert first['items'] == ['a', 'b']
+    list_pods.side_effect = [_watch_stream(
+        {'type': 'MODIFIED', 'object': _pod('a', rv='11')},
+        {'type': 'ADDED', 'object': _pod('c', rv='12')},
+        {'type': 'DELETED', 'object': _pod('c', rv='13')},
+        {'type': 'DELETED', 'object': _pod('b', rv='14')},
+        {'type': 'BOOKMARK', 'object': {'metadata': {'resourceVersion': '15'}}},
+    )]
+    second = get_changes('pods', ctx, namespace='ns', cursor=first['cursor'])
+    assert second['changes'] == [{'type': 'MODIFIED', 'name': 'a'}, {'type': 'DELETED', 'name': 'b'}]
+    assert list_pods.call_args.kwargs['resource_version'] == '10'
+    list_pods.side_effect = [ApiException(status=410, reason='Gone'),
+                             _raw({'metadata': {'resourceVersion': '20'}, 'items': [_obj('a')]})]
+    third = get_changes('pods', ctx, namespace='ns', cursor=second['cursor'])
+    assert third['items'] == ['a'] and third['relisted']
+    assert list_pods.call_args_list[-2].kwargs['resource_version'] == '15'
+    assert 'error' in get_changes('pods', ctx, namespace='other', cursor=third['cursor'])
+    # replicasets have no summary: wide returns the object itself, without its managedFields.
+    list_replica_sets = ctx.request_context.lifespan_context.apps_api.list_namespaced_replica_set
+    replica_set = {'metadata': {'name': 'web-5d8', 'resourceVersion': '3', 'managedFields': [{'manager': 'kube'}]},
+                   'spec': {'replicas': 2}}
+    list_replica_sets.return_value = _raw({'metadata': {'resourceVersion': '3'}, 'items': [replica_set]})
+    wide = get_changes('replicasets', ctx, namespace='ns', wide=True)
+    assert wide['items'] == [{'metadata': {'name': 'web-5d8', 'resourceVersion': '3'}, 'spec': {'replicas': 2}}]
+
+def _event(name, obj, reason, type_='Warning', count=1, first='2024-01-01T00:00:00Z', last=None, message=''):
+    return {'metadata': {'name': name}, 'involvedObject': {'kind': 'Pod', 'name': obj}, 'reason': reason,
+            'type': type_, 'count': count, 'firstTimestamp': first, 'lastTimestamp': last or first,
+            'message': message}
+
+def test_aggregate_events_groups_pages_and_filters(ctx):
+    from openshift_mcp_server.tools import aggregate_events
+    list_events = ctx.request_context.lifespan_context.k8s_api.list_namespaced_event
+    list_events.side_effect = [
+        _page([_event('e1', 'web-1', 'BackOff', count=3, last='2024-01-01T00:05:00Z', message='old'),
+               _event('e2', 'web-2', 'FailedMount')], next_cursor='p2'),
+        _page([_event('e3', 'web-1', 'BackOff', count=4, first='2023-12-31T23:00:00Z',
+                      last='2024-01-01T00:10:00Z', message='latest'),
+               _event('e4', 'web-1', 'Pulled', type_='Normal', count=9)]),
+    ]
+    result = aggregate_events('ns', ctx, top=2)
+    assert result['total_groups'] == 3 and result['events'] == 4
+    assert result['groups'][0] == {
+        'object': 'Pod/web-1', 'reason': 'Pulled', 'type': 'Normal', 'count': 9, 'events': 1,
+        'first_seen': '2024-01-01T00:00:00Z', 'last_seen': '2024-01-01T00:00:00Z', 'message': ''}
+    assert result['groups'][1]['count'] == 7 and result['groups'][1]['message'] == 'latest'
+    assert result['groups'][1]['first_seen'] == '2023-12-31T23:00:00Z'
+    list_events.side_effect = None
+    list_events.return_value = _page([_event('e1', 'web-1', 'BackOff', last='2024-01-01T00:05:00Z'),
+                                      _event('e2', 'web-2', 'BackOff', last='2024-01-01T00:01:00Z')])
+    result = aggregate_events('ns', ctx, event_type='Warning', since_time='2024-01-01T00:04:00Z')
+    assert list_events.call_args.kwargs['field_selector'] == 'type=Warning'
+    assert [group['object'] for group in result['groups']] == ['Pod/web-1']
+
+def _cluster(namespaces):
+    app = MagicMock()
+    app.informers = None
+    app.graph = None
+    app.k8s_api.list_namespace.return_value = _page([_obj(name) for name in namespaces])
+    return app
+
+def test_with_cluster_runs_tool_against_named_cluster(ctx):
+    from openshift_mcp_server.clusters import ClusterPool, with_cluster
+    created = []
+    ctx.request_context.lifespan_context.clusters = ClusterPool({
+        'east': lambda: created.append('east') or _cluster(['east-ns']),
+        'west': lambda: created.append('west') or _cluster(['west-ns']),
+    })
+    ctx.request_context.lifespan_context.k8s_api.list_namespace.return_value = _page([_obj('default-ns')])
+    tool = with_cluster(list_namespaces)
+    assert tool(ctx=ctx) == ['default-ns']
+    assert tool(ctx=ctx, cluster='east') == ['east-ns']
+    assert created == ['east']
+    assert 'Unknown cluster' in tool(ctx=ctx, cluster='north')['error']
+
+def test_query_clusters_reports_timeouts_and_failures_per_cluster(ctx):
+    import threading
+    from openshift_mcp_server.clusters import ClusterPool
+    from openshift_mcp_server.tools import query_clusters
+    slow = _cluster([])
+    release = threading.Event()
+    slow.k8s_api.list_namespace.side_effect = lambda **kwargs: release.wait(2) and _page([])
+    broken = _cluster([])
+    broken.k8s_api.list_namespace.side_effect = Exception('connection refused')
+    ctx.request_context.lifespan_context.clusters = ClusterPool({
+        'east': lambda: _cluster(['a']), 'west': lambda: _cluster(['b']),
+        'slow': lambda: slow, 'broken': lambda: broken,
+    })
+    try:
+        result = query_clusters('list_namespaces', ctx, timeout_seconds=0.3)
+    finally:
+        release.set()
+    assert result['results'] == {'east': ['a'], 'west': ['b']}
+    assert result['errors']['slow'] == {'error': 'Timed out after 0.3s'}
+    assert 'connection refused' in result['errors']['broken']['details']
+    only = query_clusters('list_namespaces', ctx, clusters='east,nowhere')
+    assert only['results'] == {'east': ['a']} and 'Unknown cluster' in only['errors']['nowhere']['error']
+    assert 'error' in query_clusters('create_deployment', ctx)
+
+def test_fan_out_starts_each_cluster_timeout_when_its_call_starts(ctx):
+    import time
+    from openshift_mcp_server.clusters import ClusterPool, fan_out
+    names = ['c0', 'c1', 'c2', 'c3']
+    ctx.request_context.lifespan_context.clusters = ClusterPool({name: MagicMock for name in names})
+    def call(_):
+        time.sleep(0.6)
+        return 'ok'
+    result = fan_out(ctx, names, call, timeout=1.0, workers=2)
+    assert result == {'results': {name: 'ok' for name in names}, 'errors': {}}
+    # A call that ignores cancellation holds its worker: the cluster queued behind it is reported, not waited for.
+    stuck = fan_out(ctx, ['c0', 'c1'], call, timeout=0.2, workers=1)
+    assert stuck['errors'] == {'c0': {'error': 'Timed out after 0.2s'},
+                               'c1': {'error': 'Not started within 0.4s',
+                                      'details': 'All fan-out workers were busy with calls that did not stop'}}
+
+def _owned(name, labels=None, owner=None, **fields):
+    metadata = {'name': name, 'namespace': 'ns', 'labels': labels or {}}
+    if owner:
+        metadata['ownerReferences'] = [{'kind': owner[0], 'name': owner[1], 'controller': True}]
+    return {'metadata': metadata, **fields}
+
+def test_relationship_index_follows_informer_events():
+    from openshift_mcp_server.graph import RelationshipIndex
+    pods = Informer(RESOURCE_KINDS['pods'], MagicMock(return_value=_raw({'metadata': {'resourceVersion': '1'}, 'items': [
+        _owned('web-1', {'app': 'web'}, ('ReplicaSet', 'web-5d8')),
+        _owned('db-1', {'app': 'db'}, ('StatefulSet', 'db')),
+    ]})))
+    replicasets = Informer(RESOURCE_KINDS['replicasets'], MagicMock(return_value=_raw({
+        'metadata': {'resourceVersion': '1'}, 'items': [_owned('web-5d8', owner=('Deployment', 'web'))]})))
+    services = Informer(RESOURCE_KINDS['services'], MagicMock(return_value=_raw({
+        'metadata': {'resourceVersion': '1'}, 'items': [_owned('web', spec={'selector': {'app': 'web'}})]})))
+    informers = InformerCache([pods, replicasets, services])
+    index = RelationshipIndex.attach(informers)
+    assert not index.covers(['pods'])
+    for informer in informers.informers.values():
+        informer._relist()
+    assert index.covers(['pods', 'replicasets', 'services']) and not index.covers(['routes'])
+    assert index.owner_chain('Pod', 'ns', 'web-1') == [
+        {'kind': 'Pod', 'name': 'web-1'}, {'kind': 'ReplicaSet', 'name': 'web-5d8'}, {'kind': 'Deployment', 'name': 'web'}]
+    assert index.backing_pods('Deployment', 'ns', 'web') == {'pods': ['web-1']}
+    pods._apply('ADDED', _owned('web-2', {'app': 'web'}, ('ReplicaSet', 'web-5d8')))
+    pods._apply('MODIFIED', _owned('web-1', {'app': 'old'}, ('ReplicaSet', 'web-5d8')))
+    assert index.backing_pods('Service', 'ns', 'web') == {'pods': ['web-2']}
+    pods._apply('DELETED', _owned('web-2', {'app': 'web'}, ('ReplicaSet', 'web-5d8')))
+    assert index.backing_pods('Deployment', 'ns', 'web') == {'pods': ['web-1']}
+    assert index.backing_pods('Service', 'ns', 'web') == {'pods': []}
+    # Lower-case and plural names of controllers map to the Kind in ownerReferences.
+    from openshift_mcp_server.graph import normalize_kind
+    assert [normalize_kind(kind) for kind in ('statefulset', 'daemonsets', 'cronjob', 'deployments', 'Pod')] == [
+        'StatefulSet', 'DaemonSet', 'CronJob', 'Deployment', 'Pod']
+    assert index.backing_pods(normalize_kind('statefulsets'), 'ns', 'db') == {'pods': ['db-1']}
+    assert index.backing_pods('Deployment', 'ns', 'missing') == {'pods': [], 'found': False}
+    with pytest.raises(ValueError):
+        normalize_kind('widget')
+
+def test_get_backing_pods_of_route_from_namespace_lists(ctx):
+    from openshift_mcp_server.tools import get_backing_pods, get_owner_chain
+    app = ctx.request_context.lifespan_context
+    app.k8s_api.list_namespaced_pod.return_value = _page([
+        _owned('web-1', {'app': 'web', 'tier': 'front'}, ('ReplicaSet', 'web-5d8')),
+        _owned('web-2', {'app': 'web', 'tier': 'back'}), _owned('canary-1', {'app': 'canary'})])
+    app.k8s_api.list_namespaced_service.return_value = _page([
+        _owned('web', spec={'selector': {'app': 'web', 'tier': 'front'}}),
+        _owned('canary', spec={'selector': {'app': 'canary'}})])
+    app.route_api.list_namespaced_custom_object.return_value = _page([_owned('shop', spec={
+        'to': {'kind': 'Service', 'name': 'web'}, 'alternateBackends': [{'kind': 'Service', 'name': 'canary'}]})])
+    assert get_backing_pods('ns', 'route', 'shop', ctx) == {'pods': ['canary-1', 'web-1'], 'services': ['web', 'canary']}
+    app.apps_api.list_namespaced_replica_set.return_value = _page([_owned('web-5d8', owner=('Deployment', 'web'))])
+    app.batch_api.list_namespaced_job.return_value = _page([])
+    assert [link['kind'] for link in get_owner_chain('ns', 'pods', 'web-1', ctx)['chain']] == [
+        'Pod', 'ReplicaSet', 'Deployment']
+    assert 'error' in get_backing_pods('ns', 'widgets', 'shop', ctx)
+
+def test_security_policy_covers_all_container_lists_and_workload_kinds():
+    from openshift_mcp_server import security
+    pod_spec = {
+        'hostPID': True,
+        'initContainers': [{'name': 'setup', 'securityContext': {'privileged': True}}],
+        'containers': [{'name': 'app', 'ports': [{'containerPort': 80, 'hostPort': 80}],
+                        'securityContext': {'allowPrivilegeEscalation': True,
+                                            'capabilities': {'add': ['NET_BIND_SERVICE', 'SYS_ADMIN']}}}],
+        'ephemeralContainers': [{'name': 'debug', 'securityContext': {'runAsUser': 0}}],
+        'volumes': [{'name': 'host', 'hostPath': {'path': '/'}}, {'name': 'data', 'emptyDir': {}}],
+    }
+    cronjob = {'kind': 'CronJob', 'spec': {'jobTemplate': {'spec': {'template': {'spec': pod_spec}}}}}
+    errors = security.validate_manifest_security(cronjob)
+    assert errors == [
+        "hostPID is disallowed for security reasons.",
+        "Init container 'setup' sets privileged=true, which is disallowed.",
+        "Container 'app' sets allowPrivilegeEscalation=true, which is disallowed.",
+        "Container 'app' adds capabilities ['NET_BIND_SERVICE', 'SYS_ADMIN'], which is disallowed.",
+        "Container 'app' binds a hostPort, which is disallowed.",
+        "Ephemeral container 'debug' sets runAsUser=0, which is disallowed.",
+        "Volume 'host' uses hostPath which is disallowed.",
+    ]
+    assert security.validate_manifest_security({'kind': 'Pod', 'spec': pod_spec}) == errors
+    assert security.validate_deployment_manifest_security({'kind': 'Deployment', 'spec': {'template': {'spec': {
+        'containers': [{'name': 'app', 'securityContext': {'allowPrivilegeEscalation': False}}]}}}}) == []
+    # Verdicts are memoized by content: the traversal runs once per distinct manifest.
+    calls = []
+    original = security.check_pod_spec
+    security.check_pod_spec = lambda *args: calls.append(1) or original(*args)
+    try:
+        manifest = {'kind': 'Pod', 'spec': {'hostNetwork': True, 'containers': [{'name': 'memo-test'}]}}
+        assert security.validate_manifest_security(manifest) == security.validate_manifest_security(dict(manifest))
+    finally:
+        security.check_pod_spec = original
+    assert calls == [1]
+
+def test_compile_rules_treats_rule_values_as_data():
+    from openshift_mcp_server import security
+    hostile = "x'):\n    import os; os._exit(1)  # {"
+    rules = [
+        security.Rule('pod', (hostile,), lambda value: True, 'pod field found'),
+        security.Rule('container', ('securityContext', '"; raise SystemExit #', 'deep'), lambda value: value == 1,
+                      '{subject} matched {value}'),
+        security.Rule('volume', ('hostPath',), lambda value: True, "Volume '{name}' x'); import os #"),
+    ]
+    policy = security.compile_rules(rules)
+    pod_spec = {hostile: 'present', 'other': 1,
+                'containers': [{'name': 'app', 'securityContext': {'"; raise SystemExit #': {'deep': 1}}},
+                               {'name': 'flat', 'securityContext': {'"; raise SystemExit #': 'not a mapping'}}],
+                'volumes': [{'name': "v'x", 'hostPath': {}}]}
+    assert security.validate_manifest_security({'kind': 'Pod', 'spec': pod_spec}, policy) == [
+        'pod field found', "Container 'app' matched 1", "Volume 'v'x' x'); import os #"]
+    with pytest.raises(ValueError):
+        security.compile_rules([security.Rule('node', ('x',), bool, 'unknown scope')])
+
+def test_security_checks_pod_specs_with_non_string_keys(ctx):
+    import yaml
+    from openshift_mcp_server import security, tools
+    render = """\
+apiVersion: apps/v1
+kind: Deployment
+metadata: {name: web}
+spec:
+  template:
+    spec:
+      nodeSelector: {on: x, 1: y}
+      hostNetwork: true
+      containers: [{name: app}]
+---
+apiVersion: v1
+kind: ConfigMap
+metadata: {name: after}
+"""
+    manifest = yaml.safe_load(render.split('---')[0])
+    assert True in manifest['spec']['template']['spec']['nodeSelector']
+    # Not memoized, but checked: twice, with the same verdict.
+    for _ in range(2):
+        assert security.validate_manifest_security(manifest) == ['hostNetwork is disallowed for security reasons.']
+    result = tools.validate_manifests(ctx, yaml_text=render)
+    assert (result['documents'], result['valid'], result['invalid']) == (2, 1, 1)
+    assert result['results']['Deployment/web']['errors'] == ['hostNetwork is disallowed for security reasons.']
+
+HELM_RENDER = """# Source: shop/templates/sa.yaml
+apiVersion: v1
+kind: ServiceAccount
+metadata:
+  name: shop
+  namespace: prod
+---
+# Source: shop/templates/empty.yaml
+---
+apiVersion: apps/v1
+kind: Deployment
+metadata: {name: shop, namespace: prod, labels: {app: shop}}
+spec:
+  template:
+    spec:
+      serviceAccountName: shop
+      hostNetwork: true
+      containers: [{name: app, resources: {limits: {cpu: 1}, requests: {cpu: 1}}}]
+---
+kind: ConfigMap
+metadata: {name: [broken
+---
+apiVersion: v1
+kind: ServiceAccount
+metadata:
+  name: shop
+  namespace: prod
+"""
+
+def test_validate_manifests_yaml_stream(ctx, monkeypatch):
+    from openshift_mcp_server import tools, validation
+    result = tools.validate_manifests(ctx, manifests=[{'apiVersion': 'v1', 'kind': 'Pod', 'metadata': {'name': 'p'},
+                                                       'spec': {'containers': [{'name': 'c'}]}}],
+                                      yaml_text=HELM_RENDER)
+    assert (result['documents'], result['valid'], result['invalid'], result['with_warnings']) == (5, 3, 2, 1)
+    results = result['results']
+    assert list(results) == ['Pod/p', 'ServiceAccount/prod/shop', 'Deployment/prod/shop', '#4', 'ServiceAccount/prod/shop#5']
+    assert results['Deployment/prod/shop'] == {
+        'document': 3, 'valid': False, 'errors': ['hostNetwork is disallowed for security reasons.'],
+        'warnings': ['hostNetwork is discouraged in OpenShift unless absolutely required.']}
+    assert results['#4']['errors'][0].startswith('Invalid YAML')
+    assert tools.validate_manifests(ctx, yaml_text=HELM_RENDER, fail_fast=True, summary_only=True) == {
+        'documents': 2, 'valid': 1, 'invalid': 1, 'with_warnings': 1, 'stopped_early': True,
+        'failed': ['Deployment/prod/shop']}
+    # Large streams go through the process pool with the same results.
+    serial = tools.validate_manifests(ctx, yaml_text=HELM_RENDER)
+    monkeypatch.setattr(validation, 'OPENSHIFT_MCP_VALIDATE_PARALLEL_BYTES', 0)
+    monkeypatch.setattr(validation, 'OPENSHIFT_MCP_VALIDATE_WORKERS', 2)
+    monkeypatch.setattr(validation, 'BATCH_SIZE', 2)
+    assert tools.validate_manifests(ctx, yaml_text=HELM_RENDER) == serial
+
+MALFORMED_RENDER = """\
+apiVersion: v1
+kind: ConfigMap
+metadata: {name: before}
+---
+apiVersion: v1
+kind: ConfigMap
+metadata: broken
+---
+apiVersion: apps/v1
+kind: Deployment
+metadata: {name: web, labels: [app]}
+spec: [x]
+---
+apiVersion: apps/v1
+kind: Deployment
+metadata: {name: api}
+spec: {template: {spec: {containers: [app], volumes: {a: b}}}}
+---
+apiVersion: v1
+kind: ConfigMap
+metadata: {name: after}
+"""
+
+def test_validate_manifests_reports_malformed_documents_individually(ctx):
+    from openshift_mcp_server import tools
+    result = tools.validate_manifests(ctx, yaml_text=MALFORMED_RENDER)
+    assert (result['documents'], result['valid'], result['invalid']) == (5, 2, 3)
+    results = result['results']
+    assert results['ConfigMap/before']['valid'] and results['ConfigMap/after']['valid']
+    assert 'metadata must be a mapping.' in results['#1']['errors']
+    assert results['Deployment/web']['errors'][:2] == ['metadata.labels must be a mapping.', 'spec must be a mapping.']
+    assert results['Deployment/api']['errors'][:2] == [
+        'spec.template.spec.containers must be a list of mappings.', 'spec.template.spec.volumes must be a list of mappings.']
+    assert tools.validate_openshift_manifest({'kind': 'Deployment', 'spec': 'x'}, ctx)['errors'][0] == 'spec must be a mapping.'
+    # apply_manifests refuses the batch with the per-document errors instead of failing on them.
+    applied = tools.apply_manifests(ctx, yaml_text=MALFORMED_RENDER)
+    assert applied['error'] == 'Validation failed; nothing was applied'
+    assert '#1: metadata must be a mapping.' in applied['details']
+
+def test_apply_manifests_server_side_applies_with_discovery(ctx):
+    from openshift_mcp_server import tools
+    from openshift_mcp_server.apply import Discovery
+    app = ctx.request_context.lifespan_context
+    requests = []
+
+    def call_api(path, method, query_params=None, header_params=None, body=None, **kwargs):
+        requests.append((method, path, dict(query_params or []), (header_params or {}).get('Content-Type')))
+        if path == '/api/v1':
+            resources = [{'name': 'namespaces', 'kind': 'Namespace', 'namespaced': False},
+                         {'name': 'configmaps', 'kind': 'ConfigMap', 'namespaced': True},
+                         {'name': 'pods/log', 'kind': 'Pod', 'namespaced': True}]
+        elif path == '/apis/apps/v1':
+            resources = [{'name': 'deployments', 'kind': 'Deployment', 'namespaced': True}]
+        else:
+            created = body['metadata']['name'] != 'settings'
+            return SimpleNamespace(status=201 if created else 200, data=json.dumps(
+                {**body, 'metadata': {**body['metadata'], 'resourceVersion': '7'}}).encode())
+        return SimpleNamespace(status=200, data=json.dumps({'resources': resources}).encode())
+
+    app.api_client.call_api.side_effect = call_api
+    app.discovery = Discovery(app.api_client)
+    deployment = {'apiVersion': 'apps/v1', 'kind': 'Deployment', 'metadata': {'name': 'web', 'namespace': 'shop'},
+                  'spec': {'template': {'spec': {'containers': [{'name': 'app'}]}}}}
+    render = ("apiVersion: v1\nkind: ConfigMap\nmetadata: {name: settings}\n---\n"
+              "apiVersion: v1\nkind: Namespace\nmetadata: {name: staging}\n")
+    result = tools.apply_manifests(ctx, manifests=[deployment], yaml_text=render, namespace='staging', dry_run=True)
+    assert result == {'dry_run': True, 'applied': 3, 'failed': 0, 'results': {
+        'Deployment/shop/web': {'result': 'created', 'resource_version': '7'},
+        'ConfigMap/settings': {'result': 'configured', 'resource_version': '7'},
+        'Namespace/staging': {'result': 'created', 'resource_version': '7'}}}
+    patches = [request for request in requests if request[0] == 'PATCH']
+    # The namespace goes first; every object is applied once, as a dry run, by the server's field manager.
+    assert patches[0][1] == '/api/v1/namespaces/staging'
+    assert sorted(path for _, path, _, _ in patches[1:]) == [
+        '/api/v1/namespaces/staging/configmaps/settings', '/apis/apps/v1/namespaces/shop/deployments/web']
+    assert all(query == {'fieldManager': 'openshift-mcp-server', 'dryRun': 'All'} and
+               content_type == 'application/apply-patch+yaml' for _, _, query, content_type in patches)
+    assert sorted(path for method, path, _, _ in requests if method == 'GET') == ['/api/v1', '/apis/apps/v1']
+    # One failing security check and nothing is applied.
+    requests.clear()
+    privileged = {**deployment, 'spec': {'template': {'spec': {'containers': [
+        {'name': 'app', 'securityContext': {'privileged': True}}]}}}}
+    result = tools.apply_manifests(ctx, manifests=[privileged], yaml_text=render)
+    assert result['error'] == 'Validation failed; nothing was applied'
+    assert "Deployment/shop/web: Container 'app' sets privileged=true" in result['details']
+    assert requests == []
+    # generateName passes validation but cannot be applied: rejected per document instead of failing on a KeyError.
+    generated = {'apiVersion': 'v1', 'kind': 'ConfigMap', 'metadata': {'generateName': 'settings-'}}
+    result = tools.apply_manifests(ctx, manifests=[generated], yaml_text=render)
+    assert result == {'error': 'Validation failed; nothing was applied', 'details': (
+        'ConfigMap/settings-: metadata.name is required to apply; generateName is not supported by server-side apply.')}
+    assert requests == []
+
+def test_resilience_retries_reads_and_opens_circuit(monkeypatch):
+    from kubernetes.client.rest import ApiException
+    from openshift_mcp_server import metrics, resilience
+    from openshift_mcp_server.errors import CircuitOpenError
+    from openshift_mcp_server.ratelimit import RateLimiter, parse_rate_limits
+
+    def rejected(status, retry_after=None):
+        e = ApiException(status=status, reason='rejected')
+        e.headers = {'Retry-After': retry_after} if retry_after else {}
+        return e
+
+    outcomes = []
+    sent = []
+
+    def call_api(path, method, *args, **kwargs):
+        sent.append(method)
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    delays = []
+    monkeypatch.setattr(resilience, 'sleep', delays.append)
+    assert parse_rate_limits('get=100:200, *=5') == {'GET': (100.0, 200), '*': (5.0, 5)}
+    api_client = SimpleNamespace(call_api=call_api)
+    breaker = resilience.CircuitBreaker('https://api.test:6443', threshold=2, cooldown=60)
+    resilience.apply_resilience(api_client, RateLimiter({}), breaker, retries=3, retry_base=0.2, retry_max_wait=10)
+    retries = metrics.KUBE_RETRIES.value('GET', '429')
+    # APF rejections of reads are retried after Retry-After; they do not count against the apiserver's health.
+    outcomes[:] = [rejected(429, '2'), rejected(429, '1'), 'pods']
+    assert api_client.call_api('/api/v1/pods', 'GET') == 'pods'
+    assert delays == [2.0, 1.0] and metrics.KUBE_RETRIES.value('GET', '429') == retries + 2
+    assert breaker.state == 'closed'
+    # Writes are never retried, and a Retry-After beyond the maximum wait is not waited for.
+    outcomes[:] = [rejected(503)]
+    with pytest.raises(ApiException):
+        api_client.call_api('/api/v1/namespaces/ns/pods', 'POST')
+    outcomes[:] = [rejected(429, '60')]
+    with pytest.raises(ApiException):
+        api_client.call_api('/api/v1/pods', 'GET')
+    # Two server failures in a row open the circuit: requests fail fast until the cooldown ends.
+    outcomes[:] = [rejected(503)] * 4
+    with pytest.raises(ApiException):
+        api_client.call_api('/api/v1/pods', 'GET')
+    assert breaker.state == 'open' and len(outcomes) == 2
+    sent.clear()
+    with pytest.raises(CircuitOpenError):
+        api_client.call_api('/api/v1/pods', 'GET')
+    assert sent == []
+    # After the cooldown one probe goes through and closes the circuit when it succeeds.
+    breaker.cooldown = 0
+    outcomes[:] = ['pods']
+    assert api_client.call_api('/api/v1/pods', 'GET') == 'pods'
+    assert breaker.state == 'closed'
+
+def _open_watch(*events):
+    """A watch response that sends events, then stays open until closed."""
+    import threading
+    closed = threading.Event()
+    data = b''.join(json.dumps(event).encode() + b'\n' for event in events)
+
+    def stream(amt=None, decode_content=False):
+        yield data
+        closed.wait(5)
+    return SimpleNamespace(stream=stream, close=closed.set)
+
+def _deployment(generation=1, observed=0, updated=0, available=0, replicas=0, revision='2', rv='5', conditions=()):
+    return {'metadata': {'name': 'web', 'namespace': 'ns', 'generation': generation, 'resourceVersion': rv,
+                         'annotations': {'deployment.kubernetes.io/revision': revision}},
+            'spec': {'replicas': 2, 'selector': {'matchLabels': {'app': 'web'}}},
+            'status': {'observedGeneration': observed, 'updatedReplicas': updated, 'availableReplicas': available,
+                       'replicas': replicas, 'conditions': list(conditions)}}
+
+def _rollout_pod(name, replica_set, reason=None):
+    status = {'containerStatuses': [{'name': 'app', 'restartCount': 3, 'state': {'waiting': {'reason': reason}}}]}
+    return {'metadata': {'name': name, 'namespace': 'ns', 'resourceVersion': '7',
+                         'ownerReferences': [{'kind': 'ReplicaSet', 'name': replica_set, 'controller': True}]},
+            'status': status if reason else {}}
+
+def test_wait_for_rollout_follows_watches(ctx):
+    from openshift_mcp_server.rollout import RolloutWatch
+    from openshift_mcp_server.tools import wait_for_rollout
+    apps_api = ctx.request_context.lifespan_context.apps_api
+    k8s_api = ctx.request_context.lifespan_context.k8s_api
+    apps_api.read_namespaced_deployment.return_value = _raw(_deployment())
+    apps_api.read_namespaced_replica_set.side_effect = lambda name, namespace, **kwargs: _raw(
+        {'metadata': {'name': name, 'annotations': {'deployment.kubernetes.io/revision': name[-1]}}})
+
+    def watched(deployment_events, pod_events, pods=()):
+        apps_api.list_namespaced_deployment.side_effect = lambda *args, **kwargs: _open_watch(*deployment_events)
+        k8s_api.list_namespaced_pod.side_effect = lambda *args, **kwargs: (
+            _open_watch(*pod_events) if kwargs.get('watch')
+            else _raw({'metadata': {'resourceVersion': '6'}, 'items': list(pods)}))
+
+    # Complete once the deployment's status catches up; the watches start from the read's resourceVersions.
+    watched([{'type': 'MODIFIED', 'object': _deployment(observed=1, updated=1, replicas=1, rv='8')},
+             {'type': 'MODIFIED', 'object': _deployment(observed=1, updated=2, available=2, replicas=2, rv='9')}], [])
+    result = wait_for_rollout('ns', 'web', ctx, timeout_seconds=10)
+    assert result['status'] == 'complete'
+    assert result['replicas'] == {'desired': 2, 'updated': 2, 'ready': 0, 'available': 2, 'unavailable': 0}
+    watch_kwargs = apps_api.list_namespaced_deployment.call_args.kwargs
+    assert watch_kwargs['field_selector'] == 'metadata.name=web' and watch_kwargs['resource_version'] == '5'
+    assert k8s_api.list_namespaced_pod.call_args.kwargs['label_selector'] == 'app=web'
+    assert k8s_api.list_namespaced_pod.call_args.kwargs['resource_version'] == '6'
+    # A crash-looping pod of the new revision fails the rollout; one of the old revision does not.
+    watched([], [{'type': 'MODIFIED', 'object': _rollout_pod('web-2-a', 'web-2', 'CrashLoopBackOff')}],
+            pods=[_rollout_pod('web-1-a', 'web-1', 'ImagePullBackOff'), _rollout_pod('web-2-a', 'web-2')])
+    progress = []
+    result = RolloutWatch(apps_api, k8s_api, 'ns', 'web').wait(10, progress.append)
+    assert result['status'] == 'failed' and 'CrashLoopBackOff' in result['message']
+    assert [(pod['pod'], pod['reason']) for pod in result['failing_pods']] == [('web-2-a', 'CrashLoopBackOff')]
+    assert progress[0] == 'Waiting for deployment spec update to be observed'
+    assert progress[-1].endswith('(web-2-a: CrashLoopBackOff)')
+    # ProgressDeadlineExceeded fails it, and without any change it times out.
+    deadline = {'type': 'Progressing', 'status': 'False', 'reason': 'ProgressDeadlineExceeded'}
+    watched([{'type': 'MODIFIED', 'object': _deployment(observed=1, conditions=[deadline])}], [])
+    assert wait_for_rollout('ns', 'web', ctx, timeout_seconds=10)['status'] == 'failed'
+    watched([], [])
+    result = RolloutWatch(apps_api, k8s_api, 'ns', 'web').wait(0.2)
+    assert result['status'] == 'timeout' and result['message'].startswith('Timed out after 0.2s')
+
+def test_resilience_does_not_retry_read_timeouts_against_silent_server(monkeypatch):
+    import socket
+    import threading
+    import time
+    from kubernetes import client
+    from urllib3.exceptions import ReadTimeoutError
+    from openshift_mcp_server import connection, resilience
+    # A server that accepts connections and never answers.
+    listener = socket.socket()
+    listener.bind(('127.0.0.1', 0))
+    listener.listen(16)
+    accepted = []
+
+    def accept():
+        while True:
+            try:
+                accepted.append(listener.accept()[0])
+            except OSError:
+                return
+    threading.Thread(target=accept, daemon=True).start()
+    monkeypatch.setattr(connection, 'OPENSHIFT_MCP_READ_TIMEOUT', 0.3)
+    monkeypatch.setattr(resilience, 'sleep', lambda seconds: pytest.fail('retried a timed out request'))
+    configuration = client.Configuration()
+    configuration.host = f'http://127.0.0.1:{listener.getsockname()[1]}'
+    api_client = connection.create_api_client(configuration, rate_limits='')
+    try:
+        # Neither urllib3 nor the resilience layer sends the read or the write again.
+        for method in ('GET', 'PATCH'):
+            start = time.monotonic()
+            with pytest.raises(ReadTimeoutError):
+                api_client.call_api('/api/v1/namespaces/ns/pods/p', method, auth_settings=[],
+                                    _return_http_data_only=True, _preload_content=False)
+            assert time.monotonic() - start < 1.5
+        assert len(accepted) <= 2
+    finally:
+        listener.close()
+        api_client.close()
+        for conn in accepted:
+            conn.close()